@@ -0,0 +1,113 @@
+"""
+Benchmark: database size and insert rate with interned agent ids.
+
+Writes the same workload — UUID agent ids, one upsert plus one history row
+per save, in transactions of --batch saves — to the previous schema (TEXT
+ids on every row and in every index, reproduced here for reference) and to
+RelationalStorage's interned schema, then compares file size and saves/s.
+
+    python benchmarks/bench_agent_interning.py [--saves 200000] [--pairs 2000]
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+
+from rlp_0 import RelationalState, RelationalStorage
+
+
+# ── Previous schema ───────────────────────────────────────────────────────────
+
+_LEGACY_SCHEMA = """
+CREATE TABLE relationships (
+    from_id TEXT NOT NULL, to_id TEXT NOT NULL,
+    trust REAL NOT NULL, intent REAL NOT NULL, narrative REAL NOT NULL,
+    commitments REAL NOT NULL, rupture_risk REAL NOT NULL, is_gated INTEGER NOT NULL,
+    last_updated TEXT NOT NULL,
+    PRIMARY KEY (from_id, to_id)
+);
+CREATE TABLE state_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, from_id TEXT NOT NULL, to_id TEXT NOT NULL,
+    recorded_at TEXT NOT NULL, trust REAL NOT NULL, intent REAL NOT NULL,
+    narrative REAL NOT NULL, commitments REAL NOT NULL, rupture_risk REAL NOT NULL,
+    is_gated INTEGER NOT NULL, change_type TEXT NOT NULL, notes TEXT
+);
+CREATE INDEX idx_history_pair ON state_history (from_id, to_id, recorded_at);
+CREATE INDEX idx_relationships_risk ON relationships (from_id, rupture_risk DESC);
+CREATE INDEX idx_relationships_global_risk ON relationships (rupture_risk DESC);
+"""
+
+_LEGACY_UPSERT = """
+INSERT INTO relationships VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (from_id, to_id) DO UPDATE SET
+    trust = excluded.trust, intent = excluded.intent, narrative = excluded.narrative,
+    commitments = excluded.commitments, rupture_risk = excluded.rupture_risk,
+    is_gated = excluded.is_gated, last_updated = excluded.last_updated
+"""
+
+_LEGACY_HISTORY = """
+INSERT INTO state_history (from_id, to_id, recorded_at, trust, intent, narrative,
+    commitments, rupture_risk, is_gated, change_type, notes)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _legacy(path: str, batches) -> float:
+    conn = sqlite3.connect(path)
+    conn.executescript(_LEGACY_SCHEMA)
+    start = time.perf_counter()
+    for items in batches:
+        now = datetime.now(timezone.utc).isoformat()
+        rels, hists = [], []
+        for from_id, to_id, s, _ in items:
+            prims = (s.trust, s.intent, s.narrative, s.commitments, s.rupture_risk, int(s.is_gated))
+            rels.append((from_id, to_id) + prims + (now,))
+            hists.append((from_id, to_id, now) + prims + ("update", None))
+        conn.executemany(_LEGACY_UPSERT, rels)
+        conn.executemany(_LEGACY_HISTORY, hists)
+        conn.commit()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+
+def _interned(path: str, batches) -> float:
+    storage = RelationalStorage(path)
+    start = time.perf_counter()
+    for items in batches:
+        storage.save_many(items)
+    elapsed = time.perf_counter() - start
+    storage.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--saves", type=int, default=200_000)
+    parser.add_argument("--pairs", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+
+    me = str(uuid.uuid4())
+    others = [str(uuid.uuid4()) for _ in range(args.pairs)]
+    state = RelationalState(trust=0.8, intent=0.7, narrative=0.9, commitments=0.6)
+    items = [(me, others[i % args.pairs], state, ["update"]) for i in range(args.saves)]
+    batches = [items[i:i + args.batch] for i in range(0, len(items), args.batch)]
+
+    print(f"{args.saves:,} saves over {args.pairs:,} pairs, {args.batch} per transaction")
+    print(f"{'schema':<10} {'file size':>12} {'bytes/save':>11} {'saves/s':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, run in (("text ids", _legacy), ("interned", _interned)):
+            path = os.path.join(tmp, f"{name.replace(' ', '_')}.db")
+            elapsed = run(path, batches)
+            size = os.path.getsize(path)
+            print(f"{name:<10} {size / 2**20:>9.1f} MiB {size / args.saves:>11.0f} "
+                  f"{args.saves / elapsed:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: object model vs struct-of-arrays engine.
+
+Reports memory per relationship and update throughput for
+  - the engines alone (RLP0 objects vs ArrayStateStore), and
+  - RLP0Manager.update_many() with backend="object" vs backend="array".
+
+    python benchmarks/bench_array_backend.py [--pairs 100000] [--batch 10000]
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from rlp_0 import RLP0, RLP0Manager
+from rlp_0.arrays import ArrayStateStore
+
+
+def _memory_per_pair(build, pairs: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    keep = build(pairs)
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del keep
+    return used / pairs
+
+
+def _build_objects(pairs: int):
+    return {f"peer-{i}": RLP0() for i in range(pairs)}
+
+
+def _build_arrays(pairs: int):
+    store = ArrayStateStore(capacity=pairs)
+    for i in range(pairs):
+        store.add(f"peer-{i}")
+    return store
+
+
+def _updates(pairs: int, count: int):
+    rng = random.Random(0)
+    return [
+        (f"peer-{rng.randrange(pairs)}", {"trust": rng.random(), "intent": rng.random()})
+        for _ in range(count)
+    ]
+
+
+def _engine_rate(pairs: int, updates) -> tuple:
+    objects = _build_objects(pairs)
+    start = time.perf_counter()
+    for key, prims in updates:
+        objects[key].update_state(**prims)
+    object_rate = len(updates) / (time.perf_counter() - start)
+
+    store = _build_arrays(pairs)
+    rows = [store.pairs[key].row for key, _ in updates]
+    start = time.perf_counter()
+    store.apply_batch(rows, [p for _, p in updates])
+    array_rate = len(updates) / (time.perf_counter() - start)
+    return object_rate, array_rate
+
+
+def _manager_rate(backend: str, pairs: int, updates, batch: int) -> float:
+    mgr = RLP0Manager(agent_id="agent-a", backend=backend)
+    mgr.update_many((f"peer-{i}", {"trust": 1.0}) for i in range(pairs))
+    start = time.perf_counter()
+    for i in range(0, len(updates), batch):
+        mgr.update_many(updates[i:i + batch])
+    rate = len(updates) / (time.perf_counter() - start)
+    mgr.close()
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    args = parser.parse_args()
+
+    obj_mem = _memory_per_pair(_build_objects, args.pairs)
+    arr_mem = _memory_per_pair(_build_arrays, args.pairs)
+    updates = _updates(args.pairs, args.pairs)
+    obj_rate, arr_rate = _engine_rate(args.pairs, updates)
+    mgr_obj = _manager_rate("object", args.pairs, updates, args.batch)
+    mgr_arr = _manager_rate("array", args.pairs, updates, args.batch)
+
+    print(f"{args.pairs:,} pairs, {len(updates):,} updates")
+    print(f"{'':<28} {'object':>12} {'array':>12}")
+    print(f"{'bytes per pair':<28} {obj_mem:>12,.0f} {arr_mem:>12,.0f}")
+    print(f"{'engine updates/sec':<28} {obj_rate:>12,.0f} {arr_rate:>12,.0f}")
+    print(f"{'update_many updates/sec':<28} {mgr_obj:>12,.0f} {mgr_arr:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
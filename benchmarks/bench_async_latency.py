@@ -0,0 +1,100 @@
+"""
+Benchmark: event-loop latency of RLP0Manager vs AsyncRLP0Manager under load.
+
+A producer issues updates at a fixed rate while a probe task sleeps for 1 ms
+in a loop and records how late it wakes up. With RLP0Manager every commit
+runs on the loop; AsyncRLP0Manager commits on its writer thread, batching
+the updates of each loop iteration into one transaction.
+
+Runs against a file-backed database so every commit pays for its fsync.
+
+    python benchmarks/bench_async_latency.py [--rate 10000] [--seconds 3]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from rlp_0 import AsyncRLP0Manager, RLP0Manager
+
+_TICK = 0.001
+
+
+async def _probe(lags: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(_TICK)
+        lags.append(time.perf_counter() - start - _TICK)
+
+
+async def _drive(update, rate: int, seconds: float) -> tuple:
+    lags: list = []
+    stop = asyncio.Event()
+    probe = asyncio.ensure_future(_probe(lags, stop))
+    inflight = set()
+    done = 0
+    start = time.perf_counter()
+    while True:
+        now = time.perf_counter() - start
+        if now >= seconds:
+            break
+        # Issue whatever the schedule owes, so a slow loop cannot lower the offered rate
+        owed = int(now * rate) - done
+        for i in range(owed):
+            task = asyncio.ensure_future(update(f"agent-{(done + i) % 1000}", trust=0.8))
+            inflight.add(task)
+            task.add_done_callback(inflight.discard)
+        done += max(owed, 0)
+        await asyncio.sleep(_TICK)
+    if inflight:
+        await asyncio.gather(*inflight)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    return done / elapsed, lags
+
+
+def _report(name: str, throughput: float, lags: list) -> None:
+    lags = sorted(lags)
+    p50 = statistics.median(lags) * 1000
+    p99 = lags[int(len(lags) * 0.99)] * 1000
+    print(f"{name:<18} {throughput:>10,.0f}/s   p50 {p50:7.2f} ms   "
+          f"p99 {p99:7.2f} ms   max {lags[-1] * 1000:7.2f} ms")
+
+
+async def _sync_run(path: str, rate: int, seconds: float) -> None:
+    mgr = RLP0Manager("agent-a", db_path=path)
+
+    async def update(other_id, **primitives):
+        return mgr.update(other_id, **primitives)
+
+    throughput, lags = await _drive(update, rate, seconds)
+    mgr.close()
+    _report("RLP0Manager", throughput, lags)
+
+
+async def _async_run(path: str, rate: int, seconds: float) -> None:
+    mgr = AsyncRLP0Manager("agent-a", db_path=path)
+    throughput, lags = await _drive(mgr.update, rate, seconds)
+    batches = mgr.batches_written
+    await mgr.close()
+    _report("AsyncRLP0Manager", throughput, lags)
+    print(f"{'':<18} {batches:,} transactions")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rate", type=int, default=10000, help="target updates per second")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_sync_run(os.path.join(tmp, "sync.db"), args.rate, args.seconds))
+        asyncio.run(_async_run(os.path.join(tmp, "async.db"), args.rate, args.seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark: memory and allocation cost of RelationalState / Signal / GateEvent.
+
+Compares the slotted records (timestamps as epoch nanoseconds) with the
+previous dataclass layout (per-instance __dict__ plus a datetime each),
+reproduced here for reference.
+
+    python benchmarks/bench_compact_records.py [--updates 1000000]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+
+from rlp_0 import RLP0, RelationalState, Signal, RUPTURE_DETECTED
+from rlp_0.gates import GateEvent
+
+
+# ── Previous layout ───────────────────────────────────────────────────────────
+
+@dataclass
+class _LegacyState:
+    trust: float = 1.0
+    intent: float = 1.0
+    narrative: float = 1.0
+    commitments: float = 1.0
+    rupture_risk: float = 0.0
+    last_updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    is_gated: bool = False
+
+    def __post_init__(self):
+        for primitive in ['trust', 'intent', 'narrative', 'commitments']:
+            value = getattr(self, primitive)
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(primitive)
+
+    def update(self, **kwargs) -> "_LegacyState":
+        return _LegacyState(
+            trust=kwargs.get('trust', self.trust),
+            intent=kwargs.get('intent', self.intent),
+            narrative=kwargs.get('narrative', self.narrative),
+            commitments=kwargs.get('commitments', self.commitments),
+            rupture_risk=self.rupture_risk,
+            is_gated=self.is_gated,
+        )
+
+
+@dataclass
+class _LegacySignal:
+    signal_type: object
+    timestamp: datetime
+    rupture_risk: float
+    context: Optional[str] = None
+
+
+@dataclass
+class _LegacyGateEvent:
+    action: str
+    timestamp: datetime
+    reason: Optional[str] = None
+    rupture_risk_at_event: float = 0.0
+
+
+# ── Measurements ──────────────────────────────────────────────────────────────
+
+def _retained(make, n: int) -> float:
+    """Bytes held per live object when n of them are kept."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [make() for _ in range(n)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current / n
+
+
+def _update_churn(state, n: int) -> float:
+    """Seconds per state.update() call (one new state per call)."""
+    start = time.perf_counter()
+    for i in range(n):
+        state = state.update(trust=(i % 100) / 100)
+    return (time.perf_counter() - start) / n
+
+
+def _end_to_end(n: int) -> tuple:
+    """RLP0.update_state throughput and peak traced memory over n updates."""
+    rlp = RLP0(rupture_threshold=0.9, signal_capacity=1000)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(n):
+        rlp.update_state(trust=0.05 if i % 1000 == 0 else 0.9)
+        if rlp.is_gated:
+            rlp.update_state(trust=1.0)
+            rlp.acknowledge_repair()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return n / elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--updates", type=int, default=1_000_000)
+    args = parser.parse_args()
+    n = args.updates
+    now = datetime.now(timezone.utc)
+
+    print(f"retained bytes per object ({n:,} live)")
+    rows = [
+        ("RelationalState", lambda: _LegacyState(), lambda: RelationalState()),
+        ("Signal",
+         lambda: _LegacySignal(RUPTURE_DETECTED, datetime.now(timezone.utc), 0.7),
+         lambda: Signal.now(RUPTURE_DETECTED, 0.7)),
+        ("GateEvent",
+         lambda: _LegacyGateEvent("closed", datetime.now(timezone.utc), "r", 0.7),
+         lambda: GateEvent.now("closed", "r", 0.7)),
+    ]
+    print(f"  {'type':<16} {'dataclass':>10} {'slotted':>10}   getsizeof")
+    for name, legacy, compact in rows:
+        old = _retained(legacy, n)
+        new = _retained(compact, n)
+        print(f"  {name:<16} {old:>9.0f}B {new:>9.0f}B   "
+              f"{sys.getsizeof(legacy()) + sys.getsizeof(legacy().__dict__)}B"
+              f" -> {sys.getsizeof(compact())}B")
+
+    print(f"\nstate.update() — one allocation per call ({n:,} calls)")
+    old = _update_churn(_LegacyState(), n)
+    new = _update_churn(RelationalState(last_updated=now), n)
+    print(f"  dataclass {old * 1e9:7.0f} ns/call   slotted {new * 1e9:7.0f} ns/call")
+
+    rate, peak = _end_to_end(n)
+    print(f"\nRLP0.update_state: {rate:,.0f} updates/s, peak traced memory "
+          f"{peak / 1024:,.0f} KiB over {n:,} updates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: cost of lazy time decay on reads, and of a decay sweep.
+
+read    RLP0Manager.rupture_risk() with and without a TimeDecay policy
+sweep   sweep_decay() over a fleet where only --quiet of the pairs have been
+        idle long enough to be candidates, against scanning every pair
+
+    python benchmarks/bench_decay_sweep.py [--pairs 100000] [--quiet 0.01]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from rlp_0 import RLP0Manager, TimeDecay
+from rlp_0.clock import now_ns
+
+DAY = 86400
+
+
+def _fleet(db: str, pairs: int, quiet: float, decay) -> RLP0Manager:
+    """Write the fleet, age a fraction of it in storage, reopen lazily."""
+    mgr = RLP0Manager("agent-a", rupture_threshold=0.4, db_path=db)
+    mgr.update_many((f"agent-{i}", {"trust": 0.5, "commitments": 0.6}) for i in range(pairs))
+    old = mgr._storage._stamp(now_ns() - 3 * DAY * 10**9)
+    quiet_ids = ["agent-a"] + [f"agent-{i}" for i in range(int(pairs * quiet))]
+    keys = mgr._storage._keys(quiet_ids)
+    mgr._storage._conn.executemany(
+        "UPDATE relationships SET last_updated = ? WHERE from_id = ? AND to_id = ?",
+        [(old, keys["agent-a"], keys[name]) for name in quiet_ids[1:]],
+    )
+    mgr._storage._conn.commit()
+    mgr.close()
+    return RLP0Manager("agent-a", rupture_threshold=0.4, db_path=db, lazy=True, decay=decay)
+
+
+def _reads(mgr: RLP0Manager, n: int) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        mgr.rupture_risk(f"agent-{i % 1000}")
+    return (time.perf_counter() - start) / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=100_000)
+    parser.add_argument("--quiet", type=float, default=0.01)
+    parser.add_argument("--reads", type=int, default=100_000)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    plain = _fleet(os.path.join(tmp, "plain.db"), 1000, 0.0, None)
+    decayed = _fleet(os.path.join(tmp, "decayed.db"), 1000, 0.0, TimeDecay(half_life=DAY))
+    base, lazy = _reads(plain, args.reads), _reads(decayed, args.reads)
+    print(f"rupture_risk()   no decay {base * 1e6:6.2f} us   decay {lazy * 1e6:6.2f} us")
+
+    mgr = _fleet(os.path.join(tmp, "fleet.db"), args.pairs, args.quiet,
+                 TimeDecay(half_life=DAY, baseline=0.0))
+    decay = mgr.decay
+
+    start = time.perf_counter()
+    full = [
+        to for to, state in mgr._storage.iter_states("agent-a")
+        if not state.is_gated and mgr._decayed(state).rupture_risk >= 0.4
+    ]
+    scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = mgr.sweep_decay(materialize=False)
+    sweep = time.perf_counter() - start
+    assert sorted(found) == sorted(full), (len(found), len(full))
+
+    print(f"find crossed ({len(found):,} of {args.pairs:,}, {decay!r})")
+    print(f"  full scan        {scan * 1000:8.1f} ms")
+    print(f"  sweep_decay()    {sweep * 1000:8.1f} ms   ({scan / sweep:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: FleetIndex.set() cost as the fleet grows.
+
+flat      the previous index: one sorted Python list, where every insert
+          and delete moves on average half of it (O(n))
+bucketed  the current index: sorted buckets of 1-2 thousand entries
+          (O(log n + bucket size))
+
+Each update moves one random relationship to a new random risk, as a
+committed manager call does.
+
+    python benchmarks/bench_fleet_index.py [--sizes 100000,1000000] [--updates 20000]
+"""
+
+import argparse
+import random
+import time
+from bisect import bisect_left, insort
+
+from rlp_0.fleet import FleetIndex
+
+
+class _FlatIndex(FleetIndex):
+    """FleetIndex maintenance on one flat sorted list, as before."""
+
+    def __init__(self, threshold: float) -> None:
+        super().__init__(threshold)
+        self._flat = []
+
+    def set(self, key, rupture_risk, is_gated):
+        old = self._entries.get(key)
+        if old == (rupture_risk, is_gated):
+            return
+        if old is not None:
+            del self._flat[bisect_left(self._flat, (old[0], key))]
+        self._entries[key] = (rupture_risk, is_gated)
+        insort(self._flat, (rupture_risk, key))
+
+
+def _fill(index: FleetIndex, n: int, rng: random.Random) -> list:
+    keys = [f"agent-{i}" for i in range(n)]
+    for key in keys:
+        index.set(key, rng.random(), False)
+    return keys
+
+
+def _updates(index: FleetIndex, keys: list, updates: int, rng: random.Random) -> float:
+    moves = [(rng.choice(keys), rng.random()) for _ in range(updates)]
+    start = time.perf_counter()
+    for key, risk in moves:
+        index.set(key, risk, False)
+    return updates / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="100000,1000000")
+    parser.add_argument("--updates", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'pairs':>10} {'flat':>14} {'bucketed':>14}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        rates = []
+        for cls in (_FlatIndex, FleetIndex):
+            rng = random.Random(0)
+            index = cls(threshold=0.6)
+            keys = _fill(index, n, rng)
+            rates.append(_updates(index, keys, args.updates, rng))
+        flat, bucketed = rates
+        print(f"{n:>10,} {flat:>10,.0f} /s {bucketed:>10,.0f} /s   ({bucketed / flat:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: per-call commit vs group commit in RelationalStorage.save().
+
+Runs against a file-backed database so every commit pays for its fsync.
+
+    python benchmarks/bench_group_commit.py [--saves 4000] [--threads 64]
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from rlp_0 import RelationalState, RelationalStorage
+
+
+def _per_call(path: str, saves: int) -> float:
+    storage = RelationalStorage(path)
+    state = RelationalState(trust=0.8)
+    start = time.perf_counter()
+    for i in range(saves):
+        storage.save("agent-a", f"agent-{i % 100}", state)
+    elapsed = time.perf_counter() - start
+    storage.close()
+    return saves / elapsed
+
+
+def _group_fire_and_forget(path: str, saves: int) -> float:
+    storage = RelationalStorage(path, group_commit=True)
+    state = RelationalState(trust=0.8)
+    start = time.perf_counter()
+    for i in range(saves):
+        storage.save("agent-a", f"agent-{i % 100}", state)
+    storage.flush()
+    elapsed = time.perf_counter() - start
+    storage.close()
+    return saves / elapsed
+
+
+def _group_durable(path: str, saves: int, threads: int) -> float:
+    """Each worker waits on its durability future before the next save."""
+    storage = RelationalStorage(path, group_commit=True)
+    state = RelationalState(trust=0.8)
+    per_thread = saves // threads
+
+    def worker(n: int) -> None:
+        for i in range(per_thread):
+            storage.save(f"agent-{n}", f"agent-{i % 100}", state).result()
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    storage.close()
+    return per_thread * threads / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--saves", type=int, default=4000)
+    parser.add_argument("--threads", type=int, default=64)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = [
+            ("per-call commit", _per_call(os.path.join(tmp, "a.db"), args.saves)),
+            ("group commit (fire and forget)",
+             _group_fire_and_forget(os.path.join(tmp, "b.db"), args.saves)),
+            (f"group commit ({args.threads} threads, durable)",
+             _group_durable(os.path.join(tmp, "c.db"), args.saves, args.threads)),
+        ]
+
+    print(f"{'mode':<40} {'saves/sec':>12}")
+    for name, rate in rows:
+        print(f"{name:<40} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark: cost of reading one page deep into a pair's history.
+
+offset   history-style query paged with LIMIT/OFFSET: SQLite steps over
+         every skipped row, so a page costs more the further back it is
+keyset   iter_history(before_id=...): resumes just past the previous
+         page's last (recorded_at, id) on idx_history_pair
+
+    python benchmarks/bench_history_paging.py [--rows 200000] [--page 100]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from itertools import islice
+
+from rlp_0 import RelationalState, RelationalStorage
+from rlp_0.storage import _time_iso
+
+_OFFSET_PAGE = """
+SELECT id, recorded_at, trust, intent, narrative, commitments,
+       rupture_risk, is_gated, change_type, notes
+FROM state_history
+WHERE from_id = ? AND to_id = ?
+ORDER BY recorded_at DESC, id DESC
+LIMIT ? OFFSET ?
+"""
+
+
+def _fill(storage: RelationalStorage, rows: int) -> None:
+    state = RelationalState(trust=0.8, intent=0.7, narrative=0.9, commitments=0.6)
+    for start in range(0, rows, 1000):
+        # one upsert, one history row per change type
+        storage.save_many([("me", "peer", state, ["update"] * min(1000, rows - start))])
+        # another counterpart interleaved, so the pair is not the whole table
+        storage.save("me", "other", state)
+    # Rows of one save_many() share a timestamp; spread them as separate saves would be
+    storage._conn.execute("UPDATE state_history SET recorded_at = recorded_at + id")
+    storage._conn.commit()
+
+
+def _offset(storage: RelationalStorage, keys: tuple, page: int, depth: int, reps: int) -> float:
+    start = time.perf_counter()
+    for _ in range(reps):
+        rows = storage._conn.execute(_OFFSET_PAGE, keys + (page, depth * page)).fetchall()
+        for row in rows:    # same per-row conversion as iter_history()
+            entry = dict(row)
+            entry["recorded_at"] = _time_iso(entry["recorded_at"])
+    return (time.perf_counter() - start) / reps
+
+
+def _keyset(storage: RelationalStorage, cursor: int, page: int, reps: int) -> float:
+    start = time.perf_counter()
+    for _ in range(reps):
+        rows = storage.iter_history("me", "peer", before_id=cursor, batch=page)
+        list(islice(rows, page))
+        rows.close()
+    return (time.perf_counter() - start) / reps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page", type=int, default=100)
+    parser.add_argument("--reps", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = RelationalStorage(os.path.join(tmp, "paging.db"))
+        _fill(storage, args.rows)
+        names = storage._keys(("me", "peer"))
+        keys = (names["me"], names["peer"])
+        ids = [e["id"] for e in storage.iter_history("me", "peer", batch=10_000)]
+
+        print(f"{'page':>8} {'offset':>10} {'keyset':>10}")
+        depth = 1
+        while depth * args.page < len(ids):
+            offset = _offset(storage, keys, args.page, depth, args.reps)
+            keyset = _keyset(storage, ids[depth * args.page - 1], args.page, args.reps)
+            print(f"{depth:>8,} {offset * 1e3:>7.2f} ms {keyset * 1e3:>7.2f} ms")
+            depth *= 4
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()
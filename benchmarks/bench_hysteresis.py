@@ -0,0 +1,52 @@
+"""
+Benchmark: write load of a relationship oscillating around the threshold.
+
+Each round pushes risk just over rupture_threshold, brings it back just
+under, and acknowledges repair — the pattern that closes and reopens a gate
+on every round without hysteresis. Reports signals, history rows written
+and time per round, with and without a release band and a dwell time.
+
+    python benchmarks/bench_hysteresis.py [--rounds 20000]
+"""
+
+import argparse
+import time
+
+from rlp_0 import RLP0Manager
+
+CONFIGS = [
+    ("none", {}),
+    ("band 0.45", {"release_threshold": 0.45}),
+    ("dwell 1s", {"min_dwell": 1.0}),
+    ("band + dwell", {"release_threshold": 0.45, "min_dwell": 1.0}),
+]
+
+
+def _run(rounds: int, options: dict) -> tuple:
+    signals = []
+    mgr = RLP0Manager("agent-a", rupture_threshold=0.5,
+                      on_rupture=lambda *a: signals.append(a),
+                      on_repair=lambda *a: signals.append(a), **options)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        mgr.update("agent-b", trust=0.49, intent=0.49, narrative=0.49, commitments=0.49)
+        mgr.update("agent-b", trust=0.51, intent=0.51, narrative=0.51, commitments=0.51)
+        mgr.acknowledge_repair("agent-b")
+    elapsed = time.perf_counter() - start
+    rows = len(mgr.history("agent-b", limit=10 * rounds))
+    return elapsed / rounds, len(signals), rows, mgr.suppressed_transitions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'config':<14} {'us/round':>9} {'signals':>9} {'history':>9} {'suppressed':>11}")
+    for name, options in CONFIGS:
+        per_round, signals, rows, suppressed = _run(args.rounds, options)
+        print(f"{name:<14} {per_round * 1e6:9.1f} {signals:9,} {rows:9,} {suppressed:11,}")
+
+
+if __name__ == "__main__":
+    main()
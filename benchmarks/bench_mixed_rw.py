@@ -0,0 +1,91 @@
+"""
+Benchmark: dashboard reads alongside a steady write load.
+
+One writer thread updates relationships through RLP0Manager while reader
+threads poll history(), gated() and at_risk() as a dashboard would. Compares
+the default storage (one rollback-journal connection for everything) with
+PERFORMANCE_PROFILE (WAL, synchronous=NORMAL, mmap, larger cache, read-only
+connection pool). Reports write throughput, read throughput and read
+latency percentiles.
+
+Runs against a file-backed database so commits pay for their fsyncs.
+
+    python benchmarks/bench_mixed_rw.py [--seconds 3] [--readers 4] [--pairs 1000]
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from rlp_0 import PERFORMANCE_PROFILE, RLP0Manager
+
+
+def _run(path: str, options: dict, seconds: float, readers: int, pairs: int) -> dict:
+    mgr = RLP0Manager("agent-a", rupture_threshold=0.5, db_path=path, lazy=True,
+                      thread_safe=True, storage_options=options)
+    mgr.update_many((f"agent-{i}", {"trust": 0.9}) for i in range(pairs))
+    stop = threading.Event()
+    writes = [0]
+    latencies: list = []
+
+    def writer() -> None:
+        i = 0
+        while not stop.is_set():
+            value = (i % 100) / 100
+            mgr.update(f"agent-{i % pairs}", trust=value, intent=value)
+            i += 1
+        writes[0] = i
+
+    def reader(r: int) -> None:
+        mine = []
+        i = r
+        while not stop.is_set():
+            start = time.perf_counter()
+            mgr.history(f"agent-{i % pairs}", limit=20)
+            mgr.gated()
+            mgr.at_risk()
+            mine.append(time.perf_counter() - start)
+            i += 7
+        latencies.extend(mine)
+
+    threads = [threading.Thread(target=writer)]
+    threads += [threading.Thread(target=reader, args=(r,)) for r in range(readers)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    mgr.close()
+
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+    return {
+        "writes": writes[0] / seconds,
+        "reads": len(latencies) / seconds,
+        "p50": pct(0.50),
+        "p99": pct(0.99),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--pairs", type=int, default=1000)
+    args = parser.parse_args()
+
+    profiles = [("default", {}), ("performance", dict(PERFORMANCE_PROFILE, readers=args.readers))]
+    print(f"{'storage':<12} {'writes/s':>10} {'reads/s':>10} {'read p50':>10} {'read p99':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, options in profiles:
+            r = _run(os.path.join(tmp, f"{name}.db"), options,
+                     args.seconds, args.readers, args.pairs)
+            print(f"{name:<12} {r['writes']:>10,.0f} {r['reads']:>10,.0f} "
+                  f"{r['p50']:>8.2f}ms {r['p99']:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
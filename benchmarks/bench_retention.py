@@ -0,0 +1,99 @@
+"""
+Benchmark: compact_history() over a large state_history, and what it costs
+concurrent writers.
+
+rows/s     history rows rolled up per second
+chunk      worst time one chunk transaction held the storage lock
+save p99   save() latency on another thread while compaction runs
+           (and, for comparison, without it)
+
+    python benchmarks/bench_retention.py [--rows 500000] [--pairs 1000] [--chunk 1000]
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from rlp_0 import RelationalState, RelationalStorage
+
+HOUR_US = 3600 * 10**6
+
+
+def _fill(storage: RelationalStorage, rows: int, pairs: int) -> None:
+    state = RelationalState(trust=0.8, intent=0.7, narrative=0.9, commitments=0.6)
+    per_pair = rows // pairs
+    for p in range(pairs):
+        storage.save_many([("me", f"peer-{p}", state, ["update"] * per_pair)])
+    # Spread the rows over the last 90 days, oldest first
+    start = time.time_ns() // 1000 - 90 * 24 * HOUR_US
+    step = 90 * 24 * HOUR_US // max(1, per_pair * pairs)
+    storage._conn.execute("UPDATE state_history SET recorded_at = ? + id * ?", (start, step))
+    storage._conn.commit()
+
+
+def _writer(storage: RelationalStorage, stop: threading.Event, latencies: list) -> None:
+    state = RelationalState(trust=0.5)
+    k = 0
+    while not stop.is_set():
+        begin = time.perf_counter()
+        storage.save("me", f"live-{k % 100}", state)
+        latencies.append(time.perf_counter() - begin)
+        k += 1
+        time.sleep(0.001)
+
+
+def _p99(latencies: list) -> float:
+    ordered = sorted(latencies)
+    return ordered[int(len(ordered) * 0.99)] if ordered else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--pairs", type=int, default=1000)
+    parser.add_argument("--chunk", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = RelationalStorage(os.path.join(tmp, "retention.db"), wal=True)
+        _fill(storage, args.rows, args.pairs)
+
+        stop = threading.Event()
+        idle: list = []
+        thread = threading.Thread(target=_writer, args=(storage, stop, idle))
+        thread.start()
+        time.sleep(1.0)
+        stop.set()
+        thread.join()
+
+        stop.clear()
+        busy: list = []
+        thread = threading.Thread(target=_writer, args=(storage, stop, busy))
+        thread.start()
+        worst = 0.0
+        deleted = 0
+        start = time.perf_counter()
+        while True:
+            begin = time.perf_counter()
+            removed = storage.compact_history(keep=30 * 86400, bucket=3600, chunk=args.chunk, max_chunks=1)
+            worst = max(worst, time.perf_counter() - begin)
+            if not removed:
+                break
+            deleted += removed
+        elapsed = time.perf_counter() - start
+        stop.set()
+        thread.join()
+
+        remaining = storage._conn.execute("SELECT COUNT(*) FROM state_history").fetchone()[0]
+        buckets = storage._conn.execute("SELECT COUNT(*) FROM history_rollups").fetchone()[0]
+        print(f"rolled up   {deleted:,} rows in {elapsed:.2f} s ({deleted / elapsed:,.0f} rows/s)")
+        print(f"left        {remaining:,} history rows, {buckets:,} rollup buckets")
+        print(f"chunk       {worst * 1e3:.1f} ms worst ({args.chunk} rows)")
+        print(f"save p99    {_p99(busy) * 1e3:.2f} ms during compaction, {_p99(idle) * 1e3:.2f} ms idle")
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()
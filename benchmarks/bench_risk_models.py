@@ -0,0 +1,74 @@
+"""
+Benchmark: cost of each built-in risk model, scalar and vectorized.
+
+scalar   one compiled-function call on floats
+update   RLP0.update_state() end to end with the model selected
+vector   model.vector over NumPy columns (fleet / batch evaluation)
+
+    python benchmarks/bench_risk_models.py [--calls 1000000] [--rows 1000000]
+"""
+
+import argparse
+import time
+
+from rlp_0 import RLP0, MeanRisk, WeightedRisk, MaxRisk, DecayedRisk
+
+MODELS = [
+    MeanRisk(),
+    WeightedRisk(trust=3, intent=2, narrative=1, commitments=1),
+    MaxRisk(),
+    DecayedRisk(alpha=0.3),
+]
+
+
+def _scalar(model, calls: int) -> float:
+    fn = model.scalar
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn(0.8, 0.7, 0.9, 0.6, 0.2)
+    return (time.perf_counter() - start) / calls
+
+
+def _update(model, calls: int) -> float:
+    rlp = RLP0(rupture_threshold=0.99, risk_model=model)
+    start = time.perf_counter()
+    for k in range(calls):
+        rlp.update_state(trust=0.5 + (k & 63) / 128)
+    return (time.perf_counter() - start) / calls
+
+
+def _vector(model, rows: int) -> float:
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    cols = [rng.random(rows) for _ in range(5)]
+    fn = model.vector
+    fn(*cols)   # warm up
+    start = time.perf_counter()
+    for _ in range(5):
+        fn(*cols)
+    return (time.perf_counter() - start) / 5
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    try:
+        import numpy  # noqa: F401
+        have_numpy = True
+    except ImportError:
+        have_numpy = False
+
+    print(f"{'model':<14} {'scalar':>9} {'update':>9}   vector ({args.rows:,} rows)")
+    for model in MODELS:
+        scalar = _scalar(model, args.calls)
+        update = _update(model, args.calls)
+        vector = f"{_vector(model, args.rows) * 1000:7.2f} ms" if have_numpy else "numpy missing"
+        print(f"{type(model).__name__:<14} {scalar * 1e9:6.0f} ns {update * 1e9:6.0f} ns   {vector}")
+
+
+if __name__ == "__main__":
+    main()
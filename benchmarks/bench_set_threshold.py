@@ -0,0 +1,69 @@
+"""
+Benchmark: RLP0Manager.set_threshold() fleet re-evaluation.
+
+Restores N pairs into an array-backend manager, then lowers the threshold
+so that roughly --crossing of them become gated. Reports the call with its
+storage write stubbed out (vectorized re-evaluation plus signals) and the
+full call (plus one bulk write), each on a freshly restored manager.
+
+    python benchmarks/bench_set_threshold.py [--pairs 1000000] [--crossing 0.01]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from rlp_0 import RelationalState, RelationalStorage, RLP0Manager
+
+
+def _populate(path: str, pairs: int, crossing: float) -> None:
+    """Risks spread over [0, 0.5); a `crossing` fraction sits in [0.4, 0.5)."""
+    rng = random.Random(0)
+    storage = RelationalStorage(path)
+    chunk = 50_000
+    for start in range(0, pairs, chunk):
+        items = []
+        for i in range(start, min(start + chunk, pairs)):
+            risk = 0.4 + rng.random() * 0.1 if rng.random() < crossing else rng.random() * 0.4
+            p = 1 - risk
+            state = RelationalState(trust=p, intent=p, narrative=p, commitments=p,
+                                    rupture_risk=risk)
+            items.append(("agent-a", f"peer-{i}", state, ("update",)))
+        storage.save_many(items)
+    storage.close()
+
+
+def _set_threshold(path: str, write: bool) -> tuple:
+    """Time set_threshold(0.4) on a freshly restored array-backend manager."""
+    mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.6,
+                      db_path=path, backend="array")
+    if not write:
+        mgr._persist = lambda items, signals: None
+    start = time.perf_counter()
+    gated = mgr.set_threshold(0.4)
+    elapsed = time.perf_counter() - start
+    mgr.close()
+    return elapsed, gated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=1_000_000)
+    parser.add_argument("--crossing", type=float, default=0.01)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "threshold.db")
+        _populate(path, args.pairs, args.crossing)
+        evaluation, evaluated = _set_threshold(path, write=False)
+        total, gated = _set_threshold(path, write=True)
+
+    print(f"{args.pairs:,} pairs")
+    print(f"set_threshold (no write)     {evaluation * 1000:>10.1f} ms  ({len(evaluated):,} newly gated)")
+    print(f"set_threshold (incl. write)  {total * 1000:>10.1f} ms  ({len(gated):,} newly gated)")
+
+
+if __name__ == "__main__":
+    main()
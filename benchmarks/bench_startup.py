@@ -0,0 +1,73 @@
+"""
+Benchmark: RLP0Manager startup restore at 10k / 100k / 1M pairs.
+
+Compares the old N+1 restore (all_pairs() then one load() per pair,
+filtered to the agent in Python) with the streamed bulk restore and with
+lazy startup. The database also holds an equal number of pairs owned by
+another agent.
+
+    python benchmarks/bench_startup.py [--sizes 10000,100000,1000000] [--legacy-max 100000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from rlp_0 import RelationalState, RelationalStorage, RLP0Manager
+
+
+def _populate(path: str, pairs: int) -> None:
+    storage = RelationalStorage(path)
+    state = RelationalState(trust=0.8, intent=0.7)
+    for owner in ("agent-a", "agent-other"):
+        chunk = 50_000
+        for start in range(0, pairs, chunk):
+            storage.save_many(
+                (owner, f"peer-{i}", state, ("update",))
+                for i in range(start, min(start + chunk, pairs))
+            )
+    storage.close()
+
+
+def _legacy_restore(path: str) -> float:
+    storage = RelationalStorage(path)
+    start = time.perf_counter()
+    restored = {}
+    for from_id, to_id in storage.all_pairs():
+        if from_id == "agent-a":
+            restored[to_id] = storage.load(from_id, to_id)
+    elapsed = time.perf_counter() - start
+    storage.close()
+    return elapsed
+
+
+def _manager_startup(path: str, **kwargs) -> float:
+    start = time.perf_counter()
+    mgr = RLP0Manager(agent_id="agent-a", db_path=path, **kwargs)
+    elapsed = time.perf_counter() - start
+    mgr.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--legacy-max", type=int, default=100_000,
+                        help="skip the N+1 restore above this many pairs")
+    args = parser.parse_args()
+
+    print(f"{'pairs':>10} {'N+1 restore':>14} {'bulk restore':>14} {'lazy':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "startup.db")
+            _populate(path, size)
+            legacy = _legacy_restore(path) if size <= args.legacy_max else None
+            bulk = _manager_startup(path)
+            lazy = _manager_startup(path, lazy=True)
+        legacy_s = f"{legacy:>13.2f}s" if legacy is not None else f"{'skipped':>14}"
+        print(f"{size:>10,} {legacy_s} {bulk:>13.2f}s {lazy * 1000:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: RLP0Manager update throughput from a thread pool.
+
+Compares one manager behind a global lock (every call serialized, each
+paying for its own commit) with thread_safe=True (lock striping by
+counterpart, writes group-committed by the storage writer thread).
+
+Runs against a file-backed database so every commit pays for its fsync.
+
+    python benchmarks/bench_thread_scaling.py [--updates 4000] [--threads 1,2,4,8,16,32]
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from rlp_0 import RLP0Manager
+
+
+def _run(mgr_update, threads: int, updates: int) -> float:
+    per_thread = updates // threads
+
+    def worker(t: int) -> None:
+        for i in range(per_thread):
+            mgr_update(f"agent-{t}-{i % 50}", trust=0.8)
+
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def _global_lock(path: str, threads: int, updates: int) -> float:
+    mgr = RLP0Manager("agent-a", db_path=path)
+    lock = threading.Lock()
+
+    def update(other_id, **primitives):
+        with lock:
+            return mgr.update(other_id, **primitives)
+
+    rate = _run(update, threads, updates)
+    mgr.close()
+    return rate
+
+
+def _striped(path: str, threads: int, updates: int) -> float:
+    mgr = RLP0Manager("agent-a", db_path=path, thread_safe=True)
+    rate = _run(mgr.update, threads, updates)
+    mgr.close()
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--updates", type=int, default=4000)
+    parser.add_argument("--threads", default="1,2,4,8,16,32")
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'global lock':>14} {'thread_safe':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for threads in (int(t) for t in args.threads.split(",")):
+            coarse = _global_lock(os.path.join(tmp, f"g{threads}.db"), threads, args.updates)
+            striped = _striped(os.path.join(tmp, f"s{threads}.db"), threads, args.updates)
+            print(f"{threads:>8} {coarse:>12,.0f}/s {striped:>12,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: ISO 8601 TEXT timestamps (schema version 2) vs integer
+microseconds (version 3) in RelationalStorage.
+
+save     save_many() throughput, one timestamp formatted per batch
+load     load_many() throughput, one timestamp parsed per row
+scan     quiet_states() range scan over the (from_id, last_updated) index
+
+    python benchmarks/bench_timestamps.py [--pairs 50000]
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from rlp_0 import RelationalState, RelationalStorage
+from rlp_0.storage import _INDEXES, _TABLES
+
+
+def _open(path: str, iso: bool) -> RelationalStorage:
+    if iso:
+        conn = sqlite3.connect(path)
+        conn.executescript(_TABLES.format(time="TEXT") + _INDEXES + "PRAGMA user_version = 2;")
+        conn.close()
+    return RelationalStorage(path)
+
+
+def _bench(path: str, iso: bool, pairs: int) -> dict:
+    storage = _open(path, iso)
+    state = RelationalState(trust=0.8, intent=0.7, narrative=0.9, commitments=0.6)
+    names = [f"agent-{i}" for i in range(pairs)]
+
+    start = time.perf_counter()
+    for i in range(0, pairs, 500):
+        storage.save_many(("me", to, state, ["update"]) for to in names[i:i + 500])
+    save = pairs / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(0, pairs, 500):
+        storage.load_many("me", names[i:i + 500])
+    load = pairs / (time.perf_counter() - start)
+
+    cutoff = datetime.now(timezone.utc) + timedelta(seconds=1)
+    start = time.perf_counter()
+    rows = sum(1 for _ in storage.quiet_states("me", cutoff))
+    scan = rows / (time.perf_counter() - start)
+    storage.close()
+    return {"version": 2 if iso else 3, "save": save, "load": load, "scan": scan}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=50_000)
+    args = parser.parse_args()
+
+    print(f"{'timestamps':<12} {'save/s':>10} {'load/s':>10} {'scan rows/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, iso in (("iso text", True), ("int micros", False)):
+            r = _bench(os.path.join(tmp, f"{iso}.db"), iso, args.pairs)
+            print(f"{name:<12} {r['save']:>10,.0f} {r['load']:>10,.0f} {r['scan']:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
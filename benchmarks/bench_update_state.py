@@ -0,0 +1,79 @@
+"""
+Benchmark: per-call cost of RLP0.update_state().
+
+"before" replays the previous implementation on the current slotted types:
+a kwargs dict, a new RelationalState(**values) with full validation, and a
+datetime.now() timestamp. "after" is the in-place fast path; "after, state
+read" also reads rlp.state between updates, as RLP0Manager does, so every
+update copies the state once.
+
+    python benchmarks/bench_update_state.py [--updates 1000000]
+"""
+
+import argparse
+import time
+from datetime import datetime, timezone
+
+from rlp_0 import RLP0, RelationalState
+
+
+class _Before(RLP0):
+    def update_state(self, trust=None, intent=None, narrative=None, commitments=None):
+        updates = {}
+        if trust is not None:
+            updates['trust'] = trust
+        if intent is not None:
+            updates['intent'] = intent
+        if narrative is not None:
+            updates['narrative'] = narrative
+        if commitments is not None:
+            updates['commitments'] = commitments
+        if updates:
+            state = self._state
+            self._state = RelationalState(
+                trust=updates.get('trust', state.trust),
+                intent=updates.get('intent', state.intent),
+                narrative=updates.get('narrative', state.narrative),
+                commitments=updates.get('commitments', state.commitments),
+                rupture_risk=state.rupture_risk,
+                is_gated=state.is_gated,
+            )
+        self.compute_rupture_risk()
+
+    def compute_rupture_risk(self) -> float:
+        state = self._state
+        risk = (
+            (1 - state.trust) + (1 - state.intent) +
+            (1 - state.narrative) + (1 - state.commitments)
+        ) / 4
+        state.rupture_risk = risk
+        state.last_updated = datetime.now(timezone.utc)
+        self._check_threshold(risk)
+        return risk
+
+
+def _time(rlp: RLP0, n: int, read_state: bool) -> float:
+    values = [(i % 50) / 100 + 0.5 for i in range(1000)]
+    start = time.perf_counter()
+    for i in range(n):
+        rlp.update_state(trust=values[i % 1000], intent=0.9)
+        if read_state:
+            rlp.state
+    return (time.perf_counter() - start) / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--updates", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    before = _time(_Before(rupture_threshold=0.9), args.updates, read_state=False)
+    after = _time(RLP0(rupture_threshold=0.9), args.updates, read_state=False)
+    shared = _time(RLP0(rupture_threshold=0.9), args.updates, read_state=True)
+    print(f"before              {before * 1e9:7.0f} ns/update")
+    print(f"after               {after * 1e9:7.0f} ns/update   ({before / after:.1f}x)")
+    print(f"after, state read   {shared * 1e9:7.0f} ns/update   ({before / shared:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,18 +7,33 @@ A minimal state primitive for relational infrastructure.
 from .semantic import RelationalState
 from .signals import Signal, RUPTURE_DETECTED, REPAIR_COMPLETE
 from .gates import Gate
+from .dispatch import SignalDispatcher
+from .risk import RiskModel, MeanRisk, WeightedRisk, MaxRisk, DecayedRisk
+from .decay import TimeDecay, DecaySweeper
 from .core import RLP0
-from .storage import RelationalStorage
-from .manager import RLP0Manager
+from .storage import RelationalStorage, PERFORMANCE_PROFILE
+from .manager import RLP0Manager, UpdateResult
+from .aio import AsyncRLP0Manager
 
 __version__ = "0.2.0"
 __all__ = [
     "RLP0",
     "RLP0Manager",
+    "AsyncRLP0Manager",
     "RelationalState",
     "RelationalStorage",
+    "PERFORMANCE_PROFILE",
     "Signal",
+    "SignalDispatcher",
     "RUPTURE_DETECTED",
     "REPAIR_COMPLETE",
     "Gate",
+    "UpdateResult",
+    "RiskModel",
+    "MeanRisk",
+    "WeightedRisk",
+    "MaxRisk",
+    "DecayedRisk",
+    "TimeDecay",
+    "DecaySweeper",
 ]
@@ -0,0 +1,308 @@
+"""
+Asyncio front end for RLP0Manager
+
+RLP0Manager does its SQLite I/O on the calling thread, which blocks an
+event loop. AsyncRLP0Manager keeps relationship state on the loop — risk and
+gate evaluation are cheap in-memory work — and moves storage I/O off it:
+
+- writes go to one dedicated writer thread, in submission order
+- reads (history, lazy hydration, storage-backed fleet counts) go to a
+  small reader pool
+- units of work that complete in the same loop iteration are written as
+  one transaction: the first commit opens a batch, later commits join it,
+  and the batch is handed to the writer on the next iteration
+
+A mutating call returns once the batch holding its write has committed, so
+write errors surface to the caller. Reads wait for earlier writes first, so
+a task sees its own updates.
+
+Usage
+-----
+    mgr = AsyncRLP0Manager("agent-a", db_path="rlp.db", lazy=True)
+
+    await mgr.update("agent-b", trust=0.9)
+    if not await mgr.can_interact("agent-b"):
+        await mgr.wait_can_interact("agent-b", timeout=30)
+
+    await mgr.close()
+
+Construction (schema setup and, unless lazy, the startup restore) is still
+synchronous; create the manager before the loop is serving traffic.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .manager import RLP0Manager, UpdateResult
+from .semantic import RelationalState
+from .signals import Signal
+
+
+class _LoopManager(RLP0Manager):
+    """RLP0Manager whose storage I/O is routed through an AsyncRLP0Manager."""
+
+    def __init__(self, front: "AsyncRLP0Manager", *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._front = front
+        # Hydration results fetched by the reader pool for the current call
+        self.prefetched: Dict[str, Optional[RelationalState]] = {}
+        # to_id -> number of queued or in-flight writes
+        self.unflushed: Dict[str, int] = {}
+
+    def _load(self, other_id: str) -> Optional[RelationalState]:
+        if other_id in self.prefetched:
+            return self.prefetched.pop(other_id)
+        return super()._load(other_id)
+
+    def _persist(self, items: List[tuple], signals: List[tuple]) -> None:
+        # The writer runs later; snapshot each state so calls in the same
+        # tick cannot change rows that are already queued
+        self._front._enqueue(
+            [(from_id, to_id, state.copy(), types) for from_id, to_id, state, types in items],
+            signals,
+        )
+
+    def _evict(self) -> None:
+        # Only evict relationships whose writes have committed, so that a
+        # later hydration from storage never sees an older state.
+        unflushed = self.unflushed
+        excess = len(self._pairs) - self._max_resident
+        victims = []
+        for other_id in self._pairs:
+            if len(victims) == excess:
+                break
+            if other_id not in unflushed:
+                victims.append(other_id)
+        for other_id in victims:
+            self._suppressed_evicted += self._pairs.pop(other_id).suppressed_transitions
+        self._evictions += len(victims)
+
+
+class AsyncRLP0Manager:
+    """
+    Asyncio-native RLP0Manager.
+
+    Parameters
+    ----------
+    agent_id, rupture_threshold, db_path, on_rupture, on_repair
+        As for RLP0Manager. Callbacks run on the event loop unless a
+        dispatcher is passed.
+    readers : int
+        Threads in the reader pool.
+    **options
+        Any other RLP0Manager keyword (lazy, max_resident, backend,
+        signal_capacity, spill_signals, dispatcher, risk_model, decay,
+        release_threshold, min_dwell, storage_options). With
+        ``storage_options=PERFORMANCE_PROFILE`` the reader pool reads through
+        storage's read-only connections, concurrently with the writer.
+    """
+
+    def __init__(
+        self,
+        agent_id: str,
+        rupture_threshold: float = 0.6,
+        db_path: str = ":memory:",
+        on_rupture: Optional[Callable[[str, Signal], None]] = None,
+        on_repair:  Optional[Callable[[str, Signal], None]] = None,
+        readers:    int = 4,
+        **options,
+    ) -> None:
+        if readers < 1:
+            raise ValueError(f"readers must be at least 1, got {readers}")
+        self._mgr = _LoopManager(
+            self, agent_id, rupture_threshold, db_path, on_rupture, on_repair, **options,
+        )
+        self.agent_id  = agent_id
+        self._storage  = self._mgr._storage
+        self._writer   = ThreadPoolExecutor(1, thread_name_prefix="rlp0-writer")
+        self._readers  = ThreadPoolExecutor(readers, thread_name_prefix="rlp0-reader")
+        self._pending: List[tuple] = []
+        self._pending_signals: List[tuple] = []   # spilled, for signal_log
+        self._batch: Optional[asyncio.Task] = None        # open for this iteration
+        self._last_write: Optional[asyncio.Task] = None   # most recent batch
+        self._batches = 0
+
+    # ── Write batching ────────────────────────────────────────────────────────
+
+    def _enqueue(self, items: List[tuple], signals: List[tuple] = ()) -> None:
+        unflushed = self._mgr.unflushed
+        for item in items:
+            unflushed[item[1]] = unflushed.get(item[1], 0) + 1
+        self._pending.extend(items)
+        self._pending_signals.extend(signals)
+        if self._batch is None:
+            self._batch = self._last_write = asyncio.get_running_loop().create_task(
+                self._write_batch()
+            )
+
+    async def _write_batch(self) -> None:
+        items, self._pending = self._pending, []
+        signals, self._pending_signals = self._pending_signals, []
+        self._batch = None
+        self._batches += 1
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._writer, self._storage.save_many, items, signals,
+            )
+        finally:
+            unflushed = self._mgr.unflushed
+            for item in items:
+                left = unflushed[item[1]] - 1
+                if left:
+                    unflushed[item[1]] = left
+                else:
+                    del unflushed[item[1]]
+
+    async def _settle(self) -> None:
+        """Wait until every write queued so far has committed (or failed)."""
+        task = self._last_write
+        if task is not None and not task.done():
+            await asyncio.wait([task])
+
+    async def _prefetch(self, other_ids: Iterable[str]) -> None:
+        """Hydrate non-resident relationships from the reader pool (lazy mode)."""
+        mgr = self._mgr
+        missing = [i for i in dict.fromkeys(other_ids) if i not in mgr._pairs]
+        if not missing:
+            return
+        evictions = mgr._evictions
+        states = await asyncio.get_running_loop().run_in_executor(
+            self._readers, self._storage.load_many, self.agent_id, missing,
+        )
+        if mgr._evictions != evictions:
+            # A relationship may have been loaded, changed and evicted while
+            # we read; fall back to a fresh synchronous load for this call.
+            return
+        mgr.prefetched.update((i, states.get(i)) for i in missing)
+
+    async def _run(self, other_ids: Iterable[str], fn: Callable, *args, **kwargs):
+        """Run one manager call on the loop, then wait for its write to commit."""
+        if self._mgr._lazy:
+            await self._prefetch(other_ids)
+        queued = len(self._pending)
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            self._mgr.prefetched.clear()
+        batch = self._batch
+        if batch is not None and len(self._pending) != queued:
+            await asyncio.shield(batch)
+        return result
+
+    async def _read(self, fn: Callable, *args):
+        await self._settle()
+        return await asyncio.get_running_loop().run_in_executor(self._readers, fn, *args)
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    async def update(
+        self,
+        other_id: str,
+        trust:       Optional[float] = None,
+        intent:      Optional[float] = None,
+        narrative:   Optional[float] = None,
+        commitments: Optional[float] = None,
+    ):
+        """Update relational primitives; returns once the change is committed."""
+        return await self._run(
+            (other_id,), self._mgr.update, other_id,
+            trust=trust, intent=intent, narrative=narrative, commitments=commitments,
+        )
+
+    async def update_many(
+        self,
+        updates: Iterable[Tuple[str, Mapping[str, float]]],
+    ) -> List[UpdateResult]:
+        """Apply a batch of primitive updates as one unit of work."""
+        updates = list(updates)
+        return await self._run(
+            (other_id for other_id, _ in updates), self._mgr.update_many, updates,
+        )
+
+    async def acknowledge_repair(self, other_id: str) -> bool:
+        """Acknowledge repair; True if the gate was released."""
+        return await self._run((other_id,), self._mgr.acknowledge_repair, other_id)
+
+    async def can_interact(self, other_id: str) -> bool:
+        """Return True if the relationship gate is open (not gated)."""
+        return await self._run((other_id,), self._mgr.can_interact, other_id)
+
+    async def wait_can_interact(self, other_id: str, timeout: Optional[float] = None) -> bool:
+        """Wait until the relationship gate is open; False on timeout."""
+        if await self.can_interact(other_id):
+            return True
+        return await self._mgr.wait_can_interact(other_id, timeout)
+
+    async def state(self, other_id: str) -> RelationalState:
+        """Return current relational state for a pair."""
+        return await self._run((other_id,), self._mgr.state, other_id)
+
+    async def history(self, other_id: str, limit: int = 50) -> list:
+        """Return state history for a pair from storage."""
+        return await self._read(self._mgr.history, other_id, limit)
+
+    async def iter_history(
+        self,
+        other_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        before_id: Optional[int] = None,
+        batch: int = 500,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream state history for a pair, newest first.
+
+        Each page of ``batch`` entries is one keyset query on the reader
+        pool, resuming after the last entry of the previous page.
+        """
+        while True:
+            page = await self._read(
+                self._history_page, other_id, since, until, before_id, batch,
+            )
+            for entry in page:
+                yield entry
+            if len(page) < batch:
+                return
+            before_id = page[-1]["id"]
+
+    def _history_page(self, other_id, since, until, before_id, batch) -> List[dict]:
+        rows = self._mgr.iter_history(other_id, since, until, before_id, batch)
+        try:
+            return list(islice(rows, batch))
+        finally:
+            rows.close()
+
+    async def summary(self) -> dict:
+        """Return an observability snapshot across all relationships."""
+        if not self._mgr._lazy:
+            return self._mgr.summary()
+        return await self._read(self._mgr.summary)
+
+    async def flush(self) -> None:
+        """Wait until every write queued so far has committed."""
+        await self._settle()
+
+    @property
+    def batches_written(self) -> int:
+        """Transactions handed to the writer thread so far."""
+        return self._batches
+
+    @property
+    def writes_saved(self) -> int:
+        """Storage writes avoided by coalescing each call into one write per pair."""
+        return self._mgr.writes_saved
+
+    @property
+    def suppressed_transitions(self) -> int:
+        """Gate releases held back by min_dwell or the hysteresis band."""
+        return self._mgr.suppressed_transitions
+
+    async def close(self) -> None:
+        """Commit queued writes, then close storage and stop the I/O threads."""
+        await self._settle()
+        await asyncio.get_running_loop().run_in_executor(self._writer, self._storage.close)
+        self._writer.shutdown(wait=False)
+        self._readers.shutdown(wait=False)
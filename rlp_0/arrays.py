@@ -0,0 +1,437 @@
+"""
+Array engine - struct-of-arrays relational state for large fleets
+
+The object model spends a RelationalState, an RLP0, a Gate and a SignalBus
+on every relationship. ArrayStateStore keeps the same per-relationship data
+in contiguous NumPy columns instead, indexed by an interned row id:
+
+    trust · intent · narrative · commitments · rupture_risk · is_gated · last_updated
+
+Rupture risk is computed in one vectorized pass over any subset of rows,
+with the vector variant of the store's risk model (the same model an RLP0
+would use, MeanRisk by default).
+
+RLP0Manager(backend="array") uses this engine while keeping its public API;
+per-relationship calls return an ArrayPair view instead of an RLP0.
+
+Requires NumPy (``pip install rlp-0[fast]``).
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from .clock import wall_ns
+from .risk import DEFAULT_RISK_MODEL, RiskModel
+from .semantic import RelationalState
+from .signals import Signal, RUPTURE_DETECTED, REPAIR_COMPLETE
+
+PRIMITIVES = ("trust", "intent", "narrative", "commitments")
+_PRIMITIVE_SET = frozenset(PRIMITIVES)
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "the array backend requires numpy; install it with `pip install rlp-0[fast]`"
+        )
+
+
+class ArrayPair:
+    """
+    View of one relationship row in an ArrayStateStore.
+
+    Exposes the per-relationship side of RLP0 (state, rupture_risk,
+    is_gated, update_state, compute_rupture_risk, acknowledge_repair,
+    check_gate) without allocating per-relationship objects beyond itself.
+    Signals are delivered through the store's ``on_signal`` callback.
+    """
+
+    __slots__ = ("_store", "key", "row")
+
+    def __init__(self, store: "ArrayStateStore", key: str, row: int) -> None:
+        self._store = store
+        self.key = key
+        self.row = row
+
+    @property
+    def state(self) -> RelationalState:
+        """Snapshot of the current relational state."""
+        return self._store.state_at(self.row)
+
+    @property
+    def rupture_risk(self) -> float:
+        return float(self._store.rupture_risk[self.row])
+
+    @property
+    def is_gated(self) -> bool:
+        return bool(self._store.is_gated[self.row])
+
+    def check_gate(self) -> bool:
+        """True if the gate is open."""
+        return not self._store.is_gated[self.row]
+
+    def update_state(
+        self,
+        trust: Optional[float] = None,
+        intent: Optional[float] = None,
+        narrative: Optional[float] = None,
+        commitments: Optional[float] = None,
+    ) -> None:
+        """Update primitives, recompute risk and gate, as RLP0.update_state()."""
+        store = self._store
+        store.set_primitives(self.row, trust, intent, narrative, commitments)
+        self._evaluate(step=True)
+
+    def compute_rupture_risk(self) -> float:
+        """
+        Recompute risk for this row; closes the gate if the threshold is
+        crossed. A stateful model keeps its risk, as in RLP0.
+        """
+        return self._evaluate(step=not self._store.risk_model.stateful)
+
+    def _evaluate(self, step: bool) -> float:
+        store = self._store
+        row = self.row
+        if step:
+            risk = store.risk_of(row)
+            store.rupture_risk[row] = risk
+            store.last_updated[row] = wall_ns()
+        else:
+            risk = float(store.rupture_risk[row])
+        if risk >= store.threshold and not store.is_gated[row]:
+            store.emit(self.key, RUPTURE_DETECTED, risk,
+                       f"Rupture risk {risk:.2f} exceeded threshold {store.threshold}")
+            store.is_gated[row] = True
+        return risk
+
+    def acknowledge_repair(self) -> bool:
+        """Release the gate if risk has dropped below threshold, as RLP0."""
+        store = self._store
+        if not store.is_gated[self.row]:
+            return False
+        risk = self.compute_rupture_risk()
+        if risk >= store.threshold:
+            return False
+        store.is_gated[self.row] = False
+        store.emit(self.key, REPAIR_COMPLETE, risk,
+                   f"Repair validated: risk dropped to {risk:.2f} (threshold {store.threshold})")
+        return True
+
+
+class ArrayStateStore:
+    """
+    Struct-of-arrays store for many relationships.
+
+    Usage
+    -----
+    store = ArrayStateStore(threshold=0.6)
+    pair = store.add("agent-b")
+    pair.update_state(trust=0.2)
+    store.compute_rupture_risk()          # vectorized over every row
+    store.at_risk()                       # ["agent-b", ...]
+
+    Parameters
+    ----------
+    threshold : float
+        Rupture threshold applied to every row.
+    capacity : int
+        Initial number of rows; columns double when full.
+    on_signal : callable, optional
+        Called with (key, Signal) for every RUPTURE_DETECTED / REPAIR_COMPLETE.
+    risk_model : RiskModel, optional
+        How rupture risk is computed (default MeanRisk).
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.6,
+        capacity: int = 1024,
+        on_signal: Optional[Callable[[str, Signal], None]] = None,
+        risk_model: Optional[RiskModel] = None,
+    ) -> None:
+        _require_numpy()
+        self.threshold = threshold
+        self.on_signal = on_signal
+        self.risk_model = risk_model or DEFAULT_RISK_MODEL
+        self._risk = self.risk_model.scalar
+        self._risk_vector = self.risk_model.vector
+        self.pairs: Dict[str, ArrayPair] = {}   # interned key -> row view
+        self._keys: List[str] = []
+        self._size = 0
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        old = None if self._size == 0 else self._columns()
+        self.trust        = np.ones(capacity, dtype=np.float64)
+        self.intent       = np.ones(capacity, dtype=np.float64)
+        self.narrative    = np.ones(capacity, dtype=np.float64)
+        self.commitments  = np.ones(capacity, dtype=np.float64)
+        self.rupture_risk = np.zeros(capacity, dtype=np.float64)
+        self.is_gated     = np.zeros(capacity, dtype=np.bool_)
+        self.last_updated = np.zeros(capacity, dtype=np.int64)
+        if old is not None:
+            for name, column in old.items():
+                getattr(self, name)[:self._size] = column[:self._size]
+        self._capacity = capacity
+
+    def _columns(self) -> dict:
+        return {
+            name: getattr(self, name)
+            for name in PRIMITIVES + ("rupture_risk", "is_gated", "last_updated")
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.pairs
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays."""
+        return sum(column.nbytes for column in self._columns().values())
+
+    # ── Rows ──────────────────────────────────────────────────────────────────
+
+    def add(self, key: str, state: Optional[RelationalState] = None) -> ArrayPair:
+        """Intern ``key`` (optionally with an initial state) and return its view."""
+        pair = self.pairs.get(key)
+        if pair is None:
+            if self._size == self._capacity:
+                self._allocate(self._capacity * 2)
+            row = self._size
+            self._size += 1
+            self._keys.append(key)
+            pair = self.pairs[key] = ArrayPair(self, key, row)
+            self.last_updated[row] = wall_ns()
+        if state is not None:
+            self.load_state(pair.row, state)
+        return pair
+
+    def load_state(self, row: int, state: RelationalState) -> None:
+        self.trust[row]        = state.trust
+        self.intent[row]       = state.intent
+        self.narrative[row]    = state.narrative
+        self.commitments[row]  = state.commitments
+        self.rupture_risk[row] = state.rupture_risk
+        self.is_gated[row]     = state.is_gated
+        self.last_updated[row] = state.updated_ns
+
+    def state_at(self, row: int) -> RelationalState:
+        """Materialize one row as a RelationalState."""
+        state = RelationalState(
+            trust        = float(self.trust[row]),
+            intent       = float(self.intent[row]),
+            narrative    = float(self.narrative[row]),
+            commitments  = float(self.commitments[row]),
+            rupture_risk = float(self.rupture_risk[row]),
+            is_gated     = bool(self.is_gated[row]),
+        )
+        state.updated_ns = int(self.last_updated[row])
+        return state
+
+    def set_primitives(
+        self,
+        row: int,
+        trust: Optional[float] = None,
+        intent: Optional[float] = None,
+        narrative: Optional[float] = None,
+        commitments: Optional[float] = None,
+    ) -> None:
+        """Validate and write the given primitives for one row."""
+        for name, value in zip(PRIMITIVES, (trust, intent, narrative, commitments)):
+            if value is None:
+                continue
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"{name} must be between 0.0 and 1.0, got {value}")
+            getattr(self, name)[row] = value
+
+    def risk_of(self, row: int) -> float:
+        """Scalar rupture risk for one row (same model as RLP0)."""
+        return self._risk(
+            float(self.trust[row]), float(self.intent[row]),
+            float(self.narrative[row]), float(self.commitments[row]),
+            float(self.rupture_risk[row]),
+        )
+
+    def emit(self, key: str, signal_type, risk: float, context: str) -> None:
+        if self.on_signal is not None:
+            self.on_signal(key, Signal.now(signal_type, risk, context))
+
+    # ── Vectorized ────────────────────────────────────────────────────────────
+
+    def compute_rupture_risk(self, rows=None) -> "np.ndarray":
+        """
+        Recompute rupture risk for ``rows`` (index array or slice; default all)
+        in one pass and return it. Gates are not touched. A stateful model
+        only steps on primitive writes, so its current risk is returned.
+        """
+        if rows is None:
+            rows = slice(0, self._size)
+        if self.risk_model.stateful:
+            return self.rupture_risk[rows].copy()
+        return self._step_risk(rows)
+
+    def _step_risk(self, rows) -> "np.ndarray":
+        """Evaluate the risk model for rows whose primitives were just written."""
+        risk = self._risk_vector(
+            self.trust[rows], self.intent[rows], self.narrative[rows],
+            self.commitments[rows], self.rupture_risk[rows],
+        )
+        self.rupture_risk[rows] = risk
+        self.last_updated[rows] = wall_ns()
+        return risk
+
+    def reevaluate(self, threshold: float) -> List[str]:
+        """
+        Set the threshold and gate every open row whose risk now crosses it,
+        in one vectorized pass. Emits RUPTURE_DETECTED per newly gated row
+        and returns their keys.
+        """
+        self.threshold = threshold
+        n = self._size
+        crossed = np.flatnonzero((self.rupture_risk[:n] >= threshold) & ~self.is_gated[:n])
+        keys = self._keys_at(crossed)
+        if self.on_signal is not None:
+            for key, risk in zip(keys, self.rupture_risk[crossed].tolist()):
+                self.emit(key, RUPTURE_DETECTED, risk,
+                          f"Rupture risk {risk:.2f} exceeded threshold {threshold}")
+        self.is_gated[crossed] = True
+        return keys
+
+    def apply_batch(
+        self,
+        rows: Sequence[int],
+        updates: Sequence[Dict[str, float]],
+    ) -> List[Tuple[float, bool, Optional[str]]]:
+        """
+        Apply one primitive update per entry of ``rows`` and return
+        (rupture_risk, is_gated, transition) per entry.
+
+        Rows are processed in waves of distinct rows so each wave is one
+        vectorized risk pass; a row that appears several times sees its
+        updates in order. Signals fire in input order once the batch is done.
+        Every update is validated first, so a bad batch raises unchanged.
+        """
+        self._check(updates)
+        n = len(rows)
+        results: List[Optional[Tuple[float, bool, Optional[str]]]] = [None] * n
+        crossings: List[int] = []
+        pending = list(range(n))
+        while pending:
+            seen = set()
+            wave, rest = [], []
+            for i in pending:
+                (rest if rows[i] in seen else wave).append(i)
+                seen.add(rows[i])
+            self._assign(wave, rows, updates)
+            idx = np.fromiter((rows[i] for i in wave), dtype=np.intp, count=len(wave))
+            risk = self._step_risk(idx)
+            crossed = (risk >= self.threshold) & ~self.is_gated[idx]
+            self.is_gated[idx[crossed]] = True
+            gated = self.is_gated[idx]
+            for j, i in enumerate(wave):
+                closed = bool(crossed[j])
+                if closed:
+                    crossings.append(i)
+                results[i] = (float(risk[j]), bool(gated[j]), "closed" if closed else None)
+            pending = rest
+        for i in sorted(crossings):
+            risk = results[i][0]
+            self.emit(self._keys[rows[i]], RUPTURE_DETECTED, risk,
+                      f"Rupture risk {risk:.2f} exceeded threshold {self.threshold}")
+        return results
+
+    @staticmethod
+    def _check(updates: Sequence[Dict[str, float]]) -> None:
+        """Validate the keys and ranges of every update, column by column."""
+        for update in updates:
+            unknown = update.keys() - _PRIMITIVE_SET
+            if unknown:
+                raise TypeError(f"unknown primitive(s): {', '.join(sorted(unknown))}")
+        for name in PRIMITIVES:
+            values = [v for v in (update.get(name) for update in updates) if v is not None]
+            if not values:
+                continue
+            column = np.asarray(values, dtype=np.float64)
+            bad = (column < 0.0) | (column > 1.0) | np.isnan(column)
+            if bad.any():
+                value = values[int(np.argmax(bad))]
+                raise ValueError(f"{name} must be between 0.0 and 1.0, got {value}")
+
+    def _assign(
+        self,
+        wave: List[int],
+        rows: Sequence[int],
+        updates: Sequence[Dict[str, float]],
+    ) -> None:
+        """Write one wave of (already validated) updates column by column."""
+        for name in PRIMITIVES:
+            targets, values = [], []
+            for i in wave:
+                value = updates[i].get(name)
+                if value is not None:
+                    targets.append(rows[i])
+                    values.append(value)
+            if values:
+                getattr(self, name)[targets] = values
+
+    # ── Fleet view (FleetIndex-compatible) ────────────────────────────────────
+
+    def set(self, key: str, rupture_risk: float, is_gated: bool) -> None:
+        """Columns are the index; kept for FleetIndex compatibility."""
+        row = self.pairs[key].row
+        self.rupture_risk[row] = rupture_risk
+        self.is_gated[row] = is_gated
+
+    def set_threshold(self, threshold: float) -> None:
+        """Change the threshold without re-gating; see reevaluate()."""
+        self.threshold = threshold
+
+    def _keys_at(self, rows: Iterable[int]) -> List[str]:
+        keys = self._keys
+        return [keys[r] for r in rows]
+
+    def gated(self) -> List[str]:
+        return self._keys_at(np.flatnonzero(self.is_gated[:self._size]))
+
+    def at_risk(self, threshold: Optional[float] = None) -> List[str]:
+        """Keys with rupture_risk >= threshold, highest risk first."""
+        t = self.threshold if threshold is None else threshold
+        risk = self.rupture_risk[:self._size]
+        rows = np.flatnonzero(risk >= t)
+        return self._keys_at(rows[np.argsort(-risk[rows], kind="stable")])
+
+    def healthy(self) -> List[str]:
+        n = self._size
+        mask = ~self.is_gated[:n] & (self.rupture_risk[:n] < self.threshold)
+        return self._keys_at(np.flatnonzero(mask))
+
+    def riskiest(self, k: int) -> List[Tuple[str, float]]:
+        """The k highest-risk (key, rupture_risk), highest first."""
+        n = self._size
+        if k <= 0 or n == 0:
+            return []
+        risk = self.rupture_risk[:n]
+        k = min(k, n)
+        top = np.argpartition(-risk, k - 1)[:k]
+        top = top[np.argsort(-risk[top], kind="stable")]
+        return [(self._keys[r], float(risk[r])) for r in top]
+
+    def count_at_risk(self, threshold: Optional[float] = None) -> int:
+        t = self.threshold if threshold is None else threshold
+        return int(np.count_nonzero(self.rupture_risk[:self._size] >= t))
+
+    def counts(self) -> dict:
+        n = self._size
+        gated = self.is_gated[:n]
+        at_risk = self.rupture_risk[:n] >= self.threshold
+        return {
+            "relationships": n,
+            "healthy":       int(np.count_nonzero(~gated & ~at_risk)),
+            "at_risk":       int(np.count_nonzero(at_risk)),
+            "gated":         int(np.count_nonzero(gated)),
+        }
@@ -0,0 +1,48 @@
+"""
+Clock - compact timestamps for RLP-0 records
+
+RelationalState, Signal and GateEvent store their timestamps as integer
+nanoseconds since the Unix epoch (UTC) and only build a ``datetime`` when
+one is asked for. These helpers convert between the two forms.
+
+wall_ns() is the system clock. Use it for anything persisted or compared
+against stored rows (record timestamps, decay ages, retention cutoffs), so
+values from different processes and restarts line up.
+
+now_ns() reads the monotonic clock and adds the wall-clock offset sampled
+at import, so it never steps backwards when the system clock is adjusted.
+Over long uptimes it can drift from wall time by as much as the system
+clock was slewed, so it is kept for in-process ordering and dwell timing.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+_monotonic_ns = time.monotonic_ns
+_time_ns = time.time_ns
+
+
+def wall_ns() -> int:
+    """Current time as epoch nanoseconds, from the system clock."""
+    return _time_ns()
+
+
+def now_ns() -> int:
+    """Current time as epoch nanoseconds, from the monotonic clock."""
+    return _OFFSET_NS + _monotonic_ns()
+
+
+def to_datetime(ns: int) -> datetime:
+    """Epoch nanoseconds -> timezone-aware UTC datetime (microsecond precision)."""
+    return EPOCH + timedelta(microseconds=ns // 1000)
+
+
+def to_ns(dt: datetime) -> int:
+    """datetime -> epoch nanoseconds. Naive datetimes are taken as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - EPOCH) // _MICROSECOND * 1000
@@ -12,14 +12,16 @@ Active signaling, not active acting.
 """
 
 import logging
-from datetime import datetime, timezone
-from typing import Optional, Callable, List
+from typing import Optional, Callable
 
 logger = logging.getLogger(__name__)
 
-from .semantic import RelationalState
-from .signals import Signal, SignalType, SignalBus, RUPTURE_DETECTED, REPAIR_COMPLETE
+from .clock import wall_ns
+from .semantic import RelationalState, check_primitive
+from .signals import Signal, SignalType, SignalBus, SignalHistory, RUPTURE_DETECTED, REPAIR_COMPLETE
 from .gates import Gate
+from .risk import DEFAULT_RISK_MODEL, RiskModel
+from .dispatch import SignalDispatcher
 
 
 class RLP0:
@@ -38,7 +40,13 @@ class RLP0:
     def __init__(
         self,
         rupture_threshold: float = DEFAULT_RUPTURE_THRESHOLD,
-        state: Optional[RelationalState] = None
+        state: Optional[RelationalState] = None,
+        signal_capacity: Optional[int] = None,
+        signal_spill: Optional[Callable[[Signal], None]] = None,
+        dispatcher: Optional[SignalDispatcher] = None,
+        risk_model: Optional[RiskModel] = None,
+        release_threshold: Optional[float] = None,
+        min_dwell: float = 0.0,
     ):
         """
         Initialize RLP-0.
@@ -46,11 +54,43 @@ class RLP0:
         Args:
             rupture_threshold: Risk level [0.0, 1.0] that triggers RUPTURE_DETECTED
             state: Initial relational state (defaults to healthy state)
+            signal_capacity: Keep at most this many signals in memory (default unbounded)
+            signal_spill: Receives each signal pushed out of the full history buffer
+            dispatcher: Deliver signals to subscribers on worker threads instead of inline
+            risk_model: How rupture risk is computed (default MeanRisk)
+            release_threshold: Risk must drop below this, not just below
+                rupture_threshold, for acknowledge_repair() to release the
+                gate (hysteresis; default rupture_threshold)
+            min_dwell: Seconds the gate must stay closed before
+                acknowledge_repair() may release it (default 0: no
+                debounce). Closing is never delayed.
         """
+        if release_threshold is None:
+            release_threshold = rupture_threshold
+        if not 0.0 <= release_threshold <= rupture_threshold:
+            raise ValueError(
+                f"release_threshold must be between 0.0 and rupture_threshold "
+                f"({rupture_threshold}), got {release_threshold}"
+            )
+        if min_dwell < 0:
+            raise ValueError(f"min_dwell must be non-negative, got {min_dwell}")
         self._state = state or RelationalState()
-        self._gate = Gate()
-        self._signal_bus = SignalBus()
+        # True once the current state object may be held outside this
+        # instance; the next update then copies it instead of mutating it
+        self._state_shared = state is not None
+        self._gate = Gate(min_dwell=min_dwell)
+        self._signal_bus = SignalBus(
+            capacity=signal_capacity, spill=signal_spill, dispatcher=dispatcher,
+        )
         self._rupture_threshold = rupture_threshold
+        self._release_threshold = release_threshold
+        self._risk_model = risk_model or DEFAULT_RISK_MODEL
+        self._risk = self._risk_model.scalar
+
+        # A restored state that was gated keeps its gate closed
+        if self._state.is_gated:
+            self._gate.close(reason="restored", rupture_risk=self._state.rupture_risk)
+            self._gate.changed_ns = 0   # closing time unknown: no dwell applies
         
     # ─────────────────────────────────────────────────────────────
     # State Access
@@ -59,6 +99,7 @@ class RLP0:
     @property
     def state(self) -> RelationalState:
         """Current relational state (read-only)."""
+        self._state_shared = True
         return self._state
     
     @property
@@ -70,6 +111,26 @@ class RLP0:
     def is_gated(self) -> bool:
         """Whether interaction is currently blocked."""
         return self._gate.is_closed
+
+    @property
+    def risk_model(self) -> RiskModel:
+        """Model used to compute rupture risk."""
+        return self._risk_model
+
+    @property
+    def rupture_threshold(self) -> float:
+        """Risk level that triggers RUPTURE_DETECTED."""
+        return self._rupture_threshold
+
+    @property
+    def release_threshold(self) -> float:
+        """Risk must drop below this for acknowledge_repair() to release."""
+        return self._release_threshold
+
+    @property
+    def suppressed_transitions(self) -> int:
+        """Gate releases held back by min_dwell or the hysteresis band."""
+        return self._gate.suppressed
     
     # ─────────────────────────────────────────────────────────────
     # Signal Subscription
@@ -84,8 +145,8 @@ class RLP0:
         self._signal_bus.unsubscribe(callback)
     
     @property
-    def signal_history(self) -> List[Signal]:
-        """History of emitted signals."""
+    def signal_history(self) -> SignalHistory:
+        """Resident history of emitted signals (zero-copy view), oldest first."""
         return self._signal_bus.history
     
     # ─────────────────────────────────────────────────────────────
@@ -105,30 +166,44 @@ class RLP0:
         Called by expression protocols after exchanges.
         Automatically computes rupture risk and may emit signals.
         """
-        # Build update kwargs
-        updates = {}
+        # Validate only what changed, before touching state
         if trust is not None:
-            updates['trust'] = trust
+            check_primitive('trust', trust)
         if intent is not None:
-            updates['intent'] = intent
+            check_primitive('intent', intent)
         if narrative is not None:
-            updates['narrative'] = narrative
+            check_primitive('narrative', narrative)
         if commitments is not None:
-            updates['commitments'] = commitments
-        
-        # Update state
-        if updates:
-            self._state = self._state.update(**updates)
+            check_primitive('commitments', commitments)
+
+        if trust is not None or intent is not None or narrative is not None \
+                or commitments is not None:
+            # Update in place; copy first if the state object was handed out,
+            # so earlier snapshots from .state stay unchanged
+            state = self._state
+            if self._state_shared:
+                state = self._state = state.copy()
+                self._state_shared = False
+            if trust is not None:
+                state.trust = trust
+            if intent is not None:
+                state.intent = intent
+            if narrative is not None:
+                state.narrative = narrative
+            if commitments is not None:
+                state.commitments = commitments
         
         # Compute and respond to rupture risk
-        self.compute_rupture_risk()
+        self._evaluate(step=True)
     
     def compute_rupture_risk(self) -> float:
         """
         Compute rupture risk from current state.
         
-        MVK uses simple average of inverse primitives.
-        Future versions may use more sophisticated computation.
+        Uses the instance's risk model; the MVK default (MeanRisk) is the
+        simple average of inverse primitives. A stateful model (DecayedRisk)
+        only steps when primitives are written, so here it keeps its
+        current risk.
         
         If risk exceeds threshold:
         1. Emits RUPTURE_DETECTED signal
@@ -137,29 +212,59 @@ class RLP0:
         Returns:
             Current rupture risk [0.0, 1.0]
         """
-        # Simple risk computation: average of (1 - primitive)
+        return self._evaluate(step=not self._risk_model.stateful)
+
+    def _evaluate(self, step: bool) -> float:
+        """Recompute risk if ``step``, then check it against the threshold."""
+        state = self._state
+        if not step:
+            risk = state.rupture_risk
+            self._check_threshold(risk)
+            return risk
+
         # Low primitives = high risk
-        risk = (
-            (1 - self._state.trust) +
-            (1 - self._state.intent) +
-            (1 - self._state.narrative) +
-            (1 - self._state.commitments)
-        ) / 4
+        risk = self._risk(
+            state.trust, state.intent, state.narrative, state.commitments,
+            state.rupture_risk,
+        )
         
         # Update state with computed risk
-        self._state.rupture_risk = risk
-        self._state.last_updated = datetime.now(timezone.utc)
+        state.rupture_risk = risk
+        state.updated_ns = wall_ns()
         
         # Check threshold
-        if risk >= self._rupture_threshold and self._gate.is_open:
-            self._emit_rupture_detected(risk)
-            self._gate.close(
-                reason=f"rupture_risk={risk:.2f} >= threshold={self._rupture_threshold}",
-                rupture_risk=risk
-            )
-            self._state.is_gated = True
+        self._check_threshold(risk)
         
         return risk
+
+    def set_threshold(
+        self,
+        rupture_threshold: float,
+        release_threshold: Optional[float] = None,
+    ) -> bool:
+        """
+        Change the rupture threshold and re-check current risk against it.
+
+        Without ``release_threshold`` the hysteresis band keeps its width.
+
+        Lowering the threshold below current risk emits RUPTURE_DETECTED and
+        closes the gate. Raising it never opens a closed gate; that still
+        requires acknowledge_repair().
+
+        Returns:
+            True if the gate was closed by the new threshold.
+        """
+        if release_threshold is None:
+            band = self._rupture_threshold - self._release_threshold
+            release_threshold = max(0.0, rupture_threshold - band)
+        elif not 0.0 <= release_threshold <= rupture_threshold:
+            raise ValueError(
+                f"release_threshold must be between 0.0 and rupture_threshold "
+                f"({rupture_threshold}), got {release_threshold}"
+            )
+        self._rupture_threshold = rupture_threshold
+        self._release_threshold = release_threshold
+        return self._check_threshold(self._state.rupture_risk)
     
     def acknowledge_repair(self) -> bool:
         """
@@ -173,6 +278,9 @@ class RLP0:
         Returns:
             True if repair was validated and gate released.
             False if not gated, or risk is still above threshold (repair insufficient).
+            Also False, counted as a suppressed transition, if risk is below
+            the rupture threshold but not below release_threshold, or the
+            gate closed less than min_dwell seconds ago.
         """
         if not self.is_gated:
             return False
@@ -187,12 +295,16 @@ class RLP0:
             )
             return False
 
+        if risk >= self._release_threshold or not self._gate.dwell_elapsed():
+            # Recovered, but inside the hysteresis band or too soon after closing
+            self._gate.suppressed += 1
+            return False
+
         self._gate.release(rupture_risk=risk)
         self._state.is_gated = False
 
-        signal = Signal(
-            signal_type=REPAIR_COMPLETE,
-            timestamp=datetime.now(timezone.utc),
+        signal = Signal.now(
+            REPAIR_COMPLETE,
             rupture_risk=risk,
             context=f"Repair validated: risk dropped to {risk:.2f} (threshold {self._rupture_threshold})",
         )
@@ -214,11 +326,25 @@ class RLP0:
     # Internal
     # ─────────────────────────────────────────────────────────────
     
+    def _check_threshold(self, risk: float) -> bool:
+        """Emit and gate if risk is at or above threshold; True if the gate closed."""
+        if risk < self._rupture_threshold or self._gate.is_closed:
+            return False
+        try:
+            self._emit_rupture_detected(risk)
+        finally:
+            # A failing inline subscriber must not leave the gate open
+            self._gate.close(
+                reason=f"rupture_risk={risk:.2f} >= threshold={self._rupture_threshold}",
+                rupture_risk=risk
+            )
+            self._state.is_gated = True
+        return True
+
     def _emit_rupture_detected(self, risk: float) -> None:
         """Emit RUPTURE_DETECTED signal."""
-        signal = Signal(
-            signal_type=RUPTURE_DETECTED,
-            timestamp=datetime.now(timezone.utc),
+        signal = Signal.now(
+            RUPTURE_DETECTED,
             rupture_risk=risk,
             context=f"Rupture risk {risk:.2f} exceeded threshold {self._rupture_threshold}"
         )
@@ -234,7 +360,9 @@ class RLP0:
             'state': self._state.as_dict(),
             'is_gated': self.is_gated,
             'rupture_threshold': self._rupture_threshold,
-            'signal_count': len(self._signal_bus.history),
+            'release_threshold': self._release_threshold,
+            'signal_count': self._signal_bus.emitted,
+            'suppressed_transitions': self._gate.suppressed,
             'gate_history': [
                 {
                     'action': e.action,
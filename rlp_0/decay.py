@@ -0,0 +1,168 @@
+"""
+Time decay - primitives drift toward a baseline while a relationship is quiet
+
+Trust and commitments that are never exercised should not stay at their
+last value forever. With a TimeDecay policy the selected primitives move
+exponentially toward ``baseline`` as time passes since the relationship was
+last written, halving the remaining distance every ``half_life`` seconds.
+
+Decay is never written on a timer. RLP0Manager applies it lazily: reads
+(state, rupture_risk, can_interact) see the decayed values, and the next
+write folds them into the stored state. Because exponential decay composes,
+materializing at any point and decaying on from there gives the same value
+as decaying in one step.
+
+Relationships that nobody touches would never be written, so a gate that
+decay alone should close stays open. RLP0Manager.sweep_decay() finds them:
+it range-scans storage for open relationships that have been quiet for a
+while (an index on (from_id, last_updated)) and writes the decayed state of
+those that crossed the threshold. DecaySweeper runs it on a thread.
+
+Usage
+-----
+    from rlp_0 import RLP0Manager, TimeDecay, DecaySweeper
+
+    mgr = RLP0Manager("agent-a", db_path="rlp.db", thread_safe=True,
+                      decay=TimeDecay(half_life=7 * 86400))
+
+    sweeper = DecaySweeper(mgr, interval=3600)
+    ...
+    sweeper.stop()
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .clock import wall_ns
+from .semantic import RelationalState, _PRIMITIVES, check_primitive
+
+logger = logging.getLogger(__name__)
+
+
+class TimeDecay:
+    """
+    Exponential decay of selected primitives toward a baseline.
+
+    Parameters
+    ----------
+    half_life : float
+        Seconds for a primitive to get halfway to the baseline.
+    baseline : float
+        Value the primitives decay toward (default 0.5).
+    primitives : sequence of str
+        Which primitives decay (default trust and commitments).
+    """
+
+    def __init__(
+        self,
+        half_life: float,
+        baseline: float = 0.5,
+        primitives: Sequence[str] = ("trust", "commitments"),
+    ) -> None:
+        if half_life <= 0:
+            raise ValueError(f"half_life must be positive, got {half_life}")
+        check_primitive("baseline", baseline)
+        unknown = [name for name in primitives if name not in _PRIMITIVES]
+        if unknown:
+            raise ValueError(f"unknown primitives {unknown}; expected some of {_PRIMITIVES}")
+        self.half_life = half_life
+        self.baseline = baseline
+        self.primitives = tuple(primitives)
+        self._half_life_ns = half_life * 1e9
+
+    def factor(self, elapsed_ns: int) -> float:
+        """Fraction of the distance to the baseline left after elapsed_ns."""
+        if elapsed_ns <= 0:
+            return 1.0
+        return 0.5 ** (elapsed_ns / self._half_life_ns)
+
+    def decayed(self, state: RelationalState, at_ns: Optional[int] = None) -> Dict[str, float]:
+        """
+        Decayed values of the selected primitives at ``at_ns`` (default now).
+
+        Returns an empty dict when no time has passed since the state was
+        last updated.
+        """
+        elapsed = (wall_ns() if at_ns is None else at_ns) - state.updated_ns
+        if elapsed <= 0:
+            return {}
+        f = self.factor(elapsed)
+        base = self.baseline
+        return {
+            name: base + (getattr(state, name) - base) * f
+            for name in self.primitives
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"TimeDecay(half_life={self.half_life!r}, baseline={self.baseline!r}, "
+            f"primitives={self.primitives!r})"
+        )
+
+
+class DecaySweeper:
+    """
+    Background thread that calls ``manager.sweep_decay()`` periodically.
+
+    The manager is used from the sweeper thread, so it must be created with
+    ``thread_safe=True``. Relationships whose decayed risk crossed the
+    threshold are written (closing their gates and firing RUPTURE_DETECTED
+    through the manager's callbacks); ``on_crossed`` additionally receives
+    the list of IDs after each sweep that found any.
+
+    Parameters
+    ----------
+    manager : RLP0Manager
+        A thread-safe manager with a decay policy.
+    interval : float
+        Seconds between sweeps.
+    quiet_for : float, optional
+        Only consider relationships not written for this many seconds
+        (default: the decay half-life).
+    on_crossed : callable, optional
+        Called with the list of other_ids found by each non-empty sweep.
+    """
+
+    def __init__(
+        self,
+        manager,
+        interval: float,
+        quiet_for: Optional[float] = None,
+        on_crossed: Optional[Callable[[List[str]], None]] = None,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        if manager._stripes is None:
+            raise ValueError("DecaySweeper requires a manager created with thread_safe=True")
+        if manager.decay is None:
+            raise ValueError("DecaySweeper requires a manager with a decay policy")
+        self._manager = manager
+        self._interval = interval
+        self._quiet_for = quiet_for
+        self._on_crossed = on_crossed
+        self._stop = threading.Event()
+        self.sweeps = 0
+        self.crossed = 0
+        self._thread = threading.Thread(target=self._run, name="rlp0-decay-sweeper", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                crossed = self._manager.sweep_decay(self._quiet_for)
+            except Exception:
+                logger.exception("decay sweep failed")
+                continue
+            self.sweeps += 1
+            self.crossed += len(crossed)
+            if crossed and self._on_crossed is not None:
+                try:
+                    self._on_crossed(crossed)
+                except Exception:
+                    logger.exception("decay sweeper callback %r failed", self._on_crossed)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop sweeping and wait for a sweep in progress to finish."""
+        self._stop.set()
+        self._thread.join(timeout)
@@ -0,0 +1,134 @@
+"""
+Signal dispatch - delivering signals off the caller's thread
+
+By default SignalBus calls every subscriber inline, so a slow subscriber
+stalls update() and a failing one aborts delivery to the rest.
+SignalDispatcher moves delivery onto worker threads:
+
+- every subscriber gets its own bounded queue and worker thread
+- a queue is FIFO with one consumer, so a subscriber sees signals in
+  emission order (and therefore in order per relationship)
+- a subscriber that raises is logged and counted; delivery continues
+- a subscriber that stalls fills only its own queue; further signals for
+  it are dropped and counted instead of blocking the emitter
+
+Usage
+-----
+    dispatcher = SignalDispatcher(queue_size=1024)
+
+    rlp = RLP0(dispatcher=dispatcher)             # per-RLP0 subscribers
+    mgr = RLP0Manager("agent-a", dispatcher=dispatcher,
+                      on_rupture=page_on_call)    # manager callbacks
+
+    dispatcher.flush()    # wait until everything queued was delivered
+    dispatcher.close()
+"""
+
+import logging
+import queue
+import threading
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class _Channel:
+    """Bounded queue plus worker thread for one subscriber."""
+
+    def __init__(self, callback: Callable, queue_size: int) -> None:
+        self.callback = callback
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.delivered = 0
+        self.failed = 0
+        self.dropped = 0
+        name = getattr(callback, "__qualname__", repr(callback))
+        self.thread = threading.Thread(
+            target=self._run, name=f"rlp0-dispatch:{name}", daemon=True,
+        )
+        self.thread.start()
+
+    def _run(self) -> None:
+        q = self.queue
+        while True:
+            args = q.get()
+            try:
+                if args is _STOP:
+                    return
+                try:
+                    self.callback(*args)
+                    self.delivered += 1
+                except Exception:
+                    self.failed += 1
+                    logger.exception("signal subscriber %r failed", self.callback)
+            finally:
+                q.task_done()
+
+
+class SignalDispatcher:
+    """
+    Delivers subscriber calls on per-subscriber worker threads.
+
+    Parameters
+    ----------
+    queue_size : int
+        Bound on undelivered calls per subscriber. When a subscriber's queue
+        is full, new calls for it are dropped and counted.
+    """
+
+    def __init__(self, queue_size: int = 1024) -> None:
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+        self._queue_size = queue_size
+        self._channels: Dict[Callable, _Channel] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def dispatch(self, callback: Callable, *args) -> bool:
+        """
+        Queue ``callback(*args)`` for delivery.
+        Returns False if the subscriber's queue was full and the call dropped.
+        Raises RuntimeError once the dispatcher is closed.
+        """
+        try:
+            # Under the lock so nothing is queued behind close()'s stop marker
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("SignalDispatcher is closed")
+                channel = self._channels.get(callback)
+                if channel is None:
+                    channel = self._channels[callback] = _Channel(callback, self._queue_size)
+                channel.queue.put_nowait(args)
+            return True
+        except queue.Full:
+            channel.dropped += 1
+            logger.warning("signal subscriber %r is backlogged; dropping signal", callback)
+            return False
+
+    def flush(self) -> None:
+        """Block until every queued call has been delivered (or has failed)."""
+        for channel in list(self._channels.values()):
+            channel.queue.join()
+
+    def stats(self) -> Dict[Callable, dict]:
+        """Delivered / failed / dropped / queued counts, keyed by subscriber."""
+        return {
+            callback: {
+                "delivered": channel.delivered,
+                "failed":    channel.failed,
+                "dropped":   channel.dropped,
+                "queued":    channel.queue.qsize(),
+            }
+            for callback, channel in list(self._channels.items())
+        }
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Deliver what is queued, then stop the worker threads."""
+        with self._lock:
+            self._closed = True
+            channels = list(self._channels.values())
+        for channel in channels:
+            channel.queue.put(_STOP)
+        for channel in channels:
+            channel.thread.join(timeout)
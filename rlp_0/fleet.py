@@ -0,0 +1,210 @@
+"""
+Fleet index - incrementally maintained views over many relationships
+
+RLP0Manager answers gated() / at_risk() / healthy() / summary() from this
+index instead of scanning every relationship. The index is updated once per
+changed relationship when a manager call completes.
+
+Structures
+----------
+gated
+    Insertion-ordered set of gated relationship IDs.
+by_risk
+    (rupture_risk, id) pairs kept sorted in buckets of 1-2 thousand, so an
+    update is a bisect over the buckets plus an insert into one of them —
+    O(log n + bucket size) rather than the O(n) of moving a flat list —
+    and "risk >= t" is a bisect followed by a walk: O(log n + k).
+counters
+    At-risk and gated-but-below-threshold counts for the manager threshold,
+    so summary counts are O(1).
+"""
+
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+
+_LOAD = 1000   # target bucket size; buckets split at twice this
+
+
+class _SortedList:
+    """
+    Sorted list of (rupture_risk, id) pairs stored as a list of sorted
+    buckets, each at most 2 * _LOAD long, with each bucket's last item in
+    ``_maxes``. Insert and remove bisect ``_maxes`` and then one bucket.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: List[list] = []
+        self._maxes: list = []
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def add(self, item: tuple) -> None:
+        buckets, maxes = self._buckets, self._maxes
+        self._len += 1
+        if not buckets:
+            buckets.append([item])
+            maxes.append(item)
+            return
+        i = bisect_left(maxes, item)
+        if i == len(maxes):
+            i -= 1
+            bucket = buckets[i]
+            bucket.append(item)
+            maxes[i] = item
+        else:
+            bucket = buckets[i]
+            insort(bucket, item)
+        if len(bucket) > 2 * _LOAD:
+            half = bucket[_LOAD:]
+            del bucket[_LOAD:]
+            buckets.insert(i + 1, half)
+            maxes[i] = bucket[-1]
+            maxes.insert(i + 1, half[-1])
+
+    def remove(self, item: tuple) -> None:
+        """Remove an item known to be present."""
+        buckets, maxes = self._buckets, self._maxes
+        i = bisect_left(maxes, item)
+        bucket = buckets[i]
+        del bucket[bisect_left(bucket, item)]
+        self._len -= 1
+        if not bucket:
+            del buckets[i]
+            del maxes[i]
+        else:
+            maxes[i] = bucket[-1]
+
+    def count_from(self, item: tuple) -> int:
+        """Number of items >= item."""
+        i = bisect_left(self._maxes, item)
+        if i == len(self._maxes):
+            return 0
+        bucket = self._buckets[i]
+        return len(bucket) - bisect_left(bucket, item) + sum(map(len, self._buckets[i + 1:]))
+
+    def below(self, item: tuple) -> Iterator[tuple]:
+        """Items < item, ascending."""
+        for bucket in self._buckets:
+            if bucket[-1] < item:
+                yield from bucket
+                continue
+            yield from bucket[:bisect_left(bucket, item)]
+            return
+
+    def from_top(self, item: tuple = ()) -> Iterator[tuple]:
+        """Items >= item (default: all), descending."""
+        for bucket in reversed(self._buckets):
+            if bucket[0] >= item:
+                yield from reversed(bucket)
+                continue
+            yield from reversed(bucket[bisect_left(bucket, item):])
+            return
+
+
+class FleetIndex:
+    """
+    Gated set plus risk-ordered index over a set of relationships.
+
+    Usage
+    -----
+    index = FleetIndex(threshold=0.6)
+    index.set("agent-b", rupture_risk=0.7, is_gated=True)
+    index.at_risk()          # ["agent-b"]
+    index.counts()           # {"relationships": 1, "gated": 1, ...}
+    """
+
+    def __init__(self, threshold: float) -> None:
+        self._threshold = threshold
+        self._entries: Dict[str, Tuple[float, bool]] = {}
+        self._by_risk = _SortedList()
+        self._gated: Dict[str, None] = {}
+        self._n_at_risk = 0        # risk >= threshold
+        self._n_gated_below = 0    # gated and risk < threshold
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    # ── Maintenance ───────────────────────────────────────────────────────────
+
+    def set(self, key: str, rupture_risk: float, is_gated: bool) -> None:
+        """Insert or update one relationship."""
+        old = self._entries.get(key)
+        if old == (rupture_risk, is_gated):
+            return
+        if old is not None:
+            self._remove(key, *old)
+        self._entries[key] = (rupture_risk, is_gated)
+        self._by_risk.add((rupture_risk, key))
+        if is_gated:
+            self._gated[key] = None
+        self._count(rupture_risk, is_gated, +1)
+
+    def discard(self, key: str) -> None:
+        """Remove a relationship if present."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._remove(key, *old)
+
+    def set_threshold(self, threshold: float) -> None:
+        """Move the counting threshold; O(n / bucket size + gated)."""
+        self._threshold = threshold
+        self._n_at_risk = self._by_risk.count_from((threshold,))
+        self._n_gated_below = sum(
+            1 for key in self._gated if self._entries[key][0] < threshold
+        )
+
+    def _remove(self, key: str, rupture_risk: float, is_gated: bool) -> None:
+        self._by_risk.remove((rupture_risk, key))
+        if is_gated:
+            del self._gated[key]
+        self._count(rupture_risk, is_gated, -1)
+
+    def _count(self, rupture_risk: float, is_gated: bool, delta: int) -> None:
+        if rupture_risk >= self._threshold:
+            self._n_at_risk += delta
+        elif is_gated:
+            self._n_gated_below += delta
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def gated(self) -> List[str]:
+        """IDs of gated relationships, in the order they were gated."""
+        return list(self._gated)
+
+    def at_risk(self, threshold: Optional[float] = None) -> List[str]:
+        """IDs with rupture_risk >= threshold, highest risk first."""
+        t = self._threshold if threshold is None else threshold
+        return [key for _, key in self._by_risk.from_top((t,))]
+
+    def healthy(self) -> List[str]:
+        """IDs that are open and below the threshold."""
+        gated = self._gated
+        return [key for _, key in self._by_risk.below((self._threshold,)) if key not in gated]
+
+    def riskiest(self, k: int) -> List[Tuple[str, float]]:
+        """The k highest-risk (id, rupture_risk) pairs, highest first; O(k)."""
+        if k <= 0:
+            return []
+        return [(key, risk) for risk, key in islice(self._by_risk.from_top(), k)]
+
+    def count_at_risk(self, threshold: Optional[float] = None) -> int:
+        """Number of relationships with rupture_risk >= threshold."""
+        if threshold is None or threshold == self._threshold:
+            return self._n_at_risk
+        return self._by_risk.count_from((threshold,))
+
+    def counts(self) -> dict:
+        """Relationship, gated, at-risk and healthy counts; O(1)."""
+        total = len(self._entries)
+        return {
+            "relationships": total,
+            "healthy":       total - self._n_at_risk - self._n_gated_below,
+            "at_risk":       self._n_at_risk,
+            "gated":         len(self._gated),
+        }
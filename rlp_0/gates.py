@@ -8,13 +8,28 @@ This preserves layering:
 - RLP-0 detects and gates
 - HX/AX repairs
 - RLP-0 validates and releases
+
+A gate can require a minimum dwell time: with ``min_dwell`` set, RLP0
+keeps a closed gate closed for at least that many seconds before releasing
+it, and counts the releases it held back in ``suppressed``. Closing is
+never delayed — risk at or above the threshold always closes the gate — so
+a flapping relationship completes at most one close/release cycle per
+dwell time.
+
+Code blocked on a closed gate can wait for release instead of polling:
+``await gate.wait_open(timeout)`` from asyncio, or
+``gate.wait_until_open(timeout)`` from a thread.
 """
 
+import asyncio
+import threading
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Set, Tuple
 from enum import Enum, auto
 
+from .clock import now_ns, to_datetime, to_ns
+
 
 class GateState(Enum):
     """State of the gate."""
@@ -22,13 +37,107 @@ class GateState(Enum):
     CLOSED = auto()
 
 
-@dataclass
 class GateEvent:
-    """Record of a gate state change."""
-    action: str  # 'closed' or 'released'
-    timestamp: datetime
-    reason: Optional[str] = None
-    rupture_risk_at_event: float = 0.0
+    """
+    Record of a gate state change.
+
+    Slotted, with the timestamp kept as epoch nanoseconds (``timestamp_ns``);
+    the ``timestamp`` datetime is built on access.
+    """
+
+    __slots__ = ("action", "timestamp_ns", "reason", "rupture_risk_at_event")
+
+    def __init__(
+        self,
+        action: str,  # 'closed' or 'released'
+        timestamp: datetime,
+        reason: Optional[str] = None,
+        rupture_risk_at_event: float = 0.0,
+    ) -> None:
+        self.action = action
+        self.timestamp_ns = to_ns(timestamp)
+        self.reason = reason
+        self.rupture_risk_at_event = rupture_risk_at_event
+
+    @classmethod
+    def now(cls, action: str, reason: Optional[str], rupture_risk_at_event: float) -> "GateEvent":
+        """Create an event stamped with the current time."""
+        event = cls.__new__(cls)
+        event.action = action
+        event.timestamp_ns = now_ns()
+        event.reason = reason
+        event.rupture_risk_at_event = rupture_risk_at_event
+        return event
+
+    @property
+    def timestamp(self) -> datetime:
+        return to_datetime(self.timestamp_ns)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            (self.action, self.timestamp_ns, self.reason, self.rupture_risk_at_event) ==
+            (other.action, other.timestamp_ns, other.reason, other.rupture_risk_at_event)
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"GateEvent(action={self.action!r}, timestamp={self.timestamp!r}, "
+            f"reason={self.reason!r}, rupture_risk_at_event={self.rupture_risk_at_event!r})"
+        )
+
+
+class WaiterSet:
+    """
+    asyncio futures waiting for a wake-up, possibly on several event loops.
+
+    Waiters cost one future each — no thread per waiter — and wake_all()
+    may be called from any thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = set()
+
+    def __len__(self) -> int:
+        return len(self._waiters)
+
+    def add(self, loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+        """Register a new waiter on ``loop``. Call with the owner's lock held."""
+        fut = loop.create_future()
+        with self._lock:
+            self._waiters.add((loop, fut))
+        return fut
+
+    def discard(self, loop: asyncio.AbstractEventLoop, fut: asyncio.Future) -> None:
+        with self._lock:
+            self._waiters.discard((loop, fut))
+
+    def wake_all(self) -> None:
+        """Resolve every registered waiter with True."""
+        with self._lock:
+            waiters, self._waiters = self._waiters, set()
+        for loop, fut in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_resolve, fut)
+
+    async def wait(self, fut: asyncio.Future, timeout: Optional[float]) -> bool:
+        """Await a registered future; False on timeout."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(asyncio.shield(fut), timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.discard(loop, fut)
+
+
+def _resolve(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(True)
 
 
 @dataclass
@@ -45,6 +154,18 @@ class Gate:
     closed_at: Optional[datetime] = None
     reason: Optional[str] = None
     history: List[GateEvent] = field(default_factory=list)
+    min_dwell: float = 0.0      # seconds a closed gate stays closed before release
+    changed_ns: int = 0         # time of the last transition; 0 = none yet
+    suppressed: int = 0         # releases held back by dwell or hysteresis
+
+    # Release notification for blocked callers
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    _open_event: threading.Event = field(default_factory=threading.Event, repr=False, compare=False)
+    _waiters: WaiterSet = field(default_factory=WaiterSet, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.state == GateState.OPEN:
+            self._open_event.set()
     
     @property
     def is_open(self) -> bool:
@@ -54,6 +175,12 @@ class Gate:
     def is_closed(self) -> bool:
         return self.state == GateState.CLOSED
     
+    def dwell_elapsed(self) -> bool:
+        """True once the gate has held its current state for min_dwell seconds."""
+        if self.min_dwell <= 0 or not self.changed_ns:
+            return True
+        return now_ns() - self.changed_ns >= self.min_dwell * 1e9
+
     def close(self, reason: str, rupture_risk: float) -> None:
         """
         Close the gate. Blocks until repair.
@@ -62,16 +189,15 @@ class Gate:
         if self.is_closed:
             return  # Already closed
             
-        self.state = GateState.CLOSED
-        self.closed_at = datetime.now(timezone.utc)
+        with self._lock:
+            self.state = GateState.CLOSED
+            self._open_event.clear()
+        event = GateEvent.now('closed', reason, rupture_risk)
+        self.changed_ns = event.timestamp_ns
+        self.closed_at = event.timestamp
         self.reason = reason
         
-        self.history.append(GateEvent(
-            action='closed',
-            timestamp=self.closed_at,
-            reason=reason,
-            rupture_risk_at_event=rupture_risk
-        ))
+        self.history.append(event)
     
     def release(self, rupture_risk: float) -> None:
         """
@@ -81,14 +207,14 @@ class Gate:
         if self.is_open:
             return  # Already open
             
-        self.state = GateState.OPEN
+        with self._lock:
+            self.state = GateState.OPEN
+            self._open_event.set()
+        self._waiters.wake_all()
         
-        self.history.append(GateEvent(
-            action='released',
-            timestamp=datetime.now(timezone.utc),
-            reason='repair_acknowledged',
-            rupture_risk_at_event=rupture_risk
-        ))
+        event = GateEvent.now('released', 'repair_acknowledged', rupture_risk)
+        self.changed_ns = event.timestamp_ns
+        self.history.append(event)
         
         self.closed_at = None
         self.reason = None
@@ -99,3 +225,21 @@ class Gate:
         Returns True if gate is open.
         """
         return self.is_open
+
+    def wait_until_open(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block the calling thread until the gate is open.
+        Returns False if ``timeout`` seconds pass first.
+        """
+        return self._open_event.wait(timeout)
+
+    async def wait_open(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait without blocking the event loop until the gate is open.
+        Returns False if ``timeout`` seconds pass first.
+        """
+        with self._lock:
+            if self.is_open:
+                return True
+            fut = self._waiters.add(asyncio.get_running_loop())
+        return await self._waiters.wait(fut, timeout)
@@ -23,18 +23,152 @@ Usage
     # Scan health of all relationships
     for pair in mgr.at_risk():
         print(f"At risk: {pair}")
+
+Fleet view
+----------
+Resident managers keep a FleetIndex (gated set plus risk-ordered list) that
+is updated as each call completes, so summary() counts are O(1) and
+at_risk(threshold) is O(log n + k).
+
+Lazy loading
+------------
+With ``lazy=True`` the constructor does no storage I/O. A relationship is
+hydrated from storage the first time a call touches it, and fleet queries
+(gated/at_risk/healthy/all_pairs/summary) are answered by storage rather
+than by resident instances.
+
+Bounded residency
+-----------------
+With ``max_resident=N`` at most N relationships are kept in memory, in
+least-recently-used order. Evicted relationships have already been
+persisted and are rehydrated transparently on their next access; their
+in-memory signal/gate history and any subscribers attached directly to
+the evicted RLP0 are dropped. ``cache_stats()`` reports hits, misses and
+evictions. Bounded residency implies lazy loading.
+
+Array backend
+-------------
+``backend="array"`` keeps relationship state in NumPy columns
+(rlp_0.arrays.ArrayStateStore) instead of one RLP0 per relationship.
+The public API is unchanged except that per-relationship calls return an
+ArrayPair view rather than an RLP0, and update_many() evaluates each batch
+with vectorized risk passes. Requires NumPy; not combinable with
+max_resident.
+
+Waiting for repair
+------------------
+``await mgr.wait_can_interact(other_id, timeout)`` suspends until the
+relationship can interact again (e.g. REPAIR_COMPLETE) instead of polling
+can_interact(). Each waiter is one asyncio future, so thousands can wait at
+once; the release may come from any thread.
+
+Time decay
+----------
+``decay=TimeDecay(half_life=...)`` lets primitives (by default trust and
+commitments) drift toward a baseline while a relationship is quiet. Decay
+is computed from last_updated when state(), rupture_risk() or
+can_interact() is called and is only written with the relationship's next
+write. sweep_decay() — or a DecaySweeper thread — finds quiet relationships
+whose decayed risk has crossed the threshold and writes them, closing their
+gates.
+
+Hysteresis and debounce
+-----------------------
+``release_threshold`` (below rupture_threshold) makes acknowledge_repair()
+release a gate only once risk is below it, and ``min_dwell`` keeps a gate
+closed for that many seconds before it may be released. Closing is never
+delayed. A relationship hovering around the threshold then completes at
+most one close/release cycle per dwell time instead of emitting signals
+and history writes on every flip; ``suppressed_transitions`` counts the
+releases held back. Not supported with the array backend.
+
+Thread safety
+-------------
+With ``thread_safe=True`` the manager may be shared by a pool of threads.
+Calls lock only the stripes covering the relationships they touch (one of
+a fixed set of locks, chosen by hash(other_id)), so updates to different
+counterparts run in parallel; fleet-wide calls such as set_threshold()
+take every stripe. Each thread gets its own unit of work, and storage runs
+in group-commit mode so all writes go through its single writer queue;
+writes queued while a commit is in progress share the next one.
+
+Persistence
+-----------
+Every public call runs as one unit of work: state changes, signals and gate
+transitions it produces are gathered per relationship and written once when
+the call returns — one upsert plus one history row per distinct change type.
 """
 
+import asyncio
 import logging
-from typing import Callable, Dict, List, Optional, Tuple
-
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+from .arrays import ArrayStateStore
+from .clock import to_datetime, wall_ns
 from .core import RLP0
-from .semantic import RelationalState
-from .signals import Signal
+from .decay import TimeDecay
+from .dispatch import SignalDispatcher
+from .fleet import FleetIndex
+from .gates import WaiterSet
+from .risk import DEFAULT_RISK_MODEL, RiskModel
+from .semantic import RelationalState, check_primitives
+from .signals import Signal, RUPTURE_DETECTED, REPAIR_COMPLETE
 from .storage import RelationalStorage
 
 logger = logging.getLogger(__name__)
 
+_LOCK_STRIPES = 64
+# RelationalStorage keywords the manager sets itself
+_MANAGED_STORAGE_OPTIONS = ("db_path", "group_commit", "max_delay")
+
+
+class UpdateResult(NamedTuple):
+    """Outcome of one item in RLP0Manager.update_many()."""
+    other_id: str
+    rupture_risk: float
+    is_gated: bool
+    transition: Optional[str]   # "closed" if this update closed the gate, else None
+
+
+class _UnitOfWork:
+    """Changes gathered during one public manager call, written on exit."""
+
+    __slots__ = ("depth", "events", "pending", "spilled")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.events = 0
+        # other_id -> distinct change types, in order of first occurrence
+        self.pending: Dict[str, List[str]] = {}
+        # (other_id, signal) pushed out of full in-memory signal histories
+        self.spilled: List[Tuple[str, Signal]] = []
+
+    def record(self, other_id: str, change_type: str) -> None:
+        self.events += 1
+        types = self.pending.setdefault(other_id, [])
+        if change_type not in types:
+            types.append(change_type)
+
+    def spill(self, other_id: str, signal: Signal) -> None:
+        self.spilled.append((other_id, signal))
+
+
+class _ThreadUnitOfWork(threading.local):
+    """_UnitOfWork kept per thread, for thread-safe managers."""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.events = 0
+        self.pending: Dict[str, List[str]] = {}
+        self.spilled: List[Tuple[str, Signal]] = []
+
+    record = _UnitOfWork.record
+    spill = _UnitOfWork.spill
+
 
 class RLP0Manager:
     """
@@ -52,6 +186,40 @@ class RLP0Manager:
         Called with (other_agent_id, Signal) whenever RUPTURE_DETECTED fires.
     on_repair : callable, optional
         Called with (other_agent_id, Signal) whenever REPAIR_COMPLETE fires.
+    lazy : bool
+        Skip the startup restore; hydrate relationships on first access and
+        answer fleet queries from storage.
+    max_resident : int, optional
+        Keep at most this many relationships in memory (LRU); implies lazy.
+    backend : str
+        "object" (default): one RLP0 per relationship.
+        "array": NumPy struct-of-arrays engine for large fleets.
+    signal_capacity : int, optional
+        Keep at most this many signals in memory per relationship.
+    spill_signals : bool
+        Log signals pushed out of a full history to storage (signal_log),
+        in the same transaction as the call's state writes.
+    dispatcher : SignalDispatcher, optional
+        Deliver on_rupture / on_repair on worker threads instead of inline.
+        The caller owns it and closes it.
+    thread_safe : bool
+        Allow concurrent calls from several threads (striped locking).
+        Not supported with the array backend.
+    risk_model : RiskModel, optional
+        How rupture risk is computed for every relationship (see
+        rlp_0.risk; default MeanRisk).
+    decay : TimeDecay, optional
+        Let primitives decay toward a baseline while a relationship is
+        quiet (see rlp_0.decay).
+    release_threshold : float, optional
+        Hysteresis: risk must drop below this (default rupture_threshold)
+        before acknowledge_repair() releases a gate.
+    min_dwell : float
+        Seconds a gate must stay closed before it may be released.
+    storage_options : mapping, optional
+        Extra RelationalStorage keywords, e.g. ``PERFORMANCE_PROFILE`` for
+        WAL journaling and a read-connection pool. db_path, group_commit
+        and max_delay are set by the manager and rejected here.
     """
 
     def __init__(
@@ -61,53 +229,306 @@ class RLP0Manager:
         db_path: str = ":memory:",
         on_rupture: Optional[Callable[[str, Signal], None]] = None,
         on_repair:  Optional[Callable[[str, Signal], None]] = None,
+        lazy:       bool = False,
+        max_resident: Optional[int] = None,
+        backend:    str = "object",
+        signal_capacity: Optional[int] = None,
+        spill_signals:   bool = False,
+        dispatcher:      Optional[SignalDispatcher] = None,
+        thread_safe:     bool = False,
+        risk_model:      Optional[RiskModel] = None,
+        decay:           Optional[TimeDecay] = None,
+        release_threshold: Optional[float] = None,
+        min_dwell:       float = 0.0,
+        storage_options: Optional[Mapping[str, object]] = None,
     ) -> None:
+        if max_resident is not None and max_resident < 1:
+            raise ValueError(f"max_resident must be at least 1, got {max_resident}")
+        if backend not in ("object", "array"):
+            raise ValueError(f"backend must be 'object' or 'array', got {backend!r}")
+        if backend == "array" and max_resident is not None:
+            raise ValueError("max_resident is not supported with the array backend")
+        if backend == "array" and thread_safe:
+            raise ValueError("thread_safe is not supported with the array backend")
+        if backend == "array" and (release_threshold is not None or min_dwell):
+            raise ValueError(
+                "release_threshold and min_dwell are not supported with the array backend"
+            )
+        if release_threshold is None:
+            release_threshold = rupture_threshold
+        if not 0.0 <= release_threshold <= rupture_threshold:
+            raise ValueError(
+                f"release_threshold must be between 0.0 and rupture_threshold "
+                f"({rupture_threshold}), got {release_threshold}"
+            )
+        if min_dwell < 0:
+            raise ValueError(f"min_dwell must be non-negative, got {min_dwell}")
+        managed = [k for k in _MANAGED_STORAGE_OPTIONS if k in (storage_options or {})]
+        if managed:
+            raise ValueError(
+                f"storage_options may not set {', '.join(managed)}; the manager sets "
+                f"db_path (pass it directly), group_commit (thread_safe) and max_delay"
+            )
+
         self.agent_id         = agent_id
         self._threshold       = rupture_threshold
-        self._storage         = RelationalStorage(db_path)
+        self._release_threshold = release_threshold
+        self._min_dwell       = min_dwell
+        self._storage         = RelationalStorage(
+            db_path, group_commit=thread_safe, max_delay=0.0, **(storage_options or {}),
+        )
         self._on_rupture      = on_rupture
         self._on_repair       = on_repair
-        self._pairs: Dict[str, RLP0] = {}
-
-        # Restore from storage
-        for from_id, to_id in self._storage.all_pairs():
-            if from_id == self.agent_id:
-                state = self._storage.load(from_id, to_id)
-                if state:
-                    self._pairs[to_id] = self._make_rlp(to_id, state)
+        self._signal_capacity = signal_capacity
+        self._spill_signals   = spill_signals
+        self._dispatcher      = dispatcher
+        self._risk_model      = risk_model
+        self._risk            = (risk_model or DEFAULT_RISK_MODEL).scalar
+        self.decay            = decay
+        self._store: Optional[ArrayStateStore] = None
+        if backend == "array":
+            self._store = ArrayStateStore(
+                rupture_threshold, on_signal=self._handle_signal, risk_model=risk_model,
+            )
+            self._pairs: Dict[str, RLP0] = self._store.pairs
+        else:
+            self._pairs = OrderedDict() if max_resident else {}
+        self._uow             = _ThreadUnitOfWork() if thread_safe else _UnitOfWork()
+        # Thread-safe mode: per-relationship lock stripes, plus locks for
+        # the shared residency map and fleet index
+        self._stripes: Optional[List[threading.RLock]] = None
+        self._pairs_lock = self._fleet_lock = nullcontext()
+        if thread_safe:
+            self._stripes = [threading.RLock() for _ in range(_LOCK_STRIPES)]
+            self._pairs_lock = threading.Lock()
+            self._fleet_lock = threading.Lock()
+        self._writes_saved    = 0
+        self._lazy            = lazy or max_resident is not None
+        self._max_resident    = max_resident
+        self._hits            = 0
+        self._misses          = 0
+        self._evictions       = 0
+        self._suppressed_evicted = 0   # suppressed transitions of evicted pairs
+        self._waiters_lock    = threading.Lock()
+        self._gate_waiters: Dict[str, WaiterSet] = {}
+        # Fleet views for resident fleets; lazy managers ask storage instead
+        self._index: Optional[FleetIndex] = None
+        if not self._lazy:
+            self._index = self._store if self._store is not None else FleetIndex(rupture_threshold)
+
+        if self._lazy:
+            return
+
+        # Restore this agent's relationships in one streamed query
+        for to_id, state in self._storage.iter_states(self.agent_id):
+            self._pairs[to_id] = self._make_rlp(to_id, state)
+            self._index.set(to_id, state.rupture_risk, state.is_gated)
 
     # ── Internal ──────────────────────────────────────────────────────────────
 
     def _make_rlp(self, other_id: str, state: Optional[RelationalState] = None) -> RLP0:
+        if self._store is not None:
+            return self._store.add(other_id, state)
+
+        spill = None
+        if self._spill_signals:
+            # Written to signal_log with the rest of the current call
+            spill = lambda signal: self._uow.spill(other_id, signal)
         rlp = RLP0(
             rupture_threshold=self._threshold,
             state=state,
+            signal_capacity=self._signal_capacity,
+            signal_spill=spill,
+            risk_model=self._risk_model,
+            release_threshold=self._release_threshold,
+            min_dwell=self._min_dwell,
         )
+        rlp.subscribe(lambda signal: self._handle_signal(other_id, signal))
+        return rlp
 
-        def _on_signal(signal: Signal) -> None:
-            from .signals import RUPTURE_DETECTED, REPAIR_COMPLETE
-            if signal.signal_type == RUPTURE_DETECTED and self._on_rupture:
-                self._on_rupture(other_id, signal)
-            elif signal.signal_type == REPAIR_COMPLETE and self._on_repair:
-                self._on_repair(other_id, signal)
-            # Persist after every signal (state changed)
-            self._storage.save(
-                self.agent_id, other_id, rlp.state,
-                change_type=signal.signal_type.name.lower(),
-            )
+    def _handle_signal(self, other_id: str, signal: Signal) -> None:
+        # State changed — persisted when the current call completes
+        self._uow.record(other_id, signal.signal_type.name.lower())
+        if signal.signal_type == RUPTURE_DETECTED:
+            callback = self._on_rupture
+        elif signal.signal_type == REPAIR_COMPLETE:
+            callback = self._on_repair
+        else:
+            callback = None
+        if callback is None:
+            return
+        if self._dispatcher is not None:
+            self._dispatcher.dispatch(callback, other_id, signal)
+        else:
+            callback(other_id, signal)
 
-        rlp.subscribe(_on_signal)
+    def _get_or_create(self, other_id: str) -> RLP0:
+        # The caller holds other_id's stripe, so no other thread can create
+        # or evict this relationship meanwhile.
+        with self._pairs_lock:
+            rlp = self._pairs.get(other_id)
+            if rlp is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                if self._max_resident:
+                    self._pairs.move_to_end(other_id)
+        if rlp is not None:
+            if self._store is None:
+                # Catch up on a set_threshold() that skipped this relationship
+                self._sync_threshold(rlp)
+            return rlp
+        state = self._load(other_id) if self._lazy else None
+        rlp = self._make_rlp(other_id, state)
+        with self._pairs_lock:
+            self._pairs[other_id] = rlp
+        if state is None:
+            self._uow.record(other_id, "created")
         return rlp
 
-    def _get_or_create(self, other_id: str) -> RLP0:
-        if other_id not in self._pairs:
-            self._pairs[other_id] = self._make_rlp(other_id)
-            self._storage.save(
-                self.agent_id, other_id,
-                self._pairs[other_id].state,
-                change_type="created",
-            )
-        return self._pairs[other_id]
+    def _sync_threshold(self, rlp: RLP0) -> None:
+        """Give rlp the manager's thresholds if set_threshold() skipped it."""
+        if (rlp.rupture_threshold != self._threshold
+                or rlp.release_threshold != self._release_threshold):
+            rlp.set_threshold(self._threshold, self._release_threshold)
+
+    def _decayed(self, state: RelationalState) -> Optional[RelationalState]:
+        """
+        ``state`` with decay up to now applied and risk re-evaluated, or
+        None if there is nothing to apply. The copy keeps the original
+        last_updated, which decay is measured from.
+        """
+        if self.decay is None:
+            return None
+        values = self.decay.decayed(state)
+        if not values:
+            return None
+        view = state.copy()
+        for name, value in values.items():
+            setattr(view, name, value)
+        view.rupture_risk = self._risk(
+            view.trust, view.intent, view.narrative, view.commitments, state.rupture_risk,
+        )
+        return view
+
+    def _with_decay(self, rlp: RLP0, primitives: Mapping[str, Optional[float]]) -> dict:
+        """Fold decay accrued since rlp's last write into an update of it."""
+        values = self.decay.decayed(rlp.state)
+        values.update((name, v) for name, v in primitives.items() if v is not None)
+        return values
+
+    def _materialize_decay(self, other_id: str, rlp: RLP0, uow: _UnitOfWork) -> None:
+        """Write decay accrued since rlp's last write into its state."""
+        if self.decay is None:
+            return
+        values = self.decay.decayed(rlp.state)
+        if values:
+            rlp.update_state(**values)
+            uow.record(other_id, "decay")
+
+    def _stripe(self, other_id: str) -> threading.RLock:
+        return self._stripes[hash(other_id) % _LOCK_STRIPES]
+
+    @contextmanager
+    def _unit_of_work(
+        self,
+        other_ids: Iterable[str] = (),
+        fleet: bool = False,
+    ) -> Iterator[_UnitOfWork]:
+        """
+        Scope one public call; the outermost scope writes what was recorded.
+
+        In thread-safe mode the scope first takes the lock stripes for
+        ``other_ids`` (every stripe if ``fleet``), in a fixed order, and
+        holds them until the write is done.
+        """
+        locks: List[threading.RLock] = []
+        if self._stripes is not None:
+            if fleet:
+                locks = self._stripes
+            else:
+                locks = [self._stripes[i] for i in sorted(
+                    {hash(other_id) % _LOCK_STRIPES for other_id in other_ids}
+                )]
+            for lock in locks:
+                lock.acquire()
+        uow = self._uow
+        uow.depth += 1
+        try:
+            yield uow
+        finally:
+            uow.depth -= 1
+            try:
+                if uow.depth == 0:
+                    if uow.pending or uow.spilled:
+                        self._commit(uow)
+                    if self._max_resident and len(self._pairs) > self._max_resident:
+                        self._evict()
+            finally:
+                for lock in reversed(locks):
+                    lock.release()
+
+    def _commit(self, uow: _UnitOfWork) -> None:
+        pending, events, spilled = uow.pending, uow.events, uow.spilled
+        uow.pending, uow.events, uow.spilled = {}, 0, []
+        with self._fleet_lock:
+            self._writes_saved += events - len(pending)
+            if self._index is not None:
+                for other_id in pending:
+                    rlp = self._pairs[other_id]
+                    self._index.set(other_id, rlp.rupture_risk, rlp.is_gated)
+        self._persist(
+            [
+                (self.agent_id, other_id, self._pairs[other_id].state, types)
+                for other_id, types in pending.items()
+            ],
+            [(self.agent_id, other_id, signal) for other_id, signal in spilled],
+        )
+        if self._gate_waiters:
+            self._wake_waiters(pending)
+
+    def _wake_waiters(self, other_ids: Iterable[str]) -> None:
+        """Wake wait_can_interact() callers on any of ``other_ids`` that can now interact."""
+        for other_id in other_ids:
+            with self._waiters_lock:
+                waiters = self._gate_waiters.get(other_id)
+                if waiters is None or not self._interactable(self._pairs[other_id]):
+                    continue
+                del self._gate_waiters[other_id]
+            waiters.wake_all()
+
+    def _load(self, other_id: str) -> Optional[RelationalState]:
+        """Read one relationship for hydration; overridden by AsyncRLP0Manager."""
+        return self._storage.load(self.agent_id, other_id)
+
+    def _persist(self, items: List[tuple], signals: List[tuple]) -> None:
+        """Write one unit of work; overridden by AsyncRLP0Manager."""
+        done = self._storage.save_many(items, signals)
+        if done is not None:
+            done.result()   # group commit: wait until the batch is durable
+
+    def _evict(self) -> None:
+        """Drop least-recently-used relationships; their state is already persisted."""
+        if self._stripes is None:
+            while len(self._pairs) > self._max_resident:
+                _, rlp = self._pairs.popitem(last=False)
+                self._suppressed_evicted += rlp.suppressed_transitions
+                self._evictions += 1
+            return
+        # Skip relationships another thread is working on (stripe held)
+        with self._pairs_lock:
+            excess = len(self._pairs) - self._max_resident
+            victims = []
+            for other_id in self._pairs:
+                if len(victims) == excess:
+                    break
+                lock = self._stripe(other_id)
+                if lock.acquire(blocking=False):
+                    victims.append((other_id, lock))
+            for other_id, lock in victims:
+                self._suppressed_evicted += self._pairs.pop(other_id).suppressed_transitions
+                lock.release()
+            self._evictions += len(victims)
 
     # ── Public API ────────────────────────────────────────────────────────────
 
@@ -123,18 +544,71 @@ class RLP0Manager:
         Update relational primitives for a specific relationship.
         Persists the new state and fires signals if rupture threshold is crossed.
 
-        Returns the RLP0 instance for the pair.
+        Returns the RLP0 instance for the pair (an ArrayPair view with the
+        array backend).
         """
-        rlp = self._get_or_create(other_id)
-        rlp.update_state(
-            trust=trust,
-            intent=intent,
-            narrative=narrative,
-            commitments=commitments,
-        )
-        self._storage.save(self.agent_id, other_id, rlp.state)
+        with self._unit_of_work((other_id,)) as uow:
+            rlp = self._get_or_create(other_id)
+            if self.decay is None:
+                rlp.update_state(
+                    trust=trust,
+                    intent=intent,
+                    narrative=narrative,
+                    commitments=commitments,
+                )
+            else:
+                rlp.update_state(**self._with_decay(rlp, {
+                    "trust": trust, "intent": intent,
+                    "narrative": narrative, "commitments": commitments,
+                }))
+            uow.record(other_id, "update")
         return rlp
 
+    def update_many(
+        self,
+        updates: Iterable[Tuple[str, Mapping[str, float]]],
+    ) -> List[UpdateResult]:
+        """
+        Apply a batch of primitive updates as one unit of work.
+
+        Each item is ``(other_id, {"trust": ..., "intent": ...})``. Risk and
+        gate transitions are computed and signals fired in input order; all
+        touched relationships are then written in a single transaction.
+        Every item is validated first: a bad one raises TypeError or
+        ValueError before any item is applied.
+
+        Returns one UpdateResult per item.
+        """
+        results: List[UpdateResult] = []
+        updates = list(updates)
+        for _, primitives in updates:
+            check_primitives(primitives)
+        with self._unit_of_work(other_id for other_id, _ in updates) as uow:
+            if self._store is not None:
+                pairs = [self._get_or_create(other_id) for other_id, _ in updates]
+                primitives = [p for _, p in updates]
+                if self.decay is not None:
+                    primitives = [self._with_decay(pair, p) for pair, p in zip(pairs, primitives)]
+                outcomes = self._store.apply_batch([pair.row for pair in pairs], primitives)
+                for (other_id, _), outcome in zip(updates, outcomes):
+                    uow.record(other_id, "update")
+                    results.append(UpdateResult(other_id, *outcome))
+                return results
+
+            for other_id, primitives in updates:
+                rlp = self._get_or_create(other_id)
+                was_gated = rlp.is_gated
+                if self.decay is not None:
+                    primitives = self._with_decay(rlp, primitives)
+                rlp.update_state(**primitives)
+                uow.record(other_id, "update")
+                gated = rlp.is_gated
+                results.append(UpdateResult(
+                    other_id, rlp.rupture_risk, gated,
+                    "closed" if gated and not was_gated else None,
+                ))
+        return results
+
     def acknowledge_repair(self, other_id: str) -> bool:
         """
         Acknowledge repair for a specific relationship.
@@ -142,65 +616,287 @@ class RLP0Manager:
 
         Returns True if gate was released, False if insufficient repair.
         """
-        rlp = self._get_or_create(other_id)
-        released = rlp.acknowledge_repair()
-        if released:
-            self._storage.save(
-                self.agent_id, other_id, rlp.state,
-                change_type="repair_complete",
-            )
+        with self._unit_of_work((other_id,)) as uow:
+            rlp = self._get_or_create(other_id)
+            self._materialize_decay(other_id, rlp, uow)
+            released = rlp.acknowledge_repair()
+            if released:
+                uow.record(other_id, "repair_complete")
         return released
 
+    def set_threshold(self, rupture_threshold: float) -> List[str]:
+        """
+        Change the rupture threshold for every managed relationship.
+
+        Open relationships whose current risk is at or above the new
+        threshold are gated and emit RUPTURE_DETECTED; all of them are
+        persisted in one write. Raising the threshold does not open closed
+        gates — that still requires acknowledge_repair().
+
+        With a resident fleet, only relationships the fleet index places at
+        or above the new threshold are visited (O(log n + k)); the others
+        take the new thresholds the next time they are used. A lazy manager
+        checks each resident relationship (O(resident)).
+
+        Returns the IDs of newly gated relationships.
+        """
+        if not 0.0 <= rupture_threshold <= 1.0:
+            raise ValueError(
+                f"rupture_threshold must be between 0.0 and 1.0, got {rupture_threshold}"
+            )
+        with self._unit_of_work(fleet=True):
+            # Keep the hysteresis band width, as RLP0.set_threshold() does
+            band = self._threshold - self._release_threshold
+            self._threshold = rupture_threshold
+            self._release_threshold = max(0.0, rupture_threshold - band)
+            if self._lazy:
+                # Bring in stored relationships that are about to cross
+                missing = [
+                    to for _, to in self._storage.at_risk_pairs(
+                        rupture_threshold, self.agent_id, gated=False,
+                    )
+                    if to not in self._pairs
+                ]
+                for to_id, state in self._storage.load_many(self.agent_id, missing).items():
+                    rlp = self._make_rlp(to_id, state)
+                    with self._pairs_lock:
+                        self._misses += 1
+                        self._pairs[to_id] = rlp
+
+            if self._index is not None:
+                with self._fleet_lock:
+                    self._index.set_threshold(rupture_threshold)
+            if self._store is not None:
+                return self._store.reevaluate(rupture_threshold)
+            if self._index is not None:
+                candidates = self._index.at_risk(rupture_threshold)
+            else:
+                candidates = list(self._pairs)
+            return [
+                other_id for other_id in candidates
+                if self._pairs[other_id].set_threshold(rupture_threshold, self._release_threshold)
+            ]
+
     def can_interact(self, other_id: str) -> bool:
-        """Return True if the relationship gate is open (not gated)."""
-        return self._get_or_create(other_id).check_gate()
+        """
+        Return True if the relationship gate is open (not gated).
+
+        With a decay policy, also False once the decayed risk has reached
+        the threshold, even before a write closes the gate.
+        """
+        with self._unit_of_work((other_id,)):
+            return self._interactable(self._get_or_create(other_id))
+
+    def _interactable(self, rlp) -> bool:
+        """Gate open and, with a decay policy, decayed risk under the threshold."""
+        if not rlp.check_gate():
+            return False
+        view = self._decayed(rlp.state) if self.decay is not None else None
+        return view is None or view.rupture_risk < self._threshold
+
+    async def wait_can_interact(self, other_id: str, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the relationship gate is open, without blocking the event loop.
+
+        Returns True immediately if can_interact() is, otherwise once a
+        committed call leaves the relationship interactable — a release by
+        acknowledge_repair(), or with a decay policy an update that brings
+        decayed risk back under the threshold. Returns False if ``timeout``
+        seconds pass first.
+        """
+        # Same lock order as a release: stripe, then waiter registry
+        with self._unit_of_work((other_id,)), self._waiters_lock:
+            if self.can_interact(other_id):
+                return True
+            waiters = self._gate_waiters.get(other_id)
+            if waiters is None:
+                waiters = self._gate_waiters[other_id] = WaiterSet()
+            fut = waiters.add(asyncio.get_running_loop())
+        try:
+            return await waiters.wait(fut, timeout)
+        finally:
+            with self._waiters_lock:
+                if not waiters and self._gate_waiters.get(other_id) is waiters:
+                    del self._gate_waiters[other_id]
 
     def state(self, other_id: str) -> RelationalState:
-        """Return current relational state for a pair."""
-        return self._get_or_create(other_id).state
+        """Return current relational state for a pair (decayed up to now)."""
+        with self._unit_of_work((other_id,)):
+            state = self._get_or_create(other_id).state
+            view = self._decayed(state)
+            return state if view is None else view
 
     def rupture_risk(self, other_id: str) -> float:
-        """Return current rupture risk for a pair."""
-        return self._get_or_create(other_id).rupture_risk
+        """Return current rupture risk for a pair (decayed up to now)."""
+        with self._unit_of_work((other_id,)):
+            rlp = self._get_or_create(other_id)
+            if self.decay is None:
+                return rlp.rupture_risk
+            view = self._decayed(rlp.state)
+            return rlp.rupture_risk if view is None else view.rupture_risk
 
     def is_gated(self, other_id: str) -> bool:
         """Return True if the pair is currently gated."""
-        return self._get_or_create(other_id).is_gated
+        with self._unit_of_work((other_id,)):
+            return self._get_or_create(other_id).is_gated
+
+    def sweep_decay(self, quiet_for: Optional[float] = None, materialize: bool = True) -> List[str]:
+        """
+        Find open relationships whose decayed risk has reached the threshold.
+
+        Candidates are the open relationships not written for at least
+        ``quiet_for`` seconds (default: one decay half-life), read with a
+        range scan on the (from_id, last_updated) index rather than a scan
+        of every relationship. With ``materialize`` the decayed state of each
+        one found is written, which closes its gate and fires
+        RUPTURE_DETECTED.
+
+        Returns the IDs found.
+        """
+        if self.decay is None:
+            raise ValueError("sweep_decay requires a manager with a decay policy")
+        quiet = self.decay.half_life if quiet_for is None else quiet_for
+        cutoff = to_datetime(wall_ns() - int(quiet * 1e9))
+        # Collect first: materializing writes to the table being scanned
+        candidates = list(self._storage.quiet_states(self.agent_id, cutoff))
+        crossed: List[str] = []
+        for other_id, stored in candidates:
+            with self._unit_of_work((other_id,)) as uow:
+                with self._pairs_lock:
+                    rlp = self._pairs.get(other_id)
+                state = stored if rlp is None else rlp.state
+                if state.is_gated:
+                    continue
+                view = self._decayed(state)
+                if view is None or view.rupture_risk < self._threshold:
+                    continue
+                crossed.append(other_id)
+                if materialize:
+                    if rlp is None:
+                        rlp = self._get_or_create(other_id)
+                    self._materialize_decay(other_id, rlp, uow)
+        return crossed
 
     def history(self, other_id: str, limit: int = 50) -> list:
         """Return state change history for a relationship."""
         return self._storage.history(self.agent_id, other_id, limit=limit)
 
+    def iter_history(
+        self,
+        other_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        before_id: Optional[int] = None,
+        batch: int = 500,
+    ) -> Iterator[dict]:
+        """
+        Stream state change history for a relationship, newest first.
+
+        See RelationalStorage.iter_history(); pass the ``id`` of the last
+        entry seen as ``before_id`` to continue from it.
+        """
+        return self._storage.iter_history(
+            self.agent_id, other_id, since=since, until=until, before_id=before_id, batch=batch,
+        )
+
+    def rollups(
+        self,
+        other_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[dict]:
+        """Return rolled-up history buckets for a relationship, oldest first."""
+        return self._storage.rollups(self.agent_id, other_id, since=since, until=until)
+
+    def compact_history(self, keep: float, bucket: float = 3600.0, **kwargs) -> int:
+        """
+        Roll history older than ``keep`` seconds into ``bucket``-second
+        rollups; see RelationalStorage.compact_history(). Covers every
+        relationship in the database, not only this agent's.
+        """
+        return self._storage.compact_history(keep, bucket, **kwargs)
+
+    def signal_log(self, other_id: str, limit: int = 50) -> list:
+        """Return signals spilled to storage for a relationship, newest first."""
+        return self._storage.signal_log(self.agent_id, other_id, limit=limit)
+
     # ── Fleet view ────────────────────────────────────────────────────────────
 
     def gated(self) -> List[str]:
         """Return IDs of all currently gated relationships."""
-        return [aid for aid, rlp in self._pairs.items() if rlp.is_gated]
+        if self._lazy:
+            return [to for _, to in self._storage.gated_pairs(self.agent_id)]
+        with self._fleet_lock:
+            return self._index.gated()
 
     def at_risk(self, threshold: Optional[float] = None) -> List[str]:
         """Return IDs of relationships at or above the rupture risk threshold."""
         t = threshold if threshold is not None else self._threshold
-        return [aid for aid, rlp in self._pairs.items() if rlp.rupture_risk >= t]
+        if self._lazy:
+            return [to for _, to in self._storage.at_risk_pairs(t, self.agent_id)]
+        with self._fleet_lock:
+            return self._index.at_risk(t)
 
     def healthy(self) -> List[str]:
         """Return IDs of relationships that are open and below risk threshold."""
-        return [
-            aid for aid, rlp in self._pairs.items()
-            if not rlp.is_gated and rlp.rupture_risk < self._threshold
-        ]
+        if self._lazy:
+            return [to for _, to in self._storage.healthy_pairs(self._threshold, self.agent_id)]
+        with self._fleet_lock:
+            return self._index.healthy()
+
+    def riskiest(self, k: int = 10) -> List[Tuple[str, float]]:
+        """Return the k (other_id, rupture_risk) pairs closest to rupture, highest first."""
+        if self._lazy:
+            return [(to, risk) for _, to, risk in self._storage.riskiest(k, self.agent_id)]
+        with self._fleet_lock:
+            return self._index.riskiest(k)
 
     def all_pairs(self) -> List[str]:
         """Return IDs of all tracked relationships."""
-        return list(self._pairs.keys())
+        if self._lazy:
+            return [to for _, to in self._storage.all_pairs(self.agent_id)]
+        with self._pairs_lock:
+            return list(self._pairs.keys())
+
+    @property
+    def writes_saved(self) -> int:
+        """Storage writes avoided by coalescing each call into one write per pair."""
+        return self._writes_saved
+
+    @property
+    def suppressed_transitions(self) -> int:
+        """Gate releases held back by min_dwell or the hysteresis band, fleet-wide."""
+        if self._store is not None:
+            return 0
+        with self._pairs_lock:
+            resident = sum(rlp.suppressed_transitions for rlp in self._pairs.values())
+        return self._suppressed_evicted + resident
+
+    def cache_stats(self) -> dict:
+        """Return residency hit/miss/eviction counts for sizing max_resident."""
+        lookups = self._hits + self._misses
+        return {
+            "resident":      len(self._pairs),
+            "max_resident":  self._max_resident,
+            "hits":          self._hits,
+            "misses":        self._misses,
+            "evictions":     self._evictions,
+            "hit_rate":      self._hits / lookups if lookups else 0.0,
+        }
 
     def summary(self) -> dict:
         """Return an observability snapshot across all relationships."""
+        if self._lazy:
+            counts = self._storage.fleet_counts(self._threshold, self.agent_id)
+        else:
+            with self._fleet_lock:
+                counts = self._index.counts()
         return {
             "agent_id":       self.agent_id,
-            "relationships":  len(self._pairs),
-            "healthy":        len(self.healthy()),
-            "at_risk":        len(self.at_risk()),
-            "gated":          len(self.gated()),
+            "relationships":  counts["relationships"],
+            "healthy":        counts["healthy"],
+            "at_risk":        counts["at_risk"],
+            "gated":          counts["gated"],
             "threshold":      self._threshold,
         }
 
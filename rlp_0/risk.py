@@ -0,0 +1,173 @@
+"""
+Risk models - how rupture risk is computed from the four primitives
+
+RLP-0's default is the unweighted mean of ``1 - primitive``. Deployments
+that weigh primitives differently, react to the weakest primitive, or want
+risk to move gradually pick another model:
+
+    MeanRisk()                       mean of (1 - p)              (default)
+    WeightedRisk(trust=3, intent=1)  weighted mean of (1 - p)
+    MaxRisk()                        max of (1 - p): the weakest primitive
+    DecayedRisk(alpha=0.3)           EMA of another model's risk
+
+Each model is compiled once into two plain functions of
+``(trust, intent, narrative, commitments, previous_risk)`` with its
+parameters baked in as constants: ``scalar`` for floats (RLP0 and single
+rows) and ``vector`` for NumPy columns (batch and fleet evaluation). The
+hot path calls the function directly — no per-call dispatch on the model.
+
+Usage
+-----
+    from rlp_0 import RLP0Manager
+    from rlp_0.risk import WeightedRisk
+
+    mgr = RLP0Manager("agent-a", risk_model=WeightedRisk(trust=2.0))
+"""
+
+from typing import Callable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+RiskFunction = Callable[[float, float, float, float, float], float]
+
+_ARGS = "t, i, n, c, prev"
+
+
+def _compile(expression: str, namespace: dict) -> RiskFunction:
+    source = f"def risk({_ARGS}):\n    return {expression}\n"
+    scope = dict(namespace)
+    exec(compile(source, "<rlp_0.risk>", "exec"), scope)
+    return scope["risk"]
+
+
+class RiskModel:
+    """
+    Base class for rupture-risk models.
+
+    Subclasses implement ``expression(vector)``: a Python expression over
+    ``t, i, n, c`` (the primitives) and ``prev`` (the previous risk) that
+    evaluates to a risk in [0.0, 1.0]. With ``vector=True`` the names are
+    NumPy arrays and ``np`` is available.
+
+    A model whose risk depends on ``prev`` sets ``stateful = True``. Its
+    risk then moves one step per primitive write only; re-evaluating
+    without a write (compute_rupture_risk(), acknowledge_repair()) keeps
+    the current risk.
+    """
+
+    stateful = False
+
+    def expression(self, vector: bool) -> str:
+        raise NotImplementedError
+
+    @property
+    def scalar(self) -> RiskFunction:
+        """Compiled ``risk(trust, intent, narrative, commitments, prev) -> float``."""
+        fn = self.__dict__.get("_scalar")
+        if fn is None:
+            fn = self.__dict__["_scalar"] = _compile(self.expression(False), {})
+        return fn
+
+    @property
+    def vector(self) -> Callable:
+        """Compiled NumPy variant of ``scalar``, elementwise over arrays."""
+        fn = self.__dict__.get("_vector")
+        if fn is None:
+            if np is None:
+                raise ImportError(
+                    "vectorized risk models require numpy; "
+                    "install it with `pip install rlp-0[fast]`"
+                )
+            fn = self.__dict__["_vector"] = _compile(self.expression(True), {"np": np})
+        return fn
+
+    def __call__(
+        self,
+        trust: float,
+        intent: float,
+        narrative: float,
+        commitments: float,
+        previous_risk: float = 0.0,
+    ) -> float:
+        return self.scalar(trust, intent, narrative, commitments, previous_risk)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class MeanRisk(RiskModel):
+    """Unweighted mean of (1 - primitive); the RLP-0 default."""
+
+    def expression(self, vector: bool) -> str:
+        return "((1 - t) + (1 - i) + (1 - n) + (1 - c)) / 4"
+
+
+class WeightedRisk(RiskModel):
+    """
+    Weighted mean of (1 - primitive).
+
+    Weights are relative; they are normalized to sum to 1.
+    """
+
+    def __init__(
+        self,
+        trust: float = 1.0,
+        intent: float = 1.0,
+        narrative: float = 1.0,
+        commitments: float = 1.0,
+    ) -> None:
+        weights = (trust, intent, narrative, commitments)
+        if any(w < 0 for w in weights) or sum(weights) <= 0:
+            raise ValueError(f"weights must be non-negative with a positive sum, got {weights}")
+        total = sum(weights)
+        self.weights = tuple(w / total for w in weights)
+
+    def expression(self, vector: bool) -> str:
+        wt, wi, wn, wc = (repr(w) for w in self.weights)
+        return f"{wt} * (1 - t) + {wi} * (1 - i) + {wn} * (1 - n) + {wc} * (1 - c)"
+
+    def __repr__(self) -> str:
+        wt, wi, wn, wc = self.weights
+        return f"WeightedRisk(trust={wt:g}, intent={wi:g}, narrative={wn:g}, commitments={wc:g})"
+
+
+class MaxRisk(RiskModel):
+    """Risk of the weakest primitive: max of (1 - primitive)."""
+
+    def expression(self, vector: bool) -> str:
+        # max(1 - p) == 1 - min(p) exactly, with three fewer subtractions
+        if vector:
+            return "1 - np.minimum(np.minimum(t, i), np.minimum(n, c))"
+        return "1 - min(t, i, n, c)"
+
+
+class DecayedRisk(RiskModel):
+    """
+    Exponentially decayed risk: ``alpha * base + (1 - alpha) * previous``.
+
+    Each primitive write moves risk a fraction ``alpha`` of the way towards
+    the base model's instantaneous risk, so one bad exchange raises it only
+    partly and recovery is gradual too.
+    """
+
+    stateful = True
+
+    def __init__(self, alpha: float = 0.5, base: Optional[RiskModel] = None) -> None:
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"alpha must be in (0.0, 1.0], got {alpha}")
+        self.alpha = alpha
+        self.base = base if base is not None else MeanRisk()
+
+    def expression(self, vector: bool) -> str:
+        a = repr(self.alpha)
+        keep = repr(1 - self.alpha)
+        return f"{a} * ({self.base.expression(vector)}) + {keep} * prev"
+
+    def __repr__(self) -> str:
+        return f"DecayedRisk(alpha={self.alpha!r}, base={self.base!r})"
+
+
+DEFAULT_RISK_MODEL = MeanRisk()
@@ -8,53 +8,131 @@ Defines what a relationship means through four primitives:
 - commitments: accountability signal
 """
 
-from dataclasses import dataclass, field
-from typing import Optional
-from datetime import datetime, timezone
+from datetime import datetime
+from typing import Mapping, Optional
+
+from .clock import to_datetime, to_ns, wall_ns
+
+_PRIMITIVES = ('trust', 'intent', 'narrative', 'commitments')
+_PRIMITIVE_SET = frozenset(_PRIMITIVES)
+
+
+def check_primitive(name: str, value: float) -> None:
+    """Raise ValueError unless value is within [0.0, 1.0]."""
+    if not 0.0 <= value <= 1.0:
+        raise ValueError(f"{name} must be between 0.0 and 1.0, got {value}")
+
+
+def check_primitives(values: Mapping[str, Optional[float]]) -> None:
+    """Raise TypeError for unknown names, ValueError for out-of-range values."""
+    unknown = values.keys() - _PRIMITIVE_SET
+    if unknown:
+        raise TypeError(f"unknown primitive(s): {', '.join(sorted(unknown))}")
+    for name, value in values.items():
+        if value is not None:
+            check_primitive(name, value)
 
 
-@dataclass
 class RelationalState:
     """
     The four primitives that constitute relational state.
     
     Each primitive is a float [0.0, 1.0] representing current level.
+
+    Slotted, with ``last_updated`` kept as epoch nanoseconds
+    (``updated_ns``); the ``last_updated`` datetime is built on access.
     """
+
+    __slots__ = (
+        'trust',          # confidence signal
+        'intent',         # directional signal
+        'narrative',      # coherence signal
+        'commitments',    # accountability signal
+        'rupture_risk',   # computed state
+        'is_gated',
+        'updated_ns',     # last_updated, epoch nanoseconds (UTC)
+    )
+
+    def __init__(
+        self,
+        trust: float = 1.0,
+        intent: float = 1.0,
+        narrative: float = 1.0,
+        commitments: float = 1.0,
+        rupture_risk: float = 0.0,
+        last_updated: Optional[datetime] = None,
+        is_gated: bool = False,
+    ) -> None:
+        self.trust = trust
+        self.intent = intent
+        self.narrative = narrative
+        self.commitments = commitments
+        self.rupture_risk = rupture_risk
+        self.updated_ns = wall_ns() if last_updated is None else to_ns(last_updated)
+        self.is_gated = is_gated
+        self._validate()
     
-    # The four primitives
-    trust: float = 1.0           # confidence signal
-    intent: float = 1.0          # directional signal  
-    narrative: float = 1.0       # coherence signal
-    commitments: float = 1.0     # accountability signal
-    
-    # Computed state
-    rupture_risk: float = 0.0
-    
-    # Metadata
-    last_updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    is_gated: bool = False
-    
-    def __post_init__(self):
+    def _validate(self) -> None:
         """Validate primitives are in valid range."""
-        for primitive in ['trust', 'intent', 'narrative', 'commitments']:
-            value = getattr(self, primitive)
-            if not 0.0 <= value <= 1.0:
-                raise ValueError(f"{primitive} must be between 0.0 and 1.0, got {value}")
+        for primitive in _PRIMITIVES:
+            check_primitive(primitive, getattr(self, primitive))
+
+    def copy(self) -> 'RelationalState':
+        """Return an independent copy (no re-validation)."""
+        new = RelationalState.__new__(RelationalState)
+        new.trust = self.trust
+        new.intent = self.intent
+        new.narrative = self.narrative
+        new.commitments = self.commitments
+        new.rupture_risk = self.rupture_risk
+        new.is_gated = self.is_gated
+        new.updated_ns = self.updated_ns
+        return new
+
+    @property
+    def last_updated(self) -> datetime:
+        return to_datetime(self.updated_ns)
+
+    @last_updated.setter
+    def last_updated(self, value: datetime) -> None:
+        self.updated_ns = to_ns(value)
+
+    def _key(self) -> tuple:
+        return (
+            self.trust, self.intent, self.narrative, self.commitments,
+            self.rupture_risk, self.updated_ns, self.is_gated,
+        )
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None  # mutable, like the dataclass it replaces
+
+    def __repr__(self) -> str:
+        return (
+            f"RelationalState(trust={self.trust!r}, intent={self.intent!r}, "
+            f"narrative={self.narrative!r}, commitments={self.commitments!r}, "
+            f"rupture_risk={self.rupture_risk!r}, last_updated={self.last_updated!r}, "
+            f"is_gated={self.is_gated!r})"
+        )
     
     def update(self, **kwargs) -> 'RelationalState':
         """
         Update primitives and return new state.
         Immutable - returns new instance.
         """
-        new_values = {
-            'trust': kwargs.get('trust', self.trust),
-            'intent': kwargs.get('intent', self.intent),
-            'narrative': kwargs.get('narrative', self.narrative),
-            'commitments': kwargs.get('commitments', self.commitments),
-            'rupture_risk': self.rupture_risk,
-            'is_gated': self.is_gated,
+        changed = {
+            name: kwargs[name] for name in _PRIMITIVES if name in kwargs
         }
-        return RelationalState(**new_values)
+        for name, value in changed.items():
+            check_primitive(name, value)
+        new = self.copy()
+        for name, value in changed.items():
+            setattr(new, name, value)
+        new.updated_ns = wall_ns()
+        return new
     
     def as_dict(self) -> dict:
         """Return state as dictionary."""
@@ -7,10 +7,17 @@ It can emit signals but cannot perform actions.
 Signals nudge upward; they don't speak upward.
 """
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from collections import deque
+from collections.abc import Sequence
+from datetime import datetime
 from enum import Enum, auto
-from typing import Optional, Callable, List
+from itertools import islice
+from typing import TYPE_CHECKING, Deque, Iterator, Optional, Callable, List
+
+from .clock import to_datetime, to_ns, wall_ns
+
+if TYPE_CHECKING:
+    from .dispatch import SignalDispatcher
 
 
 class SignalType(Enum):
@@ -19,18 +26,69 @@ class SignalType(Enum):
     REPAIR_COMPLETE  = auto()
 
 
-@dataclass
 class Signal:
     """
     A signal emitted by RLP-0.
     
     Signals are observations, not commands.
     Expression protocols decide how to respond.
+
+    Slotted, with the timestamp kept as epoch nanoseconds (``timestamp_ns``);
+    the ``timestamp`` datetime is built on access.
     """
-    signal_type: SignalType
-    timestamp: datetime
-    rupture_risk: float
-    context: Optional[str] = None
+
+    __slots__ = ("signal_type", "timestamp_ns", "rupture_risk", "context")
+
+    def __init__(
+        self,
+        signal_type: SignalType,
+        timestamp: datetime,
+        rupture_risk: float,
+        context: Optional[str] = None,
+    ) -> None:
+        self.signal_type = signal_type
+        self.timestamp_ns = to_ns(timestamp)
+        self.rupture_risk = rupture_risk
+        self.context = context
+
+    @classmethod
+    def now(
+        cls,
+        signal_type: SignalType,
+        rupture_risk: float,
+        context: Optional[str] = None,
+    ) -> "Signal":
+        """Create a signal stamped with the current time."""
+        signal = cls.__new__(cls)
+        signal.signal_type = signal_type
+        signal.timestamp_ns = wall_ns()
+        signal.rupture_risk = rupture_risk
+        signal.context = context
+        return signal
+
+    @property
+    def timestamp(self) -> datetime:
+        return to_datetime(self.timestamp_ns)
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self.timestamp_ns = to_ns(value)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            (self.signal_type, self.timestamp_ns, self.rupture_risk, self.context) ==
+            (other.signal_type, other.timestamp_ns, other.rupture_risk, other.context)
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Signal(signal_type={self.signal_type!r}, timestamp={self.timestamp!r}, "
+            f"rupture_risk={self.rupture_risk!r}, context={self.context!r})"
+        )
     
     def __str__(self) -> str:
         return f"[{self.signal_type.name}] risk={self.rupture_risk:.2f} at {self.timestamp.isoformat()}"
@@ -40,15 +98,72 @@ RUPTURE_DETECTED = SignalType.RUPTURE_DETECTED
 REPAIR_COMPLETE  = SignalType.REPAIR_COMPLETE
 
 
+class SignalHistory(Sequence):
+    """
+    Read-only, zero-copy view of a SignalBus history, oldest first.
+
+    Reflects later emissions; use list(view) for a snapshot.
+    """
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self, buffer: Deque[Signal]):
+        self._buffer = buffer
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __iter__(self) -> Iterator[Signal]:
+        return iter(self._buffer)
+
+    def __reversed__(self) -> Iterator[Signal]:
+        return reversed(self._buffer)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._buffer))
+            if step == 1:
+                return list(islice(self._buffer, start, stop))
+            return [self._buffer[i] for i in range(start, stop, step)]
+        return self._buffer[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (SignalHistory, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SignalHistory({list(self._buffer)!r})"
+
+
 class SignalBus:
     """
     Simple signal bus for RLP-0 to emit signals.
     Expression protocols subscribe to receive signals.
+
+    History is kept in a ring buffer. With ``capacity`` set, the oldest
+    signal is dropped when the buffer is full — after being handed to
+    ``spill`` if given (e.g. RelationalStorage.log_signal), so full history
+    stays queryable without staying resident.
+
+    Subscribers are called inline unless a ``dispatcher``
+    (rlp_0.dispatch.SignalDispatcher) is given, in which case each
+    subscriber is fed from its own queue on a worker thread.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        spill: Optional[Callable[[Signal], None]] = None,
+        dispatcher: Optional["SignalDispatcher"] = None,
+    ):
+        if capacity is not None and capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
         self._subscribers: List[Callable[[Signal], None]] = []
-        self._history: List[Signal] = []
+        self._history: Deque[Signal] = deque(maxlen=capacity)
+        self._spill = spill
+        self._dispatcher = dispatcher
+        self._emitted = 0
     
     def subscribe(self, callback: Callable[[Signal], None]) -> None:
         """Subscribe to receive signals."""
@@ -61,11 +176,29 @@ class SignalBus:
     
     def emit(self, signal: Signal) -> None:
         """Emit a signal to all subscribers."""
-        self._history.append(signal)
+        history = self._history
+        if self._spill is not None and len(history) == history.maxlen:
+            self._spill(history[0])
+        history.append(signal)
+        self._emitted += 1
+        if self._dispatcher is not None:
+            for subscriber in self._subscribers:
+                self._dispatcher.dispatch(subscriber, signal)
+            return
         for subscriber in self._subscribers:
             subscriber(signal)
     
     @property
-    def history(self) -> List[Signal]:
-        """Return signal history."""
-        return self._history.copy()
+    def history(self) -> SignalHistory:
+        """Resident signal history (zero-copy view), oldest first."""
+        return SignalHistory(self._history)
+
+    @property
+    def capacity(self) -> Optional[int]:
+        """Ring buffer size; None if unbounded."""
+        return self._history.maxlen
+
+    @property
+    def emitted(self) -> int:
+        """Total signals emitted, including those no longer resident."""
+        return self._emitted
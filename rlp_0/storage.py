@@ -9,6 +9,11 @@ distributed ledger, file system) can replace it without changing RLP-0's meaning
 
 Tables
 ------
+agents
+    Interns agent ids: one row per distinct id, giving it an integer key.
+    Every other table refers to agents by that key, so a long id string is
+    stored once rather than on every row and in every index entry.
+
 relationships
     One row per (from_id, to_id) pair — current relational state.
     Upserted on every update_state() call.
@@ -16,38 +21,123 @@ relationships
 state_history
     Append-only log of every state change — basis for drift detection,
     audit trails, and future trust inference.
+
+history_rollups
+    Per-pair time buckets summarizing state_history entries that
+    compact_history() has rolled up.
+
+signal_log
+    Signals spilled out of bounded in-memory SignalBus histories.
+
+The API takes and returns agent ids as strings; RelationalStorage keeps an
+in-process name -> key cache, so interning costs a dictionary lookup once
+an id has been seen.
+
+Timestamps (last_updated, recorded_at, emitted_at) are stored as integer
+microseconds since the Unix epoch (UTC): writes do no string formatting,
+loads no parsing, and time-range scans compare integers. history() and
+signal_log() still return ISO 8601 strings.
+
+Schema versions
+---------------
+The schema version is kept in ``PRAGMA user_version``:
+
+    0   TEXT agent ids on every row, ISO 8601 timestamps
+    2   interned agent ids, ISO 8601 timestamps
+    3   interned agent ids, integer microsecond timestamps (new databases)
+
+Version 0 databases are migrated to version 2 in place, in one
+transaction, the first time they are opened. Version 2 databases are used
+as they are — timestamps are read through a layer that accepts either
+form, and new rows are written in the database's own form, so ordering and
+range scans stay consistent. upgrade_timestamps() converts one to version
+3. Neither migration shrinks the file; run VACUUM afterwards to reclaim
+the space.
+
+Group commit
+------------
+By default every save() commits its own transaction. With
+``group_commit=True`` saves are queued instead, and a single writer thread
+flushes them in one transaction once ``max_batch`` saves are waiting or
+``max_delay`` seconds have passed since the first one; saves already queued
+at that point join the batch. save() then returns
+a Future that resolves when the write is durable.
+
+Retention
+---------
+Every update adds a state_history row, so left alone the table grows
+without bound. compact_history(keep, bucket) keeps entries from the last
+``keep`` seconds at full resolution and rolls older ones into per-pair
+buckets: entry count, min/max/mean/last of each primitive and of
+rupture_risk, and counts of gate transitions. rupture_detected and
+repair_complete entries are never deleted. It works through the table a
+chunk per transaction, remembering where it stopped, so it can run
+repeatedly (e.g. from a scheduler) without holding up writes.
+
+Performance profile
+-------------------
+By default one connection in rollback-journal mode serves reads and
+writes alike, so dashboard reads wait behind commits. The opt-in profile
+
+    RelationalStorage("rlp.db", **PERFORMANCE_PROFILE)
+
+turns on WAL journaling, ``synchronous=NORMAL`` (durable across process
+crashes; a power loss may drop the last commits), a memory-mapped read path
+and a larger page cache, and serves reads from a pool of read-only
+connections. In WAL mode readers see the last committed state without
+blocking the writer and the writer never waits for them. Each setting can
+also be passed on its own. In-memory databases cannot be shared across
+connections, so there reads stay on the writer connection.
 """
 
 import sqlite3
 import json
 import logging
-from datetime import datetime, timezone
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime
+from contextlib import contextmanager, nullcontext
+from itertools import takewhile
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from .clock import to_datetime, to_ns, wall_ns
 from .semantic import RelationalState
+from .signals import Signal
 
 logger = logging.getLogger(__name__)
 
-_SCHEMA = """
+SCHEMA_VERSION = 3
+_ISO_TIME_VERSION = 2     # last version with ISO 8601 TEXT timestamps
+
+# {time} is the timestamp column type: INTEGER (epoch microseconds) or
+# TEXT (ISO 8601, version 2 databases)
+_TABLES = """
+CREATE TABLE IF NOT EXISTS agents (
+    id              INTEGER PRIMARY KEY,
+    name            TEXT NOT NULL UNIQUE
+);
+
 CREATE TABLE IF NOT EXISTS relationships (
-    from_id         TEXT NOT NULL,
-    to_id           TEXT NOT NULL,
+    from_id         INTEGER NOT NULL,       -- agents.id
+    to_id           INTEGER NOT NULL,       -- agents.id
     trust           REAL NOT NULL DEFAULT 1.0,
     intent          REAL NOT NULL DEFAULT 1.0,
     narrative       REAL NOT NULL DEFAULT 1.0,
     commitments     REAL NOT NULL DEFAULT 1.0,
     rupture_risk    REAL NOT NULL DEFAULT 0.0,
     is_gated        INTEGER NOT NULL DEFAULT 0,
-    last_updated    TEXT NOT NULL,
+    last_updated    {time} NOT NULL,
     PRIMARY KEY (from_id, to_id)
-);
+) WITHOUT ROWID;
 
 CREATE TABLE IF NOT EXISTS state_history (
     id              INTEGER PRIMARY KEY AUTOINCREMENT,
-    from_id         TEXT NOT NULL,
-    to_id           TEXT NOT NULL,
-    recorded_at     TEXT NOT NULL,
+    from_id         INTEGER NOT NULL,
+    to_id           INTEGER NOT NULL,
+    recorded_at     {time} NOT NULL,
     trust           REAL NOT NULL,
     intent          REAL NOT NULL,
     narrative       REAL NOT NULL,
@@ -58,10 +148,345 @@ CREATE TABLE IF NOT EXISTS state_history (
     notes           TEXT
 );
 
+CREATE TABLE IF NOT EXISTS signal_log (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    from_id         INTEGER NOT NULL,
+    to_id           INTEGER NOT NULL,
+    signal_type     TEXT NOT NULL,
+    emitted_at      {time} NOT NULL,
+    rupture_risk    REAL NOT NULL,
+    context         TEXT
+);
+"""
+
+_INDEXES = """
 CREATE INDEX IF NOT EXISTS idx_history_pair
     ON state_history (from_id, to_id, recorded_at);
+
+CREATE INDEX IF NOT EXISTS idx_signal_log_pair
+    ON signal_log (from_id, to_id, emitted_at);
+
+CREATE INDEX IF NOT EXISTS idx_relationships_risk
+    ON relationships (from_id, rupture_risk DESC);
+
+CREATE INDEX IF NOT EXISTS idx_relationships_global_risk
+    ON relationships (rupture_risk DESC);
+
+CREATE INDEX IF NOT EXISTS idx_relationships_quiet
+    ON relationships (from_id, last_updated);
+"""
+
+# Retention (compact_history). Additive, so created on open at any schema
+# version; bucket times are integer epoch microseconds in every version.
+_ROLLUP_FIELDS = ("trust", "intent", "narrative", "commitments", "rupture_risk")
+
+_RETENTION_TABLES = """
+CREATE TABLE IF NOT EXISTS history_rollups (
+    from_id             INTEGER NOT NULL,
+    to_id               INTEGER NOT NULL,
+    bucket_start        INTEGER NOT NULL,   -- epoch microseconds
+    bucket_end          INTEGER NOT NULL,   -- exclusive
+    entries             INTEGER NOT NULL,
+    last_at             INTEGER NOT NULL,   -- newest entry rolled in
+    trust_min           REAL NOT NULL,
+    trust_max           REAL NOT NULL,
+    trust_mean          REAL NOT NULL,
+    trust_last          REAL NOT NULL,
+    intent_min          REAL NOT NULL,
+    intent_max          REAL NOT NULL,
+    intent_mean         REAL NOT NULL,
+    intent_last         REAL NOT NULL,
+    narrative_min       REAL NOT NULL,
+    narrative_max       REAL NOT NULL,
+    narrative_mean      REAL NOT NULL,
+    narrative_last      REAL NOT NULL,
+    commitments_min     REAL NOT NULL,
+    commitments_max     REAL NOT NULL,
+    commitments_mean    REAL NOT NULL,
+    commitments_last    REAL NOT NULL,
+    rupture_risk_min    REAL NOT NULL,
+    rupture_risk_max    REAL NOT NULL,
+    rupture_risk_mean   REAL NOT NULL,
+    rupture_risk_last   REAL NOT NULL,
+    is_gated_last       INTEGER NOT NULL,
+    ruptures            INTEGER NOT NULL,   -- rupture_detected entries
+    repairs             INTEGER NOT NULL,   -- repair_complete entries
+    PRIMARY KEY (from_id, to_id, bucket_start)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS retention (
+    id                  INTEGER PRIMARY KEY CHECK (id = 1),
+    compacted_through   INTEGER NOT NULL    -- state_history.id
+);
+"""
+
+# Change types compact_history() never deletes
+_PRESERVED = ("rupture_detected", "repair_complete")
+
+_ROLLUP_COLUMNS = (
+    ("from_id", "to_id", "bucket_start", "bucket_end", "entries", "last_at")
+    + tuple(f"{name}_{stat}" for name in _ROLLUP_FIELDS for stat in ("min", "max", "mean", "last"))
+    + ("is_gated_last", "ruptures", "repairs")
+)
+
+_UPSERT_ROLLUP = (
+    f"INSERT OR REPLACE INTO history_rollups ({', '.join(_ROLLUP_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_ROLLUP_COLUMNS))})"
+)
+
+# Version 0 -> 2: TEXT agent ids on every row -> integer keys into agents.
+# Old tables are renamed aside, copied across through agents, then dropped.
+# The original schema had no signal_log, so an empty one is created first.
+_MIGRATE_INTERN_AGENTS = """
+CREATE TABLE IF NOT EXISTS signal_log (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    from_id         TEXT NOT NULL,
+    to_id           TEXT NOT NULL,
+    signal_type     TEXT NOT NULL,
+    emitted_at      TEXT NOT NULL,
+    rupture_risk    REAL NOT NULL,
+    context         TEXT
+);
+DROP INDEX IF EXISTS idx_history_pair;
+DROP INDEX IF EXISTS idx_signal_log_pair;
+DROP INDEX IF EXISTS idx_relationships_risk;
+DROP INDEX IF EXISTS idx_relationships_global_risk;
+DROP INDEX IF EXISTS idx_relationships_quiet;
+ALTER TABLE relationships RENAME TO _v0_relationships;
+ALTER TABLE state_history RENAME TO _v0_state_history;
+ALTER TABLE signal_log    RENAME TO _v0_signal_log;
+""" + _TABLES.format(time="TEXT") + """
+INSERT OR IGNORE INTO agents (name)
+    SELECT from_id FROM _v0_relationships UNION SELECT to_id FROM _v0_relationships
+    UNION SELECT from_id FROM _v0_state_history UNION SELECT to_id FROM _v0_state_history
+    UNION SELECT from_id FROM _v0_signal_log UNION SELECT to_id FROM _v0_signal_log;
+
+INSERT INTO relationships
+    SELECT f.id, t.id, r.trust, r.intent, r.narrative, r.commitments,
+           r.rupture_risk, r.is_gated, r.last_updated
+    FROM _v0_relationships r
+    JOIN agents f ON f.name = r.from_id
+    JOIN agents t ON t.name = r.to_id;
+
+INSERT INTO state_history
+    SELECT h.id, f.id, t.id, h.recorded_at, h.trust, h.intent, h.narrative,
+           h.commitments, h.rupture_risk, h.is_gated, h.change_type, h.notes
+    FROM _v0_state_history h
+    JOIN agents f ON f.name = h.from_id
+    JOIN agents t ON t.name = h.to_id
+    ORDER BY h.id;
+
+INSERT INTO signal_log
+    SELECT g.id, f.id, t.id, g.signal_type, g.emitted_at, g.rupture_risk, g.context
+    FROM _v0_signal_log g
+    JOIN agents f ON f.name = g.from_id
+    JOIN agents t ON t.name = g.to_id
+    ORDER BY g.id;
+
+DROP TABLE _v0_relationships;
+DROP TABLE _v0_state_history;
+DROP TABLE _v0_signal_log;
 """
 
+# Version 2 -> 3: ISO 8601 TEXT timestamps -> integer epoch microseconds,
+# converted by the iso_to_us() function registered on the connection
+_MIGRATE_INTEGER_TIME = """
+DROP INDEX IF EXISTS idx_history_pair;
+DROP INDEX IF EXISTS idx_signal_log_pair;
+DROP INDEX IF EXISTS idx_relationships_risk;
+DROP INDEX IF EXISTS idx_relationships_global_risk;
+DROP INDEX IF EXISTS idx_relationships_quiet;
+ALTER TABLE relationships RENAME TO _v2_relationships;
+ALTER TABLE state_history RENAME TO _v2_state_history;
+ALTER TABLE signal_log    RENAME TO _v2_signal_log;
+""" + _TABLES.format(time="INTEGER") + """
+INSERT INTO relationships
+    SELECT from_id, to_id, trust, intent, narrative, commitments,
+           rupture_risk, is_gated, iso_to_us(last_updated)
+    FROM _v2_relationships;
+
+INSERT INTO state_history
+    SELECT id, from_id, to_id, iso_to_us(recorded_at), trust, intent, narrative,
+           commitments, rupture_risk, is_gated, change_type, notes
+    FROM _v2_state_history ORDER BY id;
+
+INSERT INTO signal_log
+    SELECT id, from_id, to_id, signal_type, iso_to_us(emitted_at), rupture_risk, context
+    FROM _v2_signal_log ORDER BY id;
+
+DROP TABLE _v2_relationships;
+DROP TABLE _v2_state_history;
+DROP TABLE _v2_signal_log;
+"""
+
+# (from_name, to_name) for relationship rows aliased r
+_PAIR_NAMES = """
+SELECT f.name AS from_id, t.name AS to_id FROM relationships r
+JOIN agents f ON f.id = r.from_id
+JOIN agents t ON t.id = r.to_id
+"""
+
+# Every relationships column, plus the counterpart's name as to_name
+_STATES = """
+SELECT r.*, t.name AS to_name FROM relationships r
+JOIN agents t ON t.id = r.to_id
+"""
+
+
+_UPSERT = """
+INSERT INTO relationships
+    (from_id, to_id, trust, intent, narrative, commitments,
+     rupture_risk, is_gated, last_updated)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (from_id, to_id) DO UPDATE SET
+    trust        = excluded.trust,
+    intent       = excluded.intent,
+    narrative    = excluded.narrative,
+    commitments  = excluded.commitments,
+    rupture_risk = excluded.rupture_risk,
+    is_gated     = excluded.is_gated,
+    last_updated = excluded.last_updated
+"""
+
+_INSERT_HISTORY = """
+INSERT INTO state_history
+    (from_id, to_id, recorded_at, trust, intent, narrative,
+     commitments, rupture_risk, is_gated, change_type, notes)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_SIGNAL = """
+INSERT INTO signal_log
+    (from_id, to_id, signal_type, emitted_at, rupture_risk, context)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Host parameters per IN (...) chunk; stays under SQLite's historical 999 limit
+_MAX_PARAMS = 500
+
+_SYNCHRONOUS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# Opt-in tuning for file databases with concurrent readers; see module docstring
+PERFORMANCE_PROFILE = {
+    "wal":         True,
+    "synchronous": "NORMAL",
+    "mmap_size":   256 * 1024 * 1024,
+    "cache_size":  -64 * 1024,         # negative: KiB, i.e. 64 MiB
+    "readers":     4,
+}
+
+# Writer-queue control markers
+_FLUSH = object()
+_STOP  = object()
+
+_NO_LOCK = nullcontext()
+
+
+def _iso_to_us(value):
+    """ISO 8601 timestamp -> epoch microseconds (integers pass through)."""
+    if value is None or isinstance(value, int):
+        return value
+    return to_ns(datetime.fromisoformat(value)) // 1000
+
+
+def _time_ns(value) -> int:
+    """
+    Stored timestamp -> epoch nanoseconds. Accepts both integer microseconds
+    and ISO 8601 text, so version 2 databases read like version 3 ones.
+    """
+    if isinstance(value, int):
+        return value * 1000
+    return to_ns(datetime.fromisoformat(value))
+
+
+def _time_iso(value) -> str:
+    """Stored timestamp -> ISO 8601 string, as history() has always returned."""
+    if isinstance(value, int):
+        return to_datetime(value * 1000).isoformat()
+    return value
+
+
+def _rows(
+    from_id: str,
+    to_id: str,
+    state: RelationalState,
+    change_type: str,
+    notes: Optional[str],
+    now,
+) -> Tuple[tuple, tuple]:
+    """Snapshot a save at stored timestamp ``now`` into (relationships, state_history) rows."""
+    prims = (
+        state.trust, state.intent, state.narrative, state.commitments,
+        state.rupture_risk, int(state.is_gated),
+    )
+    return (
+        (from_id, to_id) + prims + (now,),
+        (from_id, to_id, now) + prims + (change_type, notes),
+    )
+
+
+def _to_state(row: sqlite3.Row) -> RelationalState:
+    # Stored values were validated when saved; build without re-validating
+    state = RelationalState.__new__(RelationalState)
+    state.trust        = row["trust"]
+    state.intent       = row["intent"]
+    state.narrative    = row["narrative"]
+    state.commitments  = row["commitments"]
+    state.rupture_risk = row["rupture_risk"]
+    state.is_gated     = bool(row["is_gated"])
+    state.updated_ns   = _time_ns(row["last_updated"])
+    return state
+
+
+def _new_bucket(from_key: int, to_key: int, start: int, width: int) -> dict:
+    """Empty rollup bucket for [start, start + width) epoch microseconds."""
+    bucket = {
+        "from_id": from_key, "to_id": to_key,
+        "bucket_start": start, "bucket_end": start + width,
+        "entries": 0, "last_at": -1, "is_gated_last": 0, "ruptures": 0, "repairs": 0,
+    }
+    for name in _ROLLUP_FIELDS:
+        bucket[f"{name}_min"] = float("inf")
+        bucket[f"{name}_max"] = float("-inf")
+        bucket[f"{name}_mean"] = 0.0
+        bucket[f"{name}_last"] = 0.0
+    return bucket
+
+
+def _roll_in(bucket: dict, row: sqlite3.Row, at: int) -> None:
+    """Fold one state_history row, recorded at epoch microseconds ``at``, into a bucket."""
+    n = bucket["entries"] + 1
+    newest = at >= bucket["last_at"]
+    for name in _ROLLUP_FIELDS:
+        value = row[name]
+        if value < bucket[f"{name}_min"]:
+            bucket[f"{name}_min"] = value
+        if value > bucket[f"{name}_max"]:
+            bucket[f"{name}_max"] = value
+        bucket[f"{name}_mean"] += (value - bucket[f"{name}_mean"]) / n
+        if newest:
+            bucket[f"{name}_last"] = value
+    if newest:
+        bucket["last_at"] = at
+        bucket["is_gated_last"] = row["is_gated"]
+    bucket["entries"] = n
+    change_type = row["change_type"]
+    if change_type == "rupture_detected":
+        bucket["ruptures"] += 1
+    elif change_type == "repair_complete":
+        bucket["repairs"] += 1
+
+
+def _scope(from_key: Optional[int], *conditions: str) -> Tuple[str, tuple]:
+    """Build a WHERE clause (over alias r) that optionally restricts to one from_id key."""
+    clauses = list(conditions)
+    params: tuple = ()
+    if from_key is not None:
+        clauses.insert(0, "r.from_id = ?")
+        params = (from_key,)
+    where = " WHERE " + " AND ".join(clauses) if clauses else ""
+    return where, params
+
 
 class RelationalStorage:
     """
@@ -74,16 +499,235 @@ class RelationalStorage:
 
     state = storage.load("agent-a", "agent-b")   # None if not found
     history = storage.history("agent-a", "agent-b", limit=20)
+    for entry in storage.iter_history("agent-a", "agent-b", since=cutoff):
+        ...                                      # streamed, newest first
+
+    storage.compact_history(keep=30 * 86400, bucket=3600)  # hourly beyond 30 days
+    buckets = storage.rollups("agent-a", "agent-b")
+
+    Group commit
+    ------------
+    storage = RelationalStorage("rlp.db", group_commit=True)
+    fut = storage.save("agent-a", "agent-b", state)   # queued, returns Future
+    fut.result()                                       # wait for durability
+    storage.flush()                                    # commit everything queued
+
+    Parameters
+    ----------
+    db_path : str
+        SQLite path. ":memory:" (default) is in-memory only.
+    group_commit : bool
+        Queue saves and commit them in batches from a single writer thread.
+    max_batch : int
+        Group commit: flush once this many saves are waiting.
+    max_delay : float
+        Group commit: flush at most this many seconds after the first
+        queued save.
+    max_queue : int
+        Group commit: bound on queued saves; save() blocks when full.
+    wal : bool
+        Use write-ahead-log journaling (file databases).
+    synchronous : str, optional
+        PRAGMA synchronous level: "OFF", "NORMAL", "FULL" or "EXTRA".
+    mmap_size : int, optional
+        Bytes of the database file to memory-map for reads.
+    cache_size : int, optional
+        PRAGMA cache_size per connection: pages if positive, KiB if negative.
+    readers : int
+        Read-only connections to serve reads from, so they do not queue
+        behind the writer connection (file databases; best with ``wal``).
     """
 
-    def __init__(self, db_path: str = ":memory:") -> None:
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        group_commit: bool = False,
+        max_batch: int = 256,
+        max_delay: float = 0.005,
+        max_queue: int = 4096,
+        wal: bool = False,
+        synchronous: Optional[str] = None,
+        mmap_size: Optional[int] = None,
+        cache_size: Optional[int] = None,
+        readers: int = 0,
+    ) -> None:
+        if synchronous is not None and synchronous.upper() not in _SYNCHRONOUS:
+            raise ValueError(f"synchronous must be one of {_SYNCHRONOUS}, got {synchronous!r}")
+        if readers < 0:
+            raise ValueError(f"readers must be non-negative, got {readers}")
         self._path = str(db_path)
         self._conn = sqlite3.connect(self._path, check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
-        self._conn.executescript(_SCHEMA)
-        self._conn.commit()
+        if wal:
+            self._conn.execute("PRAGMA journal_mode = WAL")
+        if synchronous is not None:
+            self._conn.execute(f"PRAGMA synchronous = {synchronous.upper()}")
+        self._tune(self._conn, mmap_size, cache_size)
+        self._lock = threading.RLock()
+        self._open_schema()
+
+        # Intern cache: agent name -> agents.id, for names known to be committed
+        self._agent_keys: Dict[str, int] = {}
+
+        # Read-only connection pool; idle connections wait in the queue
+        self._readers: Optional[queue.Queue] = None
+        self._reader_conns: List[sqlite3.Connection] = []
+        self._held = threading.local()   # depth > 0 while this thread holds a reader
+        if readers and self._path not in ("", ":memory:") and "mode=memory" not in self._path:
+            uri = Path(self._path).resolve().as_uri() + "?mode=ro"
+            self._readers = queue.Queue()
+            for _ in range(readers):
+                conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                self._tune(conn, mmap_size, cache_size)
+                self._reader_conns.append(conn)
+                self._readers.put(conn)
+
+        self._group_commit = group_commit
+        self._max_batch    = max(1, max_batch)
+        self._max_delay    = max_delay
+        self._unflushed    = 0
+        self._unflushed_lock = threading.Lock()
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        if group_commit:
+            self._queue = queue.Queue(maxsize=max_queue)
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="rlp0-storage-writer", daemon=True,
+            )
+            self._writer.start()
         logger.debug("RelationalStorage opened at %s", self._path)
 
+    def _open_schema(self) -> None:
+        """Create the schema, or bring an older one to a supported version."""
+        conn = self._conn
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise RuntimeError(
+                f"{self._path} has schema version {version}; this version of "
+                f"rlp-0 supports up to {SCHEMA_VERSION}"
+            )
+        if version == 0:
+            legacy = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'relationships'"
+            ).fetchone() is not None
+            if legacy:
+                logger.info("Migrating %s to schema version %d (interned agent ids)",
+                            self._path, _ISO_TIME_VERSION)
+                self._migrate(_MIGRATE_INTERN_AGENTS, _ISO_TIME_VERSION)
+                version = _ISO_TIME_VERSION
+            else:
+                self._migrate(_TABLES.format(time="INTEGER"), SCHEMA_VERSION)
+                version = SCHEMA_VERSION
+        conn.executescript(_INDEXES + _RETENTION_TABLES)
+        self._version = version
+
+    def _migrate(self, script: str, version: int) -> None:
+        """Run a schema script and set the schema version, in one transaction."""
+        self._conn.executescript(
+            f"BEGIN;\n{script}\n{_INDEXES}\nPRAGMA user_version = {version};\nCOMMIT;"
+        )
+
+    @property
+    def schema_version(self) -> int:
+        """Schema version of the open database (see module docstring)."""
+        return self._version
+
+    def upgrade_timestamps(self) -> None:
+        """
+        Convert a version 2 database (ISO 8601 timestamps) to version 3
+        (integer microseconds), rewriting every table in one transaction.
+        No-op if the database is already at version 3.
+        """
+        if self._version >= SCHEMA_VERSION:
+            return
+        self._sync()
+        with self._lock:
+            self._conn.create_function("iso_to_us", 1, _iso_to_us)
+            logger.info("Migrating %s to schema version %d (integer timestamps)",
+                        self._path, SCHEMA_VERSION)
+            self._migrate(_MIGRATE_INTEGER_TIME, SCHEMA_VERSION)
+            self._version = SCHEMA_VERSION
+
+    def _stamp(self, ns: Optional[int] = None):
+        """Epoch nanoseconds (default now) in this database's timestamp form."""
+        if ns is None:
+            ns = wall_ns()
+        if self._version <= _ISO_TIME_VERSION:
+            return to_datetime(ns).isoformat()
+        return ns // 1000
+
+    @staticmethod
+    def _tune(
+        conn: sqlite3.Connection,
+        mmap_size: Optional[int],
+        cache_size: Optional[int],
+    ) -> None:
+        if mmap_size is not None:
+            conn.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+        if cache_size is not None:
+            conn.execute(f"PRAGMA cache_size = {int(cache_size)}")
+
+    @property
+    def journal_mode(self) -> str:
+        """Journal mode of the writer connection ("wal", "delete", "memory", ...)."""
+        with self._lock:
+            return self._conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+    # ── Agent interning ───────────────────────────────────────────────────────
+
+    def _intern(self, names: Iterable[str]) -> Dict[str, int]:
+        """
+        Return agents.id for each name, inserting unknown names. Runs on the
+        writer connection, with its lock held, inside the write transaction.
+        """
+        cache = self._agent_keys
+        missing = [name for name in set(names) if name not in cache]
+        if missing:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO agents (name) VALUES (?)",
+                [(name,) for name in missing],
+            )
+            for start in range(0, len(missing), _MAX_PARAMS):
+                chunk = missing[start:start + _MAX_PARAMS]
+                marks = ", ".join("?" * len(chunk))
+                cache.update(self._conn.execute(
+                    f"SELECT name, id FROM agents WHERE name IN ({marks})", chunk,
+                ).fetchall())
+        return cache
+
+    def _keyed(self, rows: List[tuple]) -> List[tuple]:
+        """Replace the (from_id, to_id) names leading each row with agent keys."""
+        keys = self._intern([row[0] for row in rows] + [row[1] for row in rows])
+        return [(keys[row[0]], keys[row[1]]) + row[2:] for row in rows]
+
+    def _rollback(self) -> None:
+        """Roll back the writer connection; keys interned in it are forgotten."""
+        self._conn.rollback()
+        self._agent_keys.clear()
+
+    def _key(self, name: str) -> Optional[int]:
+        """agents.id for a name, or None if no row has ever used it."""
+        key = self._agent_keys.get(name)
+        if key is None:
+            rows = self._read("SELECT id FROM agents WHERE name = ?", (name,))
+            if rows:
+                key = rows[0][0]
+        return key
+
+    def _keys(self, names: Sequence[str]) -> Dict[str, int]:
+        """agents.id for each known name; unknown names are omitted."""
+        cache = self._agent_keys
+        keys = {name: cache[name] for name in names if name in cache}
+        missing = [name for name in names if name not in keys]
+        for start in range(0, len(missing), _MAX_PARAMS):
+            chunk = missing[start:start + _MAX_PARAMS]
+            marks = ", ".join("?" * len(chunk))
+            keys.update(self._read(
+                f"SELECT name, id FROM agents WHERE name IN ({marks})", tuple(chunk),
+            ))
+        return keys
+
     # ── Write ─────────────────────────────────────────────────────────────────
 
     def save(
@@ -93,71 +737,242 @@ class RelationalStorage:
         state: RelationalState,
         change_type: str = "update",
         notes: Optional[str] = None,
-    ) -> None:
-        """Upsert current state and append to history log."""
-        now = datetime.now(timezone.utc).isoformat()
+    ) -> Optional[Future]:
+        """
+        Upsert current state and append to history log.
 
-        self._conn.execute(
-            """
-            INSERT INTO relationships
-                (from_id, to_id, trust, intent, narrative, commitments,
-                 rupture_risk, is_gated, last_updated)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (from_id, to_id) DO UPDATE SET
-                trust        = excluded.trust,
-                intent       = excluded.intent,
-                narrative    = excluded.narrative,
-                commitments  = excluded.commitments,
-                rupture_risk = excluded.rupture_risk,
-                is_gated     = excluded.is_gated,
-                last_updated = excluded.last_updated
-            """,
-            (
-                from_id, to_id,
-                state.trust, state.intent, state.narrative, state.commitments,
-                state.rupture_risk, int(state.is_gated), now,
-            ),
-        )
+        In group-commit mode the write is queued and a Future is returned
+        that resolves once it has been committed; otherwise the write is
+        committed before returning and None is returned.
+        """
+        rel, hist = _rows(from_id, to_id, state, change_type, notes, self._stamp())
+        return self._write([(_UPSERT, [rel]), (_INSERT_HISTORY, [hist])])
 
-        self._conn.execute(
-            """
-            INSERT INTO state_history
-                (from_id, to_id, recorded_at, trust, intent, narrative,
-                 commitments, rupture_risk, is_gated, change_type, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                from_id, to_id, now,
-                state.trust, state.intent, state.narrative, state.commitments,
-                state.rupture_risk, int(state.is_gated),
-                change_type, notes,
-            ),
+    def save_many(
+        self,
+        items: Iterable[Tuple[str, str, RelationalState, Sequence[str]]],
+        signals: Iterable[Tuple[str, str, Signal]] = (),
+    ) -> Optional[Future]:
+        """
+        Persist several states in one transaction.
+
+        Each item is ``(from_id, to_id, state, change_types)`` and produces
+        one upsert plus one history row per change type. ``signals`` are
+        ``(from_id, to_id, signal)`` appended to signal_log in the same
+        transaction. Returns a Future in group-commit mode, None otherwise.
+        """
+        rels: List[tuple] = []
+        hists: List[tuple] = []
+        now = self._stamp()
+        for from_id, to_id, state, change_types in items:
+            rel, hist = _rows(from_id, to_id, state, change_types[0], None, now)
+            rels.append(rel)
+            hists.append(hist)
+            for change_type in change_types[1:]:
+                hists.append(hist[:-2] + (change_type, None))
+        statements = [(_UPSERT, rels), (_INSERT_HISTORY, hists)] if rels else []
+        spilled = [self._signal_row(*signal) for signal in signals]
+        if spilled:
+            statements.append((_INSERT_SIGNAL, spilled))
+        if not statements:
+            return None
+        return self._write(statements)
+
+    def log_signal(self, from_id: str, to_id: str, signal: Signal) -> Optional[Future]:
+        """Append a signal to signal_log (e.g. as a SignalBus spill target)."""
+        return self._write([(_INSERT_SIGNAL, [self._signal_row(from_id, to_id, signal)])])
+
+    def _signal_row(self, from_id: str, to_id: str, signal: Signal) -> tuple:
+        return (
+            from_id, to_id, signal.signal_type.name.lower(),
+            self._stamp(signal.timestamp_ns), signal.rupture_risk, signal.context,
         )
 
-        self._conn.commit()
+    def _write(self, statements: List[Tuple[str, List[tuple]]]) -> Optional[Future]:
+        """Run (sql, rows) statements in one transaction, or queue them."""
+        if self._group_commit:
+            if self._writer is None or not self._writer.is_alive():
+                raise RuntimeError("RelationalStorage writer is not running")
+            fut: Future = Future()
+            with self._unflushed_lock:
+                self._unflushed += 1
+            self._queue.put((statements, fut))
+            return fut
+
+        with self._lock:
+            try:
+                for sql, rows in statements:
+                    rows = self._keyed(rows)
+                    if len(rows) == 1:
+                        self._conn.execute(sql, rows[0])
+                    else:
+                        self._conn.executemany(sql, rows)
+                self._conn.commit()
+            except Exception:
+                self._rollback()
+                raise
+        return None
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Commit every queued save now and wait for it.
+        No-op unless group commit is enabled.
+        """
+        if self._writer is None or not self._writer.is_alive():
+            return
+        marker: Future = Future()
+        self._queue.put((_FLUSH, marker))
+        marker.result(timeout)
+
+    def _sync(self) -> None:
+        """Make queued saves visible before a read or delete."""
+        if self._group_commit and self._unflushed:
+            self.flush()
+
+    def _writer_loop(self) -> None:
+        q = self._queue
+        stop = False
+        while not stop:
+            batch = [q.get()]
+            deadline = time.monotonic() + self._max_delay
+            while batch[-1][0] is not _FLUSH and batch[-1][0] is not _STOP \
+                    and len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    # Past the deadline, still take whatever is already queued
+                    if remaining > 0:
+                        batch.append(q.get(timeout=remaining))
+                    else:
+                        batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            stop = batch[-1][0] is _STOP
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch: list) -> None:
+        # Claim every Future so callers can no longer cancel it; one cancelled
+        # while queued is not resolved, but its write still goes ahead
+        waiters = [fut for _, fut in batch if fut.set_running_or_notify_cancel()]
+        writes = [item for item in batch if item[0] is not _FLUSH and item[0] is not _STOP]
+        error: Optional[BaseException] = None
+        if writes:
+            # One executemany per statement across the whole batch
+            merged: Dict[str, List[tuple]] = {}
+            for statements, _ in writes:
+                for sql, rows in statements:
+                    merged.setdefault(sql, []).extend(rows)
+            try:
+                with self._lock:
+                    for sql, rows in merged.items():
+                        self._conn.executemany(sql, self._keyed(rows))
+                    self._conn.commit()
+            except Exception as exc:  # resolve every waiter, keep the writer alive
+                logger.exception("group commit of %d saves failed", len(writes))
+                with self._lock:
+                    self._rollback()
+                error = exc
+            with self._unflushed_lock:
+                self._unflushed -= len(writes)
+        for fut in waiters:
+            if error is None:
+                fut.set_result(None)
+            else:
+                fut.set_exception(error)
 
     # ── Read ──────────────────────────────────────────────────────────────────
 
     def load(self, from_id: str, to_id: str) -> Optional[RelationalState]:
         """Load most recent state for a pair. Returns None if not found."""
-        row = self._conn.execute(
+        keys = self._keys((from_id, to_id))
+        if len(keys) < len({from_id, to_id}):
+            return None
+        rows = self._read(
             "SELECT * FROM relationships WHERE from_id = ? AND to_id = ?",
-            (from_id, to_id),
-        ).fetchone()
+            (keys[from_id], keys[to_id]),
+        )
 
-        if row is None:
+        if not rows:
             return None
 
-        return RelationalState(
-            trust       = row["trust"],
-            intent      = row["intent"],
-            narrative   = row["narrative"],
-            commitments = row["commitments"],
-            rupture_risk = row["rupture_risk"],
-            is_gated    = bool(row["is_gated"]),
-            last_updated = datetime.fromisoformat(row["last_updated"]),
+        return _to_state(rows[0])
+
+    def load_many(self, from_id: str, to_ids: Iterable[str]) -> Dict[str, RelationalState]:
+        """Load states for several pairs of one from_id. Missing pairs are omitted."""
+        states: Dict[str, RelationalState] = {}
+        from_key = self._key(from_id)
+        if from_key is None:
+            return states
+        keys = list(self._keys(list(to_ids)).items())
+        names = {key: name for name, key in keys}
+        for start in range(0, len(keys), _MAX_PARAMS):
+            chunk = [key for _, key in keys[start:start + _MAX_PARAMS]]
+            marks = ", ".join("?" * len(chunk))
+            rows = self._read(
+                f"SELECT * FROM relationships WHERE from_id = ? AND to_id IN ({marks})",
+                (from_key, *chunk),
+            )
+            for row in rows:
+                states[names[row["to_id"]]] = _to_state(row)
+        return states
+
+    def iter_states(
+        self,
+        from_id: str,
+        batch: int = 1000,
+    ) -> Iterator[Tuple[str, RelationalState]]:
+        """
+        Stream (to_id, state) for every pair of one from_id.
+
+        One query over the (from_id, to_id) primary key, fetched ``batch``
+        rows at a time so the full result is never materialized.
+        """
+        from_key = self._key(from_id)
+        if from_key is None:
+            return
+        yield from self._stream(_STATES + " WHERE r.from_id = ?", (from_key,), batch)
+
+    def quiet_states(
+        self,
+        from_id: str,
+        before: datetime,
+        batch: int = 1000,
+    ) -> Iterator[Tuple[str, RelationalState]]:
+        """
+        Stream (to_id, state) for open pairs of one from_id last written at
+        or before ``before``, oldest first.
+
+        A range scan on the (from_id, last_updated) index, so recently
+        written relationships are never read.
+        """
+        from_key = self._key(from_id)
+        if from_key is None:
+            return
+        yield from self._stream(
+            _STATES + " WHERE r.from_id = ? AND r.last_updated <= ? AND r.is_gated = 0"
+            " ORDER BY r.last_updated",
+            (from_key, self._stamp(to_ns(before))),
+            batch,
         )
 
+    def _stream(
+        self,
+        sql: str,
+        params: tuple,
+        batch: int,
+    ) -> Iterator[Tuple[str, RelationalState]]:
+        """Yield (to_name, state) from a _STATES query, ``batch`` rows per fetch."""
+        self._sync()
+        with self._reader() as (conn, lock):
+            with lock:
+                cursor = conn.execute(sql, params)
+            while True:
+                with lock:
+                    rows = cursor.fetchmany(batch)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row["to_name"], _to_state(row)
+
     def history(
         self,
         from_id: str,
@@ -165,54 +980,404 @@ class RelationalStorage:
         limit: int = 50,
     ) -> List[dict]:
         """Return state change history for a pair, newest first."""
-        rows = self._conn.execute(
+        keys = self._keys((from_id, to_id))
+        if len(keys) < len({from_id, to_id}):
+            return []
+        rows = self._read(
             """
             SELECT recorded_at, trust, intent, narrative, commitments,
                    rupture_risk, is_gated, change_type, notes
             FROM state_history
             WHERE from_id = ? AND to_id = ?
-            ORDER BY recorded_at DESC
+            ORDER BY recorded_at DESC, id DESC
             LIMIT ?
             """,
-            (from_id, to_id, limit),
-        ).fetchall()
+            (keys[from_id], keys[to_id], limit),
+        )
 
-        return [dict(r) for r in rows]
+        history = [dict(r) for r in rows]
+        for entry in history:
+            entry["recorded_at"] = _time_iso(entry["recorded_at"])
+        return history
 
-    def all_pairs(self) -> List[Tuple[str, str]]:
-        """Return all tracked (from_id, to_id) pairs."""
-        rows = self._conn.execute(
-            "SELECT from_id, to_id FROM relationships"
-        ).fetchall()
+    def iter_history(
+        self,
+        from_id: str,
+        to_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        before_id: Optional[int] = None,
+        batch: int = 500,
+    ) -> Iterator[dict]:
+        """
+        Stream state change history for a pair, newest first.
+
+        Entries are those of history() plus the row ``id``. ``since`` and
+        ``until`` bound recorded_at (since inclusive, until exclusive). To
+        continue after an entry, pass its id as ``before_id``: the scan
+        resumes just past that entry's (recorded_at, id) on the
+        (from_id, to_id, recorded_at) index rather than skipping rows with
+        OFFSET, so a page deep in the history costs what the first one does.
+        Rows are fetched ``batch`` at a time.
+        """
+        keys = self._keys((from_id, to_id))
+        if len(keys) < len({from_id, to_id}):
+            return
+        pair = (keys[from_id], keys[to_id])
+        conditions = ["from_id = ? AND to_id = ?"]
+        params: list = list(pair)
+        if since is not None:
+            conditions.append("recorded_at >= ?")
+            params.append(self._stamp(to_ns(since)))
+        if until is not None:
+            conditions.append("recorded_at < ?")
+            params.append(self._stamp(to_ns(until)))
+        if before_id is not None:
+            anchor = self._read(
+                "SELECT recorded_at FROM state_history"
+                " WHERE id = ? AND from_id = ? AND to_id = ?",
+                (before_id, *pair),
+            )
+            if not anchor:
+                raise ValueError(
+                    f"no history entry {before_id} for ({from_id!r}, {to_id!r})"
+                )
+            conditions.append("(recorded_at, id) < (?, ?)")
+            params += [anchor[0][0], before_id]
+
+        self._sync()
+        with self._reader() as (conn, lock):
+            with lock:
+                cursor = conn.execute(
+                    f"""
+                    SELECT id, recorded_at, trust, intent, narrative, commitments,
+                           rupture_risk, is_gated, change_type, notes
+                    FROM state_history
+                    WHERE {" AND ".join(conditions)}
+                    ORDER BY recorded_at DESC, id DESC
+                    """,
+                    params,
+                )
+            while True:
+                with lock:
+                    rows = cursor.fetchmany(batch)
+                if not rows:
+                    break
+                for row in rows:
+                    entry = dict(row)
+                    entry["recorded_at"] = _time_iso(entry["recorded_at"])
+                    yield entry
+
+    def signal_log(self, from_id: str, to_id: str, limit: int = 50) -> List[dict]:
+        """Return logged signals for a pair, newest first."""
+        keys = self._keys((from_id, to_id))
+        if len(keys) < len({from_id, to_id}):
+            return []
+        rows = self._read(
+            """
+            SELECT signal_type, emitted_at, rupture_risk, context
+            FROM signal_log
+            WHERE from_id = ? AND to_id = ?
+            ORDER BY emitted_at DESC, id DESC
+            LIMIT ?
+            """,
+            (keys[from_id], keys[to_id], limit),
+        )
+        signals = [dict(r) for r in rows]
+        for entry in signals:
+            entry["emitted_at"] = _time_iso(entry["emitted_at"])
+        return signals
+
+    def rollups(
+        self,
+        from_id: str,
+        to_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[dict]:
+        """
+        Return the history buckets compact_history() has rolled up for a
+        pair, oldest first, optionally only those overlapping [since, until).
+
+        Each holds the bucket bounds and its newest entry time (ISO 8601),
+        the number of entries rolled in, min/max/mean/last of every
+        primitive and of rupture_risk, the last gate state, and how many
+        entries were rupture_detected and repair_complete.
+        """
+        keys = self._keys((from_id, to_id))
+        if len(keys) < len({from_id, to_id}):
+            return []
+        conditions = ["from_id = ? AND to_id = ?"]
+        params: list = [keys[from_id], keys[to_id]]
+        if since is not None:
+            conditions.append("bucket_end > ?")
+            params.append(to_ns(since) // 1000)
+        if until is not None:
+            conditions.append("bucket_start < ?")
+            params.append(to_ns(until) // 1000)
+        rows = self._read(
+            f"SELECT * FROM history_rollups WHERE {' AND '.join(conditions)}"
+            " ORDER BY bucket_start",
+            tuple(params),
+        )
+        buckets = []
+        for row in rows:
+            entry = dict(row)
+            del entry["from_id"], entry["to_id"]
+            for column in ("bucket_start", "bucket_end", "last_at"):
+                entry[column] = _time_iso(entry[column])
+            buckets.append(entry)
+        return buckets
+
+    def _pairs(self, from_id: Optional[str], *conditions: str, params: tuple = ()) -> List[Tuple[str, str]]:
+        """(from_id, to_id) names of relationships matching ``conditions``."""
+        from_key = None
+        if from_id is not None:
+            from_key = self._key(from_id)
+            if from_key is None:
+                return []
+        where, scope = _scope(from_key, *conditions)
+        rows = self._read(_PAIR_NAMES + where, scope + params)
         return [(r["from_id"], r["to_id"]) for r in rows]
 
-    def gated_pairs(self) -> List[Tuple[str, str]]:
+    def all_pairs(self, from_id: Optional[str] = None) -> List[Tuple[str, str]]:
+        """Return all tracked (from_id, to_id) pairs, optionally for one from_id."""
+        return self._pairs(from_id)
+
+    def gated_pairs(self, from_id: Optional[str] = None) -> List[Tuple[str, str]]:
         """Return pairs where is_gated = 1."""
-        rows = self._conn.execute(
-            "SELECT from_id, to_id FROM relationships WHERE is_gated = 1"
-        ).fetchall()
-        return [(r["from_id"], r["to_id"]) for r in rows]
+        return self._pairs(from_id, "r.is_gated = 1")
+
+    def at_risk_pairs(
+        self,
+        threshold: float = 0.5,
+        from_id: Optional[str] = None,
+        gated: Optional[bool] = None,
+    ) -> List[Tuple[str, str]]:
+        """Return pairs with rupture_risk >= threshold, optionally by gate state."""
+        conditions = ["r.rupture_risk >= ?"]
+        if gated is not None:
+            conditions.insert(0, f"r.is_gated = {int(gated)}")
+        return self._pairs(from_id, *conditions, params=(threshold,))
+
+    def healthy_pairs(
+        self,
+        threshold: float = 0.5,
+        from_id: Optional[str] = None,
+    ) -> List[Tuple[str, str]]:
+        """Return pairs that are not gated and have rupture_risk < threshold."""
+        return self._pairs(from_id, "r.is_gated = 0 AND r.rupture_risk < ?", params=(threshold,))
+
+    def riskiest(
+        self,
+        k: int,
+        from_id: Optional[str] = None,
+    ) -> List[Tuple[str, str, float]]:
+        """
+        Return the k highest-risk (from_id, to_id, rupture_risk), highest first.
+        Served by the rupture_risk indexes, so no sort is needed.
+        """
+        from_key = None
+        if from_id is not None:
+            from_key = self._key(from_id)
+            if from_key is None:
+                return []
+        where, params = _scope(from_key)
+        rows = self._read(
+            f"""
+            SELECT f.name AS from_id, t.name AS to_id, r.rupture_risk
+            FROM relationships r
+            JOIN agents f ON f.id = r.from_id
+            JOIN agents t ON t.id = r.to_id{where}
+            ORDER BY r.rupture_risk DESC
+            LIMIT ?
+            """,
+            params + (k,),
+        )
+        return [(r["from_id"], r["to_id"], r["rupture_risk"]) for r in rows]
+
+    def fleet_counts(self, threshold: float = 0.5, from_id: Optional[str] = None) -> dict:
+        """Return relationship, gated, at-risk and healthy counts in one pass."""
+        from_key = None
+        if from_id is not None:
+            from_key = self._key(from_id)
+            if from_key is None:
+                return {"relationships": 0, "gated": 0, "at_risk": 0, "healthy": 0}
+        where, params = _scope(from_key)
+        row = self._read(
+            f"""
+            SELECT COUNT(*)                                          AS relationships,
+                   COALESCE(SUM(is_gated), 0)                        AS gated,
+                   COALESCE(SUM(rupture_risk >= ?), 0)               AS at_risk,
+                   COALESCE(SUM(is_gated = 0 AND rupture_risk < ?), 0) AS healthy
+            FROM relationships r{where}
+            """,
+            (threshold, threshold) + params,
+        )[0]
+        return dict(row)
+
+    def _read(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        self._sync()
+        with self._reader() as (conn, lock), lock:
+            return conn.execute(sql, params).fetchall()
+
+    @contextmanager
+    def _reader(self) -> Iterator[Tuple[sqlite3.Connection, object]]:
+        """
+        Yield (connection, lock) for a read: a pooled read-only connection,
+        which needs no lock, or without a pool the writer connection and its
+        lock. Waits for a free pooled connection, except that a thread
+        already holding one (e.g. while iterating) reads on the writer
+        connection instead of waiting on itself.
+        """
+        held = self._held
+        if self._readers is None or getattr(held, "depth", 0):
+            yield self._conn, self._lock
+            return
+        conn = self._readers.get()
+        held.depth = 1
+        try:
+            yield conn, _NO_LOCK
+        finally:
+            held.depth = 0
+            self._readers.put(conn)
+
+    # ── Retention ─────────────────────────────────────────────────────────────
+
+    def compact_history(
+        self,
+        keep: float,
+        bucket: float = 3600.0,
+        chunk: int = 1000,
+        max_chunks: Optional[int] = None,
+        pause: float = 0.0,
+    ) -> int:
+        """
+        Roll state history older than ``keep`` seconds into per-pair
+        buckets of ``bucket`` seconds (see rollups()). Returns the number of
+        history rows deleted.
+
+        rupture_detected and repair_complete entries are counted in their
+        bucket and also kept in state_history, so every gate transition
+        keeps its full-resolution record; other rolled-up entries are
+        deleted. Entries are taken in state_history id order from where the
+        previous run stopped, ``chunk`` per transaction, up to the first
+        one still inside the window. The lock is released between chunks
+        (after sleeping ``pause`` seconds), so writes wait for at most one
+        chunk; ``max_chunks`` bounds a single call and the next call picks
+        up where it left off.
+
+        Deleted entries can no longer be used as iter_history() cursors.
+        Freed pages are reused by later writes; VACUUM returns them to the
+        operating system.
+        """
+        if keep < 0:
+            raise ValueError(f"keep must be non-negative, got {keep}")
+        if bucket <= 0:
+            raise ValueError(f"bucket must be positive, got {bucket}")
+        if chunk < 1:
+            raise ValueError(f"chunk must be at least 1, got {chunk}")
+        self._sync()
+        cutoff = self._stamp(wall_ns() - int(keep * 1e9))
+        width = int(bucket * 1e6)
+        deleted = 0
+        chunks = 0
+        while max_chunks is None or chunks < max_chunks:
+            with self._lock:
+                try:
+                    removed, done = self._compact_chunk(cutoff, width, chunk)
+                    self._conn.commit()
+                except Exception:
+                    self._rollback()
+                    raise
+            deleted += removed
+            chunks += 1
+            if done:
+                break
+            time.sleep(pause)
+        return deleted
 
-    def at_risk_pairs(self, threshold: float = 0.5) -> List[Tuple[str, str]]:
-        """Return pairs with rupture_risk >= threshold."""
-        rows = self._conn.execute(
-            "SELECT from_id, to_id FROM relationships WHERE rupture_risk >= ?",
-            (threshold,),
+    def _compact_chunk(self, cutoff, width: int, chunk: int) -> Tuple[int, bool]:
+        """
+        Roll up one chunk of history in the open transaction. Returns
+        (rows deleted, whether compaction caught up with the window).
+        """
+        conn = self._conn
+        row = conn.execute("SELECT compacted_through FROM retention").fetchone()
+        mark = row[0] if row else 0
+        rows = conn.execute(
+            """
+            SELECT id, from_id, to_id, recorded_at, trust, intent, narrative,
+                   commitments, rupture_risk, is_gated, change_type
+            FROM state_history
+            WHERE id > ?
+            ORDER BY id
+            LIMIT ?
+            """,
+            (mark, chunk),
         ).fetchall()
-        return [(r["from_id"], r["to_id"]) for r in rows]
+        old = list(takewhile(lambda r: r["recorded_at"] < cutoff, rows))
+        if not old:
+            return 0, True
 
-    def delete(self, from_id: str, to_id: str) -> bool:
-        """Remove a relationship and its history. Returns True if found."""
-        cursor = self._conn.execute(
-            "DELETE FROM relationships WHERE from_id = ? AND to_id = ?",
-            (from_id, to_id),
+        buckets: Dict[Tuple[int, int, int], dict] = {}
+        for r in old:
+            at = _time_ns(r["recorded_at"]) // 1000
+            key = (r["from_id"], r["to_id"], at - at % width)
+            bucket = buckets.get(key)
+            if bucket is None:
+                stored = conn.execute(
+                    "SELECT * FROM history_rollups"
+                    " WHERE from_id = ? AND to_id = ? AND bucket_start = ?",
+                    key,
+                ).fetchone()
+                bucket = buckets[key] = dict(stored) if stored else _new_bucket(*key, width)
+            _roll_in(bucket, r, at)
+        conn.executemany(
+            _UPSERT_ROLLUP,
+            [tuple(b[column] for column in _ROLLUP_COLUMNS) for b in buckets.values()],
+        )
+
+        through = old[-1]["id"]
+        cursor = conn.execute(
+            "DELETE FROM state_history WHERE id > ? AND id <= ? AND change_type NOT IN (?, ?)",
+            (mark, through) + _PRESERVED,
         )
-        self._conn.execute(
-            "DELETE FROM state_history WHERE from_id = ? AND to_id = ?",
-            (from_id, to_id),
+        conn.execute(
+            "INSERT OR REPLACE INTO retention (id, compacted_through) VALUES (1, ?)",
+            (through,),
         )
-        self._conn.commit()
+        return cursor.rowcount, len(old) < chunk
+
+    def delete(self, from_id: str, to_id: str) -> bool:
+        """Remove a relationship and its history. Returns True if found."""
+        keys = self._keys((from_id, to_id))
+        if len(keys) < len({from_id, to_id}):
+            return False
+        pair = (keys[from_id], keys[to_id])
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM relationships WHERE from_id = ? AND to_id = ?", pair,
+            )
+            self._conn.execute(
+                "DELETE FROM state_history WHERE from_id = ? AND to_id = ?", pair,
+            )
+            self._conn.execute(
+                "DELETE FROM signal_log WHERE from_id = ? AND to_id = ?", pair,
+            )
+            self._conn.execute(
+                "DELETE FROM history_rollups WHERE from_id = ? AND to_id = ?", pair,
+            )
+            self._conn.commit()
         return cursor.rowcount > 0
 
     def close(self) -> None:
+        """Flush queued saves, stop the writer thread and close the connection."""
+        if self._writer is not None and self._writer.is_alive():
+            done: Future = Future()
+            self._queue.put((_STOP, done))
+            done.result()
+            self._writer.join()
+        for conn in self._reader_conns:
+            conn.close()
         self._conn.close()
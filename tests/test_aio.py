@@ -0,0 +1,160 @@
+"""
+Tests for AsyncRLP0Manager — asyncio front end with off-loop storage I/O.
+"""
+import asyncio
+
+import pytest
+from rlp_0 import AsyncRLP0Manager, RLP0Manager
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+LOW  = dict(trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+HIGH = dict(trust=0.9, intent=0.9, narrative=0.9, commitments=0.9)
+
+
+class TestAsyncManager:
+    def test_update_and_can_interact(self, tmp_path):
+        async def main():
+            mgr = AsyncRLP0Manager("agent-a", rupture_threshold=0.5, db_path=str(tmp_path / "a.db"))
+            await mgr.update("agent-b", trust=0.9)
+            assert await mgr.can_interact("agent-b") is True
+            await mgr.update("agent-b", **LOW)
+            assert await mgr.can_interact("agent-b") is False
+            await mgr.update("agent-b", **HIGH)
+            assert await mgr.acknowledge_repair("agent-b") is True
+            history = await mgr.history("agent-b")
+            summary = await mgr.summary()
+            await mgr.close()
+            return history, summary
+
+        history, summary = run(main())
+        assert history[0]["change_type"] == "repair_complete"
+        assert summary["relationships"] == 1
+        assert summary["gated"] == 0
+
+    def test_concurrent_updates_share_one_transaction(self, tmp_path):
+        path = str(tmp_path / "a.db")
+
+        async def main():
+            mgr = AsyncRLP0Manager("agent-a", db_path=path)
+            await asyncio.gather(*(
+                mgr.update(f"agent-{i}", trust=0.8) for i in range(200)
+            ))
+            batches = mgr.batches_written
+            await mgr.close()
+            return batches
+
+        assert run(main()) == 1
+        reopened = RLP0Manager("agent-a", db_path=path)
+        assert len(reopened.all_pairs()) == 200
+        reopened.close()
+
+    def test_queued_rows_keep_their_commit_state(self, tmp_path):
+        async def main():
+            mgr = AsyncRLP0Manager("agent-a", rupture_threshold=0.5, db_path=str(tmp_path / "a.db"))
+            await mgr.update("agent-b", **LOW)
+            # both commit in the same tick, before the writer runs
+            await asyncio.gather(mgr.update("agent-b", **HIGH), mgr.acknowledge_repair("agent-b"))
+            history = await mgr.history("agent-b")
+            await mgr.close()
+            return history
+
+        history = run(main())
+        assert [h["change_type"] for h in history[:2]] == ["repair_complete", "update"]
+        assert history[0]["is_gated"] == 0
+        assert history[1]["is_gated"] == 1
+        assert history[1]["rupture_risk"] == pytest.approx(0.1)
+
+    def test_spilled_signals_written_off_loop(self, tmp_path):
+        path = str(tmp_path / "a.db")
+
+        async def main():
+            mgr = AsyncRLP0Manager("agent-a", rupture_threshold=0.5, db_path=path,
+                                   signal_capacity=1, spill_signals=True)
+            mgr._storage.log_signal = None   # spills must go through the writer
+            await mgr.update("agent-b", **LOW)
+            await mgr.update("agent-b", **HIGH)
+            await mgr.acknowledge_repair("agent-b")
+            await mgr.close()
+
+        run(main())
+        reopened = RLP0Manager("agent-a", db_path=path)
+        assert [s["signal_type"] for s in reopened.signal_log("agent-b")] == ["rupture_detected"]
+        reopened.close()
+
+    def test_reads_see_prior_writes(self, tmp_path):
+        async def main():
+            mgr = AsyncRLP0Manager("agent-a", db_path=str(tmp_path / "a.db"))
+            pending = asyncio.ensure_future(mgr.update("agent-b", trust=0.7))
+            await asyncio.sleep(0)   # queued, not yet committed
+            history = await mgr.history("agent-b")
+            await pending
+            summary = await mgr.summary()
+            await mgr.close()
+            return history, summary
+
+        history, summary = run(main())
+        assert [h["change_type"] for h in history] == ["update", "created"]
+        assert summary["relationships"] == 1
+
+    def test_iter_history_pages_off_loop(self, tmp_path):
+        async def main():
+            mgr = AsyncRLP0Manager("agent-a", db_path=str(tmp_path / "a.db"))
+            for i in range(5):
+                await mgr.update("agent-b", trust=0.9 - i / 100)
+            streamed = [h async for h in mgr.iter_history("agent-b", batch=2)]
+            history = await mgr.history("agent-b")
+            await mgr.close()
+            return streamed, history
+
+        streamed, history = run(main())
+        assert len(streamed) == len(history) == 6
+        assert [h["id"] for h in streamed] == sorted((h["id"] for h in streamed), reverse=True)
+        assert [h["change_type"] for h in streamed] == [h["change_type"] for h in history]
+
+    def test_lazy_hydration_off_loop(self, tmp_path):
+        path = str(tmp_path / "a.db")
+        seed = RLP0Manager("agent-a", rupture_threshold=0.5, db_path=path)
+        seed.update("agent-b", **LOW)
+        seed.close()
+
+        async def main():
+            mgr = AsyncRLP0Manager("agent-a", rupture_threshold=0.5, db_path=path,
+                                   max_resident=2)
+            gated = not await mgr.can_interact("agent-b")
+            for i in range(10):
+                await mgr.update(f"agent-{i}", trust=0.8)
+            state = await mgr.state("agent-b")
+            await mgr.close()
+            return gated, state
+
+        gated, state = run(main())
+        assert gated is True
+        assert state.is_gated is True
+
+    def test_wait_can_interact(self):
+        async def main():
+            mgr = AsyncRLP0Manager("agent-a", rupture_threshold=0.5)
+            await mgr.update("agent-b", **LOW)
+            waits = [asyncio.ensure_future(mgr.wait_can_interact("agent-b", timeout=5))
+                     for _ in range(100)]
+            await asyncio.sleep(0)
+            await mgr.update("agent-b", **HIGH)
+            await mgr.acknowledge_repair("agent-b")
+            released = await asyncio.gather(*waits)
+            await mgr.close()
+            return released
+
+        assert all(run(main()))
+
+    def test_write_errors_reach_the_caller(self):
+        async def main():
+            mgr = AsyncRLP0Manager("agent-a")
+            await mgr.close()
+            with pytest.raises(Exception):
+                await mgr.update("agent-b", trust=0.8)
+
+        run(main())
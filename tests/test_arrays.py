@@ -0,0 +1,155 @@
+"""
+Tests for the struct-of-arrays engine and RLP0Manager(backend="array").
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from rlp_0 import RLP0, RLP0Manager, RelationalState, RUPTURE_DETECTED, REPAIR_COMPLETE
+from rlp_0.arrays import ArrayStateStore
+
+LOW  = {"trust": 0.1, "intent": 0.1, "narrative": 0.1, "commitments": 0.1}
+HIGH = {"trust": 0.9, "intent": 0.9, "narrative": 0.9, "commitments": 0.9}
+
+
+@pytest.fixture
+def store():
+    return ArrayStateStore(threshold=0.5, capacity=2)
+
+
+class TestArrayStateStore:
+    def test_rows_grow_past_capacity(self, store):
+        for i in range(10):
+            store.add(f"p{i}").update_state(trust=i / 10)
+        assert len(store) == 10
+        assert store.pairs["p3"].state.trust == pytest.approx(0.3)
+
+    def test_risk_matches_object_model(self, store):
+        values = {"trust": 0.3, "intent": 0.45, "narrative": 0.7, "commitments": 0.2}
+        rlp = RLP0(rupture_threshold=0.5)
+        rlp.update_state(**values)
+        pair = store.add("b")
+        pair.update_state(**values)
+        assert pair.rupture_risk == rlp.rupture_risk
+        assert pair.is_gated == rlp.is_gated
+
+    def test_vectorized_pass_over_subset(self, store):
+        for i in range(4):
+            store.add(f"p{i}")
+        store.trust[:4] = [0.0, 0.2, 0.4, 0.6]
+        risk = store.compute_rupture_risk(np.array([1, 3]))
+        assert risk.tolist() == pytest.approx([0.2, 0.1])
+        assert store.rupture_risk[0] == 0.0   # untouched
+
+    def test_validation(self, store):
+        with pytest.raises(ValueError):
+            store.add("b").update_state(trust=1.5)
+
+    def test_gate_and_repair_signals(self, store):
+        seen = []
+        store.on_signal = lambda key, sig: seen.append((key, sig.signal_type))
+        pair = store.add("b")
+        pair.update_state(**LOW)
+        assert pair.check_gate() is False
+        assert pair.acknowledge_repair() is False
+        pair.update_state(**HIGH)
+        assert pair.acknowledge_repair() is True
+        assert seen == [("b", RUPTURE_DETECTED), ("b", REPAIR_COMPLETE)]
+
+    def test_state_round_trip(self, store):
+        original = RelationalState(trust=0.4, rupture_risk=0.15, is_gated=True)
+        restored = store.add("b", original).state
+        assert restored.trust == pytest.approx(0.4)
+        assert restored.is_gated is True
+        assert restored.last_updated == original.last_updated
+
+    def test_apply_batch_handles_repeated_rows(self, store):
+        seen = []
+        store.on_signal = lambda key, sig: seen.append(key)
+        rows = [store.add(k).row for k in ("b", "c")]
+        results = store.apply_batch([rows[0], rows[1], rows[0]], [LOW, HIGH, {"trust": 0.2}])
+        assert [r[2] for r in results] == ["closed", None, None]
+        assert results[2][0] == pytest.approx(0.875)
+        assert seen == ["b"]
+
+    def test_apply_batch_rejects_bad_batch_unchanged(self, store):
+        seen = []
+        store.on_signal = lambda key, sig: seen.append(key)
+        rows = [store.add(k).row for k in ("b", "c")]
+        with pytest.raises(ValueError):
+            # the bad value is in the second wave, after "b" would have gated
+            store.apply_batch([rows[0], rows[1], rows[0]], [LOW, HIGH, {"trust": 1.5}])
+        with pytest.raises(TypeError):
+            store.apply_batch([rows[0], rows[1]], [LOW, {"trust_": 0.5}])
+        assert store.is_gated[rows].tolist() == [False, False]
+        assert store.trust[rows].tolist() == [1.0, 1.0]
+        assert seen == []
+
+    def test_fleet_queries(self, store):
+        store.add("b").update_state(**HIGH)
+        store.add("c").update_state(**LOW)
+        store.add("d").update_state(trust=0.0, intent=0.0, narrative=0.0, commitments=0.0)
+        assert store.gated() == ["c", "d"]
+        assert store.at_risk() == ["d", "c"]
+        assert store.healthy() == ["b"]
+        assert [k for k, _ in store.riskiest(2)] == ["d", "c"]
+        assert store.counts() == {"relationships": 3, "healthy": 1, "at_risk": 2, "gated": 2}
+
+
+class TestArrayBackendManager:
+    @pytest.fixture
+    def mgr(self):
+        return RLP0Manager(agent_id="agent-a", rupture_threshold=0.5, backend="array")
+
+    def test_update_and_state(self, mgr):
+        mgr.update("agent-b", trust=0.6, intent=0.7)
+        assert mgr.state("agent-b").intent == pytest.approx(0.7)
+        assert mgr.can_interact("agent-b") is True
+
+    def test_rupture_and_repair_callbacks(self, mgr):
+        events = []
+        mgr._on_rupture = lambda other_id, sig: events.append(("rupture", other_id))
+        mgr._on_repair = lambda other_id, sig: events.append(("repair", other_id))
+        mgr.update("agent-b", **LOW)
+        assert mgr.is_gated("agent-b") is True
+        assert mgr.acknowledge_repair("agent-b") is False
+        mgr.update("agent-b", **HIGH)
+        assert mgr.acknowledge_repair("agent-b") is True
+        assert events == [("rupture", "agent-b"), ("repair", "agent-b")]
+
+    def test_update_many_matches_object_backend(self, mgr):
+        batch = [("agent-b", LOW), ("agent-c", HIGH), ("agent-b", {"trust": 0.9})]
+        reference = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5)
+        assert mgr.update_many(batch) == reference.update_many(batch)
+
+    def test_fleet_view(self, mgr):
+        mgr.update("agent-b", **HIGH)
+        mgr.update("agent-c", **LOW)
+        assert mgr.gated() == ["agent-c"]
+        assert mgr.healthy() == ["agent-b"]
+        assert mgr.summary()["gated"] == 1
+        assert mgr.riskiest(1)[0][0] == "agent-c"
+
+    def test_persistence_round_trip(self, tmp_path):
+        db = str(tmp_path / "array.db")
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5, db_path=db, backend="array")
+        mgr.update_many([("agent-b", LOW), ("agent-c", HIGH)])
+        mgr.close()
+        restored = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5, db_path=db, backend="array")
+        assert restored.gated() == ["agent-b"]
+        assert restored.state("agent-c").trust == pytest.approx(0.9)
+        restored.close()
+
+    def test_set_threshold_vectorized(self, mgr):
+        events = []
+        mgr._on_rupture = lambda other_id, sig: events.append(other_id)
+        mid = {"trust": 0.6, "intent": 0.6, "narrative": 0.6, "commitments": 0.6}
+        mgr.update_many([("agent-b", mid), ("agent-c", HIGH)])
+        assert mgr.set_threshold(0.3) == ["agent-b"]
+        assert events == ["agent-b"]
+        assert mgr.is_gated("agent-b") is True
+        assert mgr.summary()["gated"] == 1
+
+    def test_rejects_max_resident(self):
+        with pytest.raises(ValueError):
+            RLP0Manager(agent_id="agent-a", backend="array", max_resident=10)
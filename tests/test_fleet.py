@@ -0,0 +1,98 @@
+"""
+Tests for FleetIndex — incrementally maintained fleet views.
+"""
+import pytest
+from rlp_0.fleet import FleetIndex
+
+
+@pytest.fixture
+def index():
+    idx = FleetIndex(threshold=0.5)
+    idx.set("b", 0.1, False)
+    idx.set("c", 0.8, True)
+    idx.set("d", 0.6, False)
+    idx.set("e", 0.3, True)   # gated but recovered below threshold
+    return idx
+
+
+class TestQueries:
+    def test_gated(self, index):
+        assert index.gated() == ["c", "e"]
+
+    def test_at_risk_highest_first(self, index):
+        assert index.at_risk() == ["c", "d"]
+
+    def test_at_risk_any_threshold(self, index):
+        assert index.at_risk(0.2) == ["c", "d", "e"]
+        assert index.count_at_risk(0.2) == 3
+
+    def test_healthy(self, index):
+        assert index.healthy() == ["b"]
+
+    def test_riskiest(self, index):
+        assert index.riskiest(2) == [("c", 0.8), ("d", 0.6)]
+        assert index.riskiest(0) == []
+        assert len(index.riskiest(10)) == 4
+
+    def test_counts(self, index):
+        assert index.counts() == {"relationships": 4, "healthy": 1, "at_risk": 2, "gated": 2}
+
+
+class TestMaintenance:
+    def test_update_moves_entry(self, index):
+        index.set("d", 0.2, False)
+        assert index.at_risk() == ["c"]
+        assert index.counts()["healthy"] == 2
+
+    def test_release_leaves_gated_set(self, index):
+        index.set("c", 0.2, False)
+        assert index.gated() == ["e"]
+        assert index.counts()["at_risk"] == 1
+
+    def test_discard(self, index):
+        index.discard("c")
+        index.discard("missing")
+        assert "c" not in index
+        assert index.counts() == {"relationships": 3, "healthy": 1, "at_risk": 1, "gated": 1}
+
+    def test_set_threshold_recounts(self, index):
+        index.set_threshold(0.25)
+        assert index.counts() == {"relationships": 4, "healthy": 1, "at_risk": 3, "gated": 2}
+
+    def test_counts_match_full_scan(self):
+        import random
+        rng = random.Random(7)
+        idx = FleetIndex(threshold=0.5)
+        truth = {}
+        for _ in range(500):
+            key = f"p{rng.randrange(60)}"
+            truth[key] = (round(rng.random(), 2), rng.random() < 0.3)
+            idx.set(key, *truth[key])
+        at_risk = sum(1 for r, _ in truth.values() if r >= 0.5)
+        healthy = sum(1 for r, g in truth.values() if r < 0.5 and not g)
+        counts = idx.counts()
+        assert counts["at_risk"] == at_risk
+        assert counts["healthy"] == healthy
+        assert sorted(idx.healthy()) == sorted(k for k, (r, g) in truth.items() if r < 0.5 and not g)
+
+    def test_bucketed_order_matches_sorted(self, monkeypatch):
+        import random
+        import rlp_0.fleet
+        monkeypatch.setattr(rlp_0.fleet, "_LOAD", 4)   # force many bucket splits
+        rng = random.Random(11)
+        idx = FleetIndex(threshold=0.5)
+        truth = {}
+        for step in range(3000):
+            key = f"p{rng.randrange(300)}"
+            if step % 7 == 0:
+                idx.discard(key)
+                truth.pop(key, None)
+            else:
+                truth[key] = (rng.random(), rng.random() < 0.2)
+                idx.set(key, *truth[key])
+        ordered = sorted(((r, k) for k, (r, _) in truth.items()), reverse=True)
+        assert idx.at_risk(0.3) == [k for r, k in ordered if r >= 0.3]
+        assert idx.count_at_risk(0.7) == sum(1 for r, _ in ordered if r >= 0.7)
+        assert idx.riskiest(25) == [(k, r) for r, k in ordered[:25]]
+        assert idx.healthy() == [k for r, k in reversed(ordered) if r < 0.5 and not truth[k][1]]
+        assert len(idx._by_risk._buckets) > 10
@@ -1,6 +1,9 @@
 """
 Tests for RLP0Manager — multi-relationship management.
 """
+import asyncio
+import time
+
 import pytest
 from rlp_0 import RLP0Manager, Signal, RUPTURE_DETECTED, REPAIR_COMPLETE
 
@@ -18,6 +21,12 @@ class TestBasicManagement:
         mgr.update("agent-b", trust=0.9)
         assert "agent-b" in mgr.all_pairs()
 
+    def test_storage_options_cannot_override_manager_keys(self):
+        with pytest.raises(ValueError, match="max_delay"):
+            RLP0Manager(agent_id="agent-a", storage_options={"max_delay": 0.01})
+        mgr = RLP0Manager(agent_id="agent-a", storage_options={"synchronous": "NORMAL"})
+        mgr.close()
+
     def test_update_returns_rlp_instance(self, mgr):
         from rlp_0 import RLP0
         rlp = mgr.update("agent-b", trust=0.8)
@@ -119,6 +128,14 @@ class TestFleetView:
         assert "agent-b" in healthy
         assert "agent-c" not in healthy
 
+    def test_riskiest(self, mgr):
+        mgr.update("agent-b", trust=0.9, intent=0.9, narrative=0.9, commitments=0.9)
+        mgr.update("agent-c", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        mgr.update("agent-d", trust=0.5, intent=0.5, narrative=0.5, commitments=0.5)
+        top = mgr.riskiest(2)
+        assert [aid for aid, _ in top] == ["agent-c", "agent-d"]
+        assert top[0][1] == pytest.approx(0.9)
+
     def test_summary_counts(self, mgr):
         mgr.update("agent-b", trust=0.9, intent=0.9, narrative=0.9, commitments=0.9)
         mgr.update("agent-c", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
@@ -140,6 +157,31 @@ class TestPersistence:
         assert len(history) >= 2
         mgr.close()
 
+    def test_iter_history_pages(self, tmp_path):
+        mgr = RLP0Manager(agent_id="agent-a", db_path=str(tmp_path / "test.db"))
+        for i in range(7):
+            mgr.update("agent-b", trust=0.9 - i / 100)
+        full = mgr.history("agent-b", limit=100)
+        first = list(mgr.iter_history("agent-b"))[:3]
+        rest = list(mgr.iter_history("agent-b", before_id=first[-1]["id"], batch=2))
+        assert [e["trust"] for e in first + rest] == [h["trust"] for h in full]
+        mgr.close()
+
+    def test_compact_history_keeps_gate_transitions(self, tmp_path):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5, db_path=str(tmp_path / "test.db"))
+        mgr.update("agent-b", trust=0.9)
+        mgr.update("agent-b", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        mgr.update("agent-b", trust=0.9, intent=0.9, narrative=0.9, commitments=0.9)
+        mgr.acknowledge_repair("agent-b")
+        assert mgr.compact_history(keep=0, bucket=1e9) > 0   # one bucket for the lot
+
+        kept = [h["change_type"] for h in mgr.history("agent-b")]
+        assert kept == ["repair_complete", "rupture_detected"]
+        (bucket,) = mgr.rollups("agent-b")
+        assert (bucket["ruptures"], bucket["repairs"]) == (1, 1)
+        assert bucket["entries"] == len(kept) + 4
+        mgr.close()
+
     def test_state_survives_across_instances(self, tmp_path):
         db = str(tmp_path / "persist.db")
 
@@ -151,3 +193,544 @@ class TestPersistence:
         state = mgr2.state("agent-b")
         assert state.trust == pytest.approx(0.6)
         mgr2.close()
+
+
+class TestUnitOfWork:
+    def test_rupture_update_written_once(self, mgr):
+        mgr.update("agent-b", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        types = [h["change_type"] for h in mgr.history("agent-b")]
+        assert sorted(types) == ["created", "rupture_detected", "update"]
+        assert all(h["is_gated"] == 1 for h in mgr.history("agent-b"))
+
+    def test_repair_written_once(self, mgr):
+        mgr.update("agent-b", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        mgr.update("agent-b", trust=0.9, intent=0.9, narrative=0.9, commitments=0.9)
+        mgr.acknowledge_repair("agent-b")
+        types = [h["change_type"] for h in mgr.history("agent-b")]
+        assert types.count("repair_complete") == 1
+
+    def test_writes_saved_counter(self, mgr):
+        assert mgr.writes_saved == 0
+        mgr.update("agent-b", trust=0.9)
+        # created + update coalesced into one write
+        assert mgr.writes_saved == 1
+        mgr.update("agent-b", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        # rupture_detected + update coalesced
+        assert mgr.writes_saved == 2
+
+    def test_read_of_known_pair_does_not_write(self, mgr):
+        mgr.update("agent-b", trust=0.9)
+        before = len(mgr.history("agent-b"))
+        mgr.state("agent-b")
+        mgr.can_interact("agent-b")
+        assert len(mgr.history("agent-b")) == before
+
+
+class TestLazyLoading:
+    @pytest.fixture
+    def db(self, tmp_path):
+        db = str(tmp_path / "lazy.db")
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5, db_path=db)
+        mgr.update("agent-b", trust=0.9, intent=0.9, narrative=0.9, commitments=0.9)
+        mgr.update("agent-c", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        mgr.close()
+        other = RLP0Manager(agent_id="agent-z", rupture_threshold=0.5, db_path=db)
+        other.update("agent-q", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        other.close()
+        return db
+
+    def test_constructor_loads_nothing(self, db):
+        mgr = RLP0Manager(agent_id="agent-a", db_path=db, lazy=True)
+        assert mgr._pairs == {}
+        mgr.close()
+
+    def test_pair_hydrates_on_first_access(self, db):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5, db_path=db, lazy=True)
+        assert mgr.state("agent-b").trust == pytest.approx(0.9)
+        assert list(mgr._pairs) == ["agent-b"]
+        mgr.close()
+
+    def test_hydrated_gated_pair_stays_gated(self, db):
+        events = []
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5, db_path=db, lazy=True,
+                          on_rupture=lambda other_id, sig: events.append(other_id))
+        assert mgr.can_interact("agent-c") is False
+        mgr.update("agent-c", trust=0.2)
+        assert events == []
+        mgr.close()
+
+    def test_fleet_queries_cover_non_resident_pairs(self, db):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5, db_path=db, lazy=True)
+        assert mgr.gated() == ["agent-c"]
+        assert mgr.at_risk() == ["agent-c"]
+        assert mgr.healthy() == ["agent-b"]
+        assert sorted(mgr.all_pairs()) == ["agent-b", "agent-c"]
+        s = mgr.summary()
+        assert (s["relationships"], s["gated"], s["healthy"]) == (2, 1, 1)
+        mgr.close()
+
+    def test_riskiest_from_storage(self, db):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5, db_path=db, lazy=True)
+        assert [aid for aid, _ in mgr.riskiest(1)] == ["agent-c"]
+        mgr.close()
+
+    def test_fleet_queries_see_new_updates(self, db):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5, db_path=db, lazy=True)
+        mgr.update("agent-d", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        assert sorted(mgr.gated()) == ["agent-c", "agent-d"]
+        mgr.close()
+
+
+class TestBoundedResidency:
+    @pytest.fixture
+    def lru(self, tmp_path):
+        m = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5,
+                        db_path=str(tmp_path / "lru.db"), max_resident=2)
+        yield m
+        m.close()
+
+    def test_resident_set_is_bounded(self, lru):
+        for other in ("agent-b", "agent-c", "agent-d"):
+            lru.update(other, trust=0.9)
+        assert len(lru._pairs) == 2
+        assert "agent-b" not in lru._pairs
+        assert lru.cache_stats()["evictions"] == 1
+
+    def test_least_recently_used_is_evicted(self, lru):
+        lru.update("agent-b", trust=0.9)
+        lru.update("agent-c", trust=0.9)
+        lru.state("agent-b")
+        lru.update("agent-d", trust=0.9)
+        assert sorted(lru._pairs) == ["agent-b", "agent-d"]
+
+    def test_evicted_pair_rehydrates(self, lru):
+        lru.update("agent-b", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        lru.update("agent-c", trust=0.9)
+        lru.update("agent-d", trust=0.9)
+        assert "agent-b" not in lru._pairs
+        assert lru.is_gated("agent-b") is True
+        assert lru.state("agent-b").trust == pytest.approx(0.1)
+
+    def test_fleet_queries_include_evicted(self, lru):
+        for other in ("agent-b", "agent-c", "agent-d"):
+            lru.update(other, trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        assert sorted(lru.gated()) == ["agent-b", "agent-c", "agent-d"]
+        assert lru.summary()["relationships"] == 3
+
+    def test_cache_stats(self, lru):
+        lru.update("agent-b", trust=0.9)
+        lru.update("agent-b", trust=0.8)
+        stats = lru.cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["resident"] == 1
+
+    def test_invalid_max_resident(self):
+        with pytest.raises(ValueError):
+            RLP0Manager(agent_id="agent-a", max_resident=0)
+
+
+class TestUpdateMany:
+    def test_results_per_item(self, mgr):
+        results = mgr.update_many([
+            ("agent-b", {"trust": 0.9}),
+            ("agent-c", {"trust": 0.1, "intent": 0.1, "narrative": 0.1, "commitments": 0.1}),
+        ])
+        assert [r.other_id for r in results] == ["agent-b", "agent-c"]
+        assert results[0].transition is None
+        assert results[1].is_gated is True
+        assert results[1].transition == "closed"
+        assert results[1].rupture_risk == pytest.approx(0.9)
+
+    def test_transition_only_on_crossing(self, mgr):
+        low = {"trust": 0.1, "intent": 0.1, "narrative": 0.1, "commitments": 0.1}
+        results = mgr.update_many([("agent-b", low), ("agent-b", {"trust": 0.2})])
+        assert [r.transition for r in results] == ["closed", None]
+
+    def test_signals_fire_in_order(self, mgr):
+        seen = []
+        mgr._on_rupture = lambda other_id, sig: seen.append(other_id)
+        low = {"trust": 0.1, "intent": 0.1, "narrative": 0.1, "commitments": 0.1}
+        mgr.update_many([("agent-d", low), ("agent-b", low), ("agent-c", low)])
+        assert seen == ["agent-d", "agent-b", "agent-c"]
+
+    def test_bad_item_rejects_whole_batch(self, mgr):
+        seen = []
+        mgr._on_rupture = lambda other_id, sig: seen.append(other_id)
+        low = {"trust": 0.1, "intent": 0.1, "narrative": 0.1, "commitments": 0.1}
+        with pytest.raises(ValueError):
+            mgr.update_many([("agent-b", low), ("agent-c", {"trust": 1.5})])
+        with pytest.raises(TypeError):
+            mgr.update_many([("agent-b", low), ("agent-c", {"trust_": 0.5})])
+        assert seen == []
+        assert mgr.all_pairs() == []
+
+    def test_batch_is_persisted(self, tmp_path):
+        db = str(tmp_path / "batch.db")
+        mgr = RLP0Manager(agent_id="agent-a", db_path=db)
+        mgr.update_many((f"peer-{i}", {"trust": 0.5}) for i in range(100))
+        mgr.close()
+        restored = RLP0Manager(agent_id="agent-a", db_path=db)
+        assert len(restored.all_pairs()) == 100
+        assert restored.state("peer-42").trust == pytest.approx(0.5)
+        restored.close()
+
+    def test_fleet_index_updated(self, mgr):
+        low = {"trust": 0.1, "intent": 0.1, "narrative": 0.1, "commitments": 0.1}
+        mgr.update_many([("agent-b", low), ("agent-c", {"trust": 0.9})])
+        assert mgr.gated() == ["agent-b"]
+        assert mgr.summary()["healthy"] == 1
+
+
+class TestSetThreshold:
+    MID = {"trust": 0.4, "intent": 0.4, "narrative": 0.4, "commitments": 0.4}   # risk 0.6
+
+    def test_lowering_gates_crossing_pairs(self):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.8)
+        events = []
+        mgr._on_rupture = lambda other_id, sig: events.append(other_id)
+        mgr.update("agent-b", **self.MID)
+        mgr.update("agent-c", trust=0.9)
+        assert mgr.set_threshold(0.5) == ["agent-b"]
+        assert events == ["agent-b"]
+        assert mgr.gated() == ["agent-b"]
+        assert mgr.summary()["at_risk"] == 1
+        assert mgr.summary()["threshold"] == 0.5
+        assert "rupture_detected" in [h["change_type"] for h in mgr.history("agent-b")]
+
+    def test_raising_does_not_release(self, mgr):
+        mgr.update("agent-b", **self.MID)
+        assert mgr.is_gated("agent-b")
+        assert mgr.set_threshold(0.9) == []
+        assert mgr.is_gated("agent-b")
+        assert mgr.acknowledge_repair("agent-b") is True
+
+    def test_new_threshold_applies_to_later_updates(self):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.8)
+        mgr.set_threshold(0.5)
+        mgr.update("agent-b", **self.MID)
+        assert mgr.is_gated("agent-b")
+
+    def test_lazy_gates_non_resident_pairs(self, tmp_path):
+        db = str(tmp_path / "t.db")
+        first = RLP0Manager(agent_id="agent-a", rupture_threshold=0.8, db_path=db)
+        first.update("agent-b", **self.MID)
+        first.close()
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.8, db_path=db, lazy=True)
+        assert mgr.set_threshold(0.5) == ["agent-b"]
+        assert mgr.gated() == ["agent-b"]
+        mgr.close()
+
+    def test_visits_only_crossing_pairs(self):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.8, release_threshold=0.7)
+        mgr.update("agent-b", **self.MID)
+        mgr.update("agent-c", trust=0.9)
+        assert mgr.set_threshold(0.5) == ["agent-b"]
+        assert mgr._pairs["agent-c"].rupture_threshold == 0.8    # not visited
+        # ...and picks up the new thresholds on its next use
+        mgr.update("agent-c", **self.MID)
+        assert mgr.is_gated("agent-c")
+        assert mgr._pairs["agent-c"].release_threshold == pytest.approx(0.4)
+
+    def test_rejects_out_of_range(self, mgr):
+        with pytest.raises(ValueError):
+            mgr.set_threshold(1.5)
+
+
+class TestSignalSpill:
+    def test_overflow_spills_to_storage(self):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5,
+                          signal_capacity=1, spill_signals=True)
+        for _ in range(2):
+            mgr.update("agent-b", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+            mgr.update("agent-b", trust=0.9, intent=0.9, narrative=0.9, commitments=0.9)
+            mgr.acknowledge_repair("agent-b")
+        rlp = mgr.update("agent-b")
+        assert len(rlp.signal_history) == 1
+        assert [s["signal_type"] for s in mgr.signal_log("agent-b")] == [
+            "rupture_detected", "repair_complete", "rupture_detected",
+        ]
+
+    def test_spills_share_the_call_transaction(self, monkeypatch):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5,
+                          signal_capacity=1, spill_signals=True)
+        monkeypatch.setattr(mgr._storage, "log_signal", None)   # no write of its own
+        writes = []
+        save_many = mgr._storage.save_many
+        monkeypatch.setattr(mgr._storage, "save_many",
+                            lambda items, signals=(): writes.append(list(signals)) or save_many(items, signals))
+        mgr.update("agent-b", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        mgr.update("agent-b", trust=0.9, intent=0.9, narrative=0.9, commitments=0.9)
+        mgr.acknowledge_repair("agent-b")
+        assert [len(w) for w in writes] == [0, 0, 1]
+        assert [s["signal_type"] for s in mgr.signal_log("agent-b")] == ["rupture_detected"]
+
+
+class TestWaitCanInteract:
+    def test_returns_immediately_when_open(self, mgr):
+        mgr.update("agent-b", trust=0.9)
+        assert asyncio.run(mgr.wait_can_interact("agent-b", timeout=0)) is True
+
+    def test_times_out_while_gated(self, mgr):
+        mgr.update("agent-b", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        assert asyncio.run(mgr.wait_can_interact("agent-b", timeout=0.01)) is False
+        assert mgr._gate_waiters == {}
+
+    def test_waiters_resume_on_repair(self, mgr):
+        mgr.update("agent-b", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        mgr.update("agent-c", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+
+        async def main():
+            waits = [asyncio.ensure_future(mgr.wait_can_interact("agent-b", timeout=5))
+                     for _ in range(2000)]
+            other = asyncio.ensure_future(mgr.wait_can_interact("agent-c", timeout=0.05))
+            await asyncio.sleep(0)
+            mgr.update("agent-b", trust=0.9, intent=0.9, narrative=0.9, commitments=0.9)
+            assert mgr.acknowledge_repair("agent-b") is True
+            return await asyncio.gather(*waits), await other
+
+        released, other = asyncio.run(main())
+        assert all(released)
+        assert other is False
+        assert mgr._gate_waiters == {}
+
+    def test_waiters_resume_after_eviction(self):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5, max_resident=1)
+        mgr.update("agent-b", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+
+        async def main():
+            wait = asyncio.ensure_future(mgr.wait_can_interact("agent-b", timeout=5))
+            await asyncio.sleep(0)
+            mgr.update("agent-c", trust=0.9)   # evicts agent-b
+            mgr.update("agent-b", trust=0.9, intent=0.9, narrative=0.9, commitments=0.9)
+            mgr.acknowledge_repair("agent-b")
+            return await wait
+
+        assert asyncio.run(main()) is True
+
+
+class TestThreadSafe:
+    def _hammer(self, mgr, threads=8, per_thread=150, pairs=40):
+        import random
+        import threading
+
+        errors = []
+
+        def worker(seed):
+            rng = random.Random(seed)
+            try:
+                for _ in range(per_thread):
+                    other_id = f"agent-{rng.randrange(pairs)}"
+                    value = rng.random()
+                    mgr.update(other_id, trust=value, intent=value)
+                    if rng.random() < 0.1:
+                        mgr.acknowledge_repair(other_id)
+            except Exception as exc:   # pragma: no cover - surfaced below
+                errors.append(exc)
+
+        workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        assert errors == []
+        return threads * per_thread
+
+    def test_concurrent_updates_stay_consistent(self):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5, thread_safe=True)
+        total = self._hammer(mgr)
+
+        pairs = mgr.all_pairs()
+        assert len(pairs) == 40
+        for other_id in pairs:
+            stored = mgr._storage.load("agent-a", other_id)
+            assert stored.rupture_risk == mgr.rupture_risk(other_id)
+            assert stored.is_gated == mgr.is_gated(other_id)
+        updates = sum(
+            1 for other_id in pairs for row in mgr.history(other_id, limit=10_000)
+            if row["change_type"] == "update"
+        )
+        assert updates == total
+        summary = mgr.summary()
+        assert summary["gated"] == sum(mgr.is_gated(p) for p in pairs)
+        assert summary["at_risk"] == sum(mgr.rupture_risk(p) >= 0.5 for p in pairs)
+        mgr.close()
+
+    def test_concurrent_updates_with_bounded_residency(self):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5,
+                          thread_safe=True, max_resident=8)
+        self._hammer(mgr)
+        assert len(mgr._pairs) <= 8 + 8   # at most one in-use pair per thread spared
+        for other_id in mgr.all_pairs():
+            stored = mgr._storage.load("agent-a", other_id)
+            assert stored.rupture_risk == mgr.rupture_risk(other_id)
+        mgr.close()
+
+    def test_array_backend_rejected(self):
+        with pytest.raises(ValueError):
+            RLP0Manager(agent_id="agent-a", backend="array", thread_safe=True)
+
+
+class TestTimeDecay:
+    DAY = 86400
+
+    def _age(self, mgr, other_id, seconds):
+        """Pretend other_id was last written ``seconds`` ago, in memory and storage."""
+        shift = int(seconds * 1e9)
+        rlp = mgr._pairs.get(other_id)
+        if rlp is not None:
+            rlp.state.updated_ns -= shift
+        storage = mgr._storage
+        stored = storage.load("agent-a", other_id)
+        keys = storage._keys(("agent-a", other_id))
+        storage._conn.execute(
+            "UPDATE relationships SET last_updated = ? WHERE from_id = ? AND to_id = ?",
+            (storage._stamp(stored.updated_ns - shift), keys["agent-a"], keys[other_id]),
+        )
+
+    @pytest.fixture
+    def decaying(self):
+        from rlp_0 import TimeDecay
+        return RLP0Manager(agent_id="agent-a", rupture_threshold=0.4,
+                           decay=TimeDecay(half_life=self.DAY, baseline=0.0))
+
+    def test_reads_decay_without_writing(self, decaying):
+        decaying.update("agent-b", trust=0.8, intent=0.9, narrative=0.9, commitments=0.6)
+        self._age(decaying, "agent-b", self.DAY)
+        writes = len(decaying.history("agent-b"))
+
+        state = decaying.state("agent-b")
+        assert state.trust == pytest.approx(0.4)
+        assert state.commitments == pytest.approx(0.3)
+        assert state.intent == 0.9
+        assert decaying.rupture_risk("agent-b") == pytest.approx((0.6 + 0.1 + 0.1 + 0.7) / 4)
+        assert len(decaying.history("agent-b")) == writes
+        assert decaying._storage.load("agent-a", "agent-b").trust == 0.8
+
+    def test_can_interact_sees_decayed_risk(self, decaying):
+        decaying.update("agent-b", trust=0.6, commitments=0.6)
+        assert decaying.can_interact("agent-b")
+        self._age(decaying, "agent-b", 3 * self.DAY)
+        assert not decaying.can_interact("agent-b")
+        assert not decaying.is_gated("agent-b")   # not written yet
+
+    def test_update_that_recovers_wakes_waiters(self, decaying):
+        decaying.update("agent-b", trust=0.6, commitments=0.6)
+        self._age(decaying, "agent-b", 3 * self.DAY)
+        assert not decaying.can_interact("agent-b")
+
+        async def main():
+            wait = asyncio.ensure_future(decaying.wait_can_interact("agent-b", timeout=5))
+            await asyncio.sleep(0)
+            decaying.update("agent-b", trust=0.9, commitments=0.9)   # no REPAIR_COMPLETE
+            return await wait
+
+        assert asyncio.run(main()) is True
+        assert decaying.can_interact("agent-b")
+
+    def test_next_write_materializes_decay(self, decaying):
+        decaying.update("agent-b", trust=0.8, commitments=0.8)
+        self._age(decaying, "agent-b", self.DAY)
+        decaying.update("agent-b", trust=0.9)
+        stored = decaying._storage.load("agent-a", "agent-b")
+        assert stored.trust == 0.9
+        assert stored.commitments == pytest.approx(0.4)
+
+    def test_sweep_closes_crossed_gates(self):
+        from rlp_0 import TimeDecay
+        ruptured = []
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.4, lazy=True,
+                          decay=TimeDecay(half_life=self.DAY, baseline=0.0),
+                          on_rupture=lambda other_id, signal: ruptured.append(other_id))
+        mgr.update("old-weak", trust=0.5, commitments=0.5)
+        mgr.update("old-strong", trust=1.0, commitments=1.0)
+        mgr.update("recent", trust=0.5, commitments=0.5)
+        self._age(mgr, "old-weak", 2 * self.DAY)
+        self._age(mgr, "old-strong", 2 * self.DAY)
+
+        assert mgr.sweep_decay(materialize=False) == ["old-weak"]
+        assert ruptured == []
+        assert mgr.sweep_decay() == ["old-weak"]
+        assert ruptured == ["old-weak"]
+        assert mgr.gated() == ["old-weak"]
+        assert mgr.history("old-weak")[0]["change_type"] in ("decay", "rupture_detected")
+        assert mgr.sweep_decay() == []
+
+    def test_sweep_uses_last_updated_index(self, decaying):
+        plan = decaying._storage._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM relationships"
+            " WHERE from_id = ? AND last_updated <= ? AND is_gated = 0",
+            ("agent-a", "2000-01-01"),
+        ).fetchall()
+        assert any("idx_relationships_quiet" in row[-1] for row in plan)
+
+    def test_sweep_requires_decay(self, mgr):
+        with pytest.raises(ValueError):
+            mgr.sweep_decay()
+
+    def test_sweeper_thread(self):
+        import threading
+        from rlp_0 import DecaySweeper, TimeDecay
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.4, thread_safe=True,
+                          decay=TimeDecay(half_life=self.DAY, baseline=0.0))
+        mgr.update("agent-b", trust=0.5, commitments=0.5)
+        self._age(mgr, "agent-b", 2 * self.DAY)
+        found = threading.Event()
+        sweeper = DecaySweeper(mgr, interval=0.01, on_crossed=lambda ids: found.set())
+        assert found.wait(5)
+        sweeper.stop()
+        assert mgr.is_gated("agent-b")
+        mgr.close()
+
+    def test_sweeper_requires_thread_safe(self, decaying):
+        from rlp_0 import DecaySweeper
+        with pytest.raises(ValueError):
+            DecaySweeper(decaying, interval=1)
+
+
+class TestHysteresis:
+    def test_flapping_pair_writes_less(self):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5,
+                          release_threshold=0.3, min_dwell=60)
+        for _ in range(10):
+            mgr.update("agent-b", trust=0.0, intent=0.0)       # risk 0.5
+            mgr.update("agent-b", trust=0.4, intent=0.4)       # risk 0.3
+            mgr.acknowledge_repair("agent-b")
+        kinds = [row["change_type"] for row in mgr.history("agent-b", limit=1000)]
+        assert kinds.count("rupture_detected") == 1
+        assert kinds.count("repair_complete") == 0
+        assert mgr.suppressed_transitions == 10
+
+    def test_dwell_never_leaves_gate_open_over_threshold(self):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5, min_dwell=0.05)
+        mgr.update("agent-b", trust=0.0, intent=0.0)             # risk 0.5: closes
+        mgr.update("agent-b", trust=1.0, intent=1.0)
+        time.sleep(0.06)
+        assert mgr.acknowledge_repair("agent-b") is True
+        mgr.update("agent-b", trust=0.0, intent=0.0)             # inside the dwell
+        assert mgr.can_interact("agent-b") is False
+        time.sleep(0.06)
+        assert mgr.can_interact("agent-b") is False
+
+    def test_counter_survives_eviction(self):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5,
+                          release_threshold=0.3, max_resident=1)
+        mgr.update("agent-b", trust=0.0, intent=0.0)
+        mgr.update("agent-b", trust=0.4, intent=0.4)
+        mgr.acknowledge_repair("agent-b")
+        mgr.update("agent-c", trust=0.9)
+        assert "agent-b" not in mgr._pairs
+        assert mgr.suppressed_transitions == 1
+
+    def test_set_threshold_keeps_band(self):
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.6, release_threshold=0.5)
+        mgr.update("agent-b", trust=0.9)
+        mgr.set_threshold(0.8)
+        mgr.update("agent-b", trust=0.9)     # skipped pairs catch up when next used
+        mgr.update("agent-c", trust=0.9)
+        assert mgr._pairs["agent-b"].release_threshold == pytest.approx(0.7)
+        assert mgr._pairs["agent-c"].release_threshold == pytest.approx(0.7)
+
+    def test_array_backend_rejected(self):
+        with pytest.raises(ValueError):
+            RLP0Manager(agent_id="agent-a", backend="array", min_dwell=1.0)
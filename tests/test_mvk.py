@@ -4,8 +4,13 @@ Tests for RLP-0 Minimum Viable Kernel
 Demonstrates the core rupture detection → gate → repair flow.
 """
 
+import asyncio
+import threading
+from datetime import datetime, timezone
+
 import pytest
 from rlp_0 import RLP0, RelationalState, Signal, RUPTURE_DETECTED
+from rlp_0.gates import Gate, GateEvent
 
 
 class TestRelationalState:
@@ -33,6 +38,17 @@ class TestRelationalState:
         assert state1.trust == 0.8  # Original unchanged
         assert state2.trust == 0.5  # New state has update
 
+    def test_state_is_slotted_with_ns_timestamp(self):
+        when = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        state = RelationalState(trust=0.8, last_updated=when)
+
+        assert not hasattr(state, "__dict__")
+        assert state.updated_ns == 1714566615123456000
+        assert state.last_updated == when
+        assert state.as_dict()["last_updated"] == when.isoformat()
+        assert state == RelationalState(trust=0.8, last_updated=when)
+        assert state != RelationalState(trust=0.7, last_updated=when)
+
 
 class TestRLP0Core:
     """Test the core RLP-0 operations."""
@@ -43,6 +59,33 @@ class TestRLP0Core:
         assert rlp.is_gated == False
         assert rlp.check_gate() == True
     
+    def test_state_snapshot_unchanged_by_later_updates(self):
+        rlp = RLP0()
+        rlp.update_state(trust=0.8)
+        snapshot = rlp.state
+        rlp.update_state(trust=0.3, intent=0.4)
+
+        assert snapshot.trust == 0.8
+        assert snapshot.intent == 1.0
+        assert rlp.state.trust == 0.3
+        assert rlp.state.intent == 0.4
+
+    def test_invalid_update_leaves_state_untouched(self):
+        rlp = RLP0()
+        rlp.update_state(trust=0.8)
+        with pytest.raises(ValueError):
+            rlp.update_state(trust=0.5, commitments=1.5)
+        assert rlp.state.trust == 0.8
+        assert rlp.state.commitments == 1.0
+
+    def test_timestamps_do_not_go_backwards(self):
+        rlp = RLP0()
+        stamps = []
+        for _ in range(100):
+            rlp.update_state(trust=0.9)
+            stamps.append(rlp.state.updated_ns)
+        assert stamps == sorted(stamps)
+
     def test_low_primitives_increase_rupture_risk(self):
         rlp = RLP0()
         rlp.update_state(trust=0.2)
@@ -96,6 +139,35 @@ class TestRLP0Core:
         assert rlp.is_gated == False
         assert rlp.check_gate() == True
     
+    def test_restored_gated_state_keeps_gate_closed(self):
+        signals = []
+        rlp = RLP0(rupture_threshold=0.5,
+                   state=RelationalState(trust=0.1, intent=0.1, narrative=0.1,
+                                         commitments=0.1, rupture_risk=0.9, is_gated=True))
+        rlp.subscribe(signals.append)
+        assert rlp.check_gate() == False
+        rlp.update_state(trust=0.2)
+        assert signals == []
+
+    def test_lowering_threshold_gates_and_signals(self):
+        signals = []
+        rlp = RLP0(rupture_threshold=0.8)
+        rlp.subscribe(signals.append)
+        rlp.update_state(trust=0.4, intent=0.4, narrative=0.4, commitments=0.4)
+        assert rlp.is_gated == False
+
+        assert rlp.set_threshold(0.5) == True
+        assert rlp.is_gated == True
+        assert rlp.rupture_threshold == 0.5
+        assert [s.signal_type for s in signals] == [RUPTURE_DETECTED]
+
+    def test_raising_threshold_keeps_gate_closed(self):
+        rlp = RLP0(rupture_threshold=0.5)
+        rlp.update_state(trust=0.4, intent=0.4, narrative=0.4, commitments=0.4)
+        assert rlp.set_threshold(0.9) == False
+        assert rlp.is_gated == True
+        assert rlp.acknowledge_repair() == True
+
     def test_acknowledge_repair_returns_false_if_not_gated(self):
         rlp = RLP0()
         
@@ -176,5 +248,119 @@ class TestRuptureFlow:
         assert status['gate_history'][1]['action'] == 'released'
 
 
+class TestGateWaiting:
+    def test_open_gate_does_not_wait(self):
+        gate = Gate()
+        assert gate.wait_until_open(timeout=0) is True
+        assert asyncio.run(gate.wait_open(timeout=0)) is True
+
+    def test_wait_times_out_while_closed(self):
+        gate = Gate()
+        gate.close("rupture", 0.8)
+        assert gate.wait_until_open(timeout=0.01) is False
+        assert asyncio.run(gate.wait_open(timeout=0.01)) is False
+        assert len(gate._waiters) == 0
+
+    def test_gate_events_are_slotted(self):
+        gate = Gate()
+        gate.close("rupture", 0.8)
+        event = gate.history[0]
+
+        assert isinstance(event, GateEvent)
+        assert not hasattr(event, "__dict__")
+        assert event.action == "closed"
+        assert event.timestamp == gate.closed_at
+        assert event.timestamp.tzinfo is not None
+
+    def test_blocking_wait_wakes_on_release(self):
+        gate = Gate()
+        gate.close("rupture", 0.8)
+        threading.Timer(0.01, gate.release, args=(0.2,)).start()
+        assert gate.wait_until_open(timeout=5) is True
+
+    def test_async_waiters_wake_on_release_from_other_thread(self):
+        gate = Gate()
+        gate.close("rupture", 0.8)
+
+        async def main():
+            waits = [asyncio.ensure_future(gate.wait_open(timeout=5)) for _ in range(1000)]
+            await asyncio.sleep(0)
+            threading.Timer(0.01, gate.release, args=(0.2,)).start()
+            return await asyncio.gather(*waits)
+
+        assert all(asyncio.run(main()))
+        assert len(gate._waiters) == 0
+
+
+class TestHysteresis:
+    def test_release_waits_for_release_threshold(self):
+        rlp = RLP0(rupture_threshold=0.6, release_threshold=0.4)
+        rlp.update_state(trust=0.0, intent=0.0, narrative=0.5)
+        assert rlp.is_gated
+
+        rlp.update_state(trust=0.6, intent=0.6, narrative=0.6, commitments=0.6)   # risk 0.4
+        assert rlp.acknowledge_repair() is False
+        assert rlp.is_gated
+        assert rlp.suppressed_transitions == 1
+
+        rlp.update_state(trust=0.8, intent=0.8, narrative=0.8, commitments=0.8)   # risk 0.2
+        assert rlp.acknowledge_repair() is True
+
+    def test_insufficient_repair_is_not_suppression(self):
+        rlp = RLP0(rupture_threshold=0.6, release_threshold=0.4)
+        rlp.update_state(trust=0.0, intent=0.0, narrative=0.0)
+        assert rlp.acknowledge_repair() is False
+        assert rlp.suppressed_transitions == 0
+
+    def test_min_dwell_holds_release(self):
+        rlp = RLP0(rupture_threshold=0.6, min_dwell=60)
+        rlp.update_state(trust=0.0, intent=0.0, narrative=0.0)
+        assert rlp.is_gated
+        rlp.update_state(trust=1.0, intent=1.0, narrative=1.0)
+        assert rlp.acknowledge_repair() is False   # closed less than 60s ago
+        assert rlp.suppressed_transitions == 1
+        rlp._gate.changed_ns -= 61 * 10**9
+        assert rlp.acknowledge_repair() is True
+
+    def test_close_is_never_delayed(self):
+        rlp = RLP0(rupture_threshold=0.6, min_dwell=60)
+        rlp.update_state(trust=0.0, intent=0.0, narrative=0.0)
+        rlp.update_state(trust=1.0, intent=1.0, narrative=1.0)
+        rlp._gate.changed_ns -= 61 * 10**9
+        assert rlp.acknowledge_repair() is True
+
+        # Released a moment ago, yet risk over the threshold closes at once
+        rlp.update_state(trust=0.0, intent=0.0, narrative=0.0)
+        assert rlp.is_gated
+        assert rlp.check_gate() is False
+
+    def test_flapping_limited_to_one_cycle_per_dwell(self):
+        rlp = RLP0(rupture_threshold=0.6, min_dwell=60)
+        for _ in range(5):
+            rlp.update_state(trust=0.0, intent=0.0, narrative=0.0)
+            rlp.update_state(trust=1.0, intent=1.0, narrative=1.0)
+            rlp.acknowledge_repair()
+        assert rlp.is_gated
+        assert [s.signal_type for s in rlp.signal_history] == [RUPTURE_DETECTED]
+        assert rlp.suppressed_transitions == 5
+
+    def test_restored_gate_has_no_dwell(self):
+        state = RelationalState(trust=0.0, intent=0.0, narrative=0.0, is_gated=True)
+        rlp = RLP0(rupture_threshold=0.6, min_dwell=60, state=state)
+        rlp.update_state(trust=1.0, intent=1.0, narrative=1.0)
+        assert rlp.acknowledge_repair() is True
+
+    def test_set_threshold_keeps_band(self):
+        rlp = RLP0(rupture_threshold=0.6, release_threshold=0.5)
+        rlp.set_threshold(0.8)
+        assert rlp.release_threshold == pytest.approx(0.7)
+
+    def test_invalid_release_threshold(self):
+        with pytest.raises(ValueError):
+            RLP0(rupture_threshold=0.5, release_threshold=0.6)
+        with pytest.raises(ValueError):
+            RLP0(min_dwell=-1)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,119 @@
+"""
+Tests for risk models — scalar and vectorized rupture-risk computation.
+"""
+import pytest
+from rlp_0 import (
+    RLP0, RLP0Manager, RiskModel, MeanRisk, WeightedRisk, MaxRisk, DecayedRisk,
+)
+
+PRIMS = (0.2, 0.9, 0.6, 1.0)   # trust, intent, narrative, commitments
+
+
+class TestScalarModels:
+    def test_mean_matches_mvk_formula(self):
+        t, i, n, c = PRIMS
+        assert MeanRisk()(*PRIMS) == ((1 - t) + (1 - i) + (1 - n) + (1 - c)) / 4
+
+    def test_weighted_normalizes_weights(self):
+        model = WeightedRisk(trust=3, intent=1, narrative=0, commitments=0)
+        assert model.weights == (0.75, 0.25, 0.0, 0.0)
+        assert model(*PRIMS) == pytest.approx(0.75 * 0.8 + 0.25 * 0.1)
+
+    def test_weighted_rejects_bad_weights(self):
+        with pytest.raises(ValueError):
+            WeightedRisk(trust=-1)
+        with pytest.raises(ValueError):
+            WeightedRisk(trust=0, intent=0, narrative=0, commitments=0)
+
+    def test_max_takes_weakest_primitive(self):
+        assert MaxRisk()(*PRIMS) == pytest.approx(0.8)
+
+    def test_decayed_moves_part_way(self):
+        model = DecayedRisk(alpha=0.25)
+        instant = MeanRisk()(*PRIMS)
+        assert model(*PRIMS, previous_risk=0.0) == pytest.approx(0.25 * instant)
+        assert model(*PRIMS, previous_risk=instant) == pytest.approx(instant)
+
+    def test_decayed_rejects_bad_alpha(self):
+        with pytest.raises(ValueError):
+            DecayedRisk(alpha=0.0)
+
+    def test_custom_model(self):
+        class TrustOnly(RiskModel):
+            def expression(self, vector):
+                return "1 - t"
+
+        assert TrustOnly()(*PRIMS) == pytest.approx(0.8)
+
+
+class TestVectorModels:
+    @pytest.mark.parametrize("model", [
+        MeanRisk(), WeightedRisk(trust=2, narrative=0.5), MaxRisk(),
+        DecayedRisk(alpha=0.3, base=MaxRisk()),
+    ])
+    def test_vector_matches_scalar(self, model):
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(0)
+        cols = [rng.random(100) for _ in range(5)]
+        expected = [model.scalar(*(float(col[k]) for col in cols)) for k in range(100)]
+        assert model.vector(*cols) == pytest.approx(expected)
+
+
+class TestModelSelection:
+    def test_rlp0_uses_model(self):
+        rlp = RLP0(rupture_threshold=0.6, risk_model=MaxRisk())
+        rlp.update_state(trust=0.3)   # mean risk would be 0.175
+        assert rlp.rupture_risk == pytest.approx(0.7)
+        assert rlp.is_gated
+
+    def test_decayed_rlp0_recovers_gradually(self):
+        rlp = RLP0(rupture_threshold=0.5, risk_model=DecayedRisk(alpha=0.5))
+        rlp.update_state(trust=0.0, intent=0.0, narrative=0.0, commitments=0.0)
+        assert rlp.rupture_risk == pytest.approx(0.5)
+        assert rlp.is_gated
+        rlp.update_state(trust=1.0, intent=1.0, narrative=1.0, commitments=1.0)
+        assert rlp.rupture_risk == pytest.approx(0.25)
+        assert rlp.acknowledge_repair() is True
+
+    def test_decayed_steps_only_on_writes(self):
+        rlp = RLP0(rupture_threshold=0.6, risk_model=DecayedRisk(alpha=0.5))
+        rlp.update_state(trust=0.0, intent=0.0, narrative=0.0, commitments=0.0)
+        rlp.update_state(trust=0.2, intent=0.2, narrative=0.2, commitments=0.2)
+        risk = rlp.rupture_risk
+        assert risk >= 0.6 and rlp.is_gated
+        assert rlp.compute_rupture_risk() == risk
+        assert rlp.acknowledge_repair() is False      # nothing recovered
+        assert rlp.rupture_risk == risk and rlp.is_gated
+
+    def test_decayed_array_store_steps_only_on_writes(self):
+        pytest.importorskip("numpy")
+        from rlp_0.arrays import ArrayStateStore
+        store = ArrayStateStore(threshold=0.6, risk_model=DecayedRisk(alpha=0.5))
+        pair = store.add("b")
+        pair.update_state(trust=0.0, intent=0.0, narrative=0.0, commitments=0.0)
+        pair.update_state(trust=0.2, intent=0.2, narrative=0.2, commitments=0.2)
+        risk = pair.rupture_risk
+        assert store.compute_rupture_risk().tolist() == [risk]
+        assert pair.acknowledge_repair() is False
+        assert pair.rupture_risk == risk and pair.is_gated
+
+    def test_manager_applies_model_to_every_pair(self):
+        mgr = RLP0Manager("agent-a", rupture_threshold=0.5,
+                          risk_model=WeightedRisk(trust=1, intent=0, narrative=0, commitments=0))
+        mgr.update("agent-b", trust=0.4)
+        mgr.update("agent-c", intent=0.0)
+        assert mgr.gated() == ["agent-b"]
+        assert mgr.rupture_risk("agent-c") == 0.0
+
+    def test_array_backend_matches_object_backend(self):
+        pytest.importorskip("numpy")
+        model = DecayedRisk(alpha=0.4, base=MaxRisk())
+        updates = [("agent-b", {"trust": 0.3}), ("agent-c", {"intent": 0.6}),
+                   ("agent-b", {"trust": 0.1}), ("agent-c", {"narrative": 0.2})]
+        objects = RLP0Manager("agent-a", risk_model=model)
+        arrays = RLP0Manager("agent-a", risk_model=model, backend="array")
+        expected = [r.rupture_risk for r in objects.update_many(updates)]
+        assert [r.rupture_risk for r in arrays.update_many(updates)] == pytest.approx(expected)
+        for other_id in ("agent-b", "agent-c"):
+            assert arrays.rupture_risk(other_id) == pytest.approx(objects.rupture_risk(other_id))
+            assert arrays.is_gated(other_id) == objects.is_gated(other_id)
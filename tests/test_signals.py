@@ -0,0 +1,169 @@
+"""
+Tests for SignalBus — delivery and bounded history.
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from rlp_0 import RLP0, Signal, RUPTURE_DETECTED
+from rlp_0.signals import SignalBus, SignalHistory
+
+
+def make_signal(risk: float) -> Signal:
+    return Signal(signal_type=RUPTURE_DETECTED, timestamp=datetime.now(timezone.utc),
+                  rupture_risk=risk)
+
+
+class TestSignal:
+    def test_slotted_with_ns_timestamp(self):
+        when = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+        signal = Signal(RUPTURE_DETECTED, when, 0.7, context="c")
+
+        assert not hasattr(signal, "__dict__")
+        assert signal.timestamp == when
+        assert signal.timestamp_ns == 1714564800 * 10**9
+        assert signal == Signal(RUPTURE_DETECTED, when, 0.7, context="c")
+        assert str(signal) == "[RUPTURE_DETECTED] risk=0.70 at 2024-05-01T12:00:00+00:00"
+
+    def test_now_stamps_current_time(self):
+        signal = Signal.now(RUPTURE_DETECTED, 0.7)
+        assert abs(signal.timestamp - datetime.now(timezone.utc)) < timedelta(seconds=1)
+
+
+class TestRingBuffer:
+    def test_unbounded_by_default(self):
+        bus = SignalBus()
+        for i in range(100):
+            bus.emit(make_signal(i / 100))
+        assert len(bus.history) == 100
+        assert bus.capacity is None
+
+    def test_capacity_keeps_newest(self):
+        bus = SignalBus(capacity=3)
+        for i in range(5):
+            bus.emit(make_signal(i / 10))
+        assert [s.rupture_risk for s in bus.history] == [0.2, 0.3, 0.4]
+        assert bus.emitted == 5
+
+    def test_overflow_spills_oldest(self):
+        spilled = []
+        bus = SignalBus(capacity=2, spill=spilled.append)
+        for i in range(4):
+            bus.emit(make_signal(i / 10))
+        assert [s.rupture_risk for s in spilled] == [0.0, 0.1]
+
+    def test_history_is_a_live_view(self):
+        bus = SignalBus()
+        view = bus.history
+        assert isinstance(view, SignalHistory)
+        bus.emit(make_signal(0.5))
+        assert len(view) == 1
+        assert view[-1].rupture_risk == 0.5
+        assert view[0:1] == [view[0]]
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            SignalBus(capacity=0)
+
+
+class TestRLP0SignalHistory:
+    def test_status_counts_spilled_signals(self):
+        rlp = RLP0(rupture_threshold=0.5, signal_capacity=1)
+        for _ in range(3):
+            rlp.update_state(trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+            rlp.update_state(trust=0.9, intent=0.9, narrative=0.9, commitments=0.9)
+            rlp.acknowledge_repair()
+        assert len(rlp.signal_history) == 1
+        assert rlp.status()["signal_count"] == 6
+
+
+class TestDispatcher:
+    @pytest.fixture
+    def dispatcher(self):
+        from rlp_0 import SignalDispatcher
+        d = SignalDispatcher(queue_size=8)
+        yield d
+        d.close(timeout=5)
+
+    def test_delivery_is_off_thread_and_ordered(self, dispatcher):
+        import threading
+        seen = []
+        bus = SignalBus(dispatcher=dispatcher)
+        bus.subscribe(lambda s: seen.append((threading.current_thread().name, s.rupture_risk)))
+        for i in range(5):
+            bus.emit(make_signal(i / 10))
+        dispatcher.flush()
+        assert [risk for _, risk in seen] == [0.0, 0.1, 0.2, 0.3, 0.4]
+        assert all(name.startswith("rlp0-dispatch") for name, _ in seen)
+
+    def test_failing_subscriber_is_isolated(self, dispatcher):
+        seen = []
+
+        def broken(signal):
+            raise RuntimeError("boom")
+
+        bus = SignalBus(dispatcher=dispatcher)
+        bus.subscribe(broken)
+        bus.subscribe(seen.append)
+        bus.emit(make_signal(0.5))
+        bus.emit(make_signal(0.6))
+        dispatcher.flush()
+        assert len(seen) == 2
+        assert dispatcher.stats()[broken]["failed"] == 2
+
+    def test_stalled_subscriber_drops_instead_of_blocking(self, dispatcher):
+        import threading
+        release = threading.Event()
+        seen = []
+
+        def stalled(signal):
+            release.wait(5)
+
+        bus = SignalBus(dispatcher=dispatcher)
+        bus.subscribe(stalled)
+        bus.subscribe(seen.append)
+        for i in range(20):
+            bus.emit(make_signal(i / 100))
+        release.set()
+        dispatcher.flush()
+        stats = dispatcher.stats()
+        # queue_size=8: at most 8 queued plus 1 in flight for the stalled subscriber
+        assert stats[stalled]["dropped"] >= 11
+        assert len(seen) + stats[seen.append]["dropped"] == 20
+
+    def test_dispatch_after_close_raises(self, dispatcher):
+        seen = []
+        dispatcher.dispatch(seen.append, 1)
+        dispatcher.close(timeout=5)
+        with pytest.raises(RuntimeError):
+            dispatcher.dispatch(seen.append, 2)     # existing channel
+        dispatcher.flush()                          # returns: nothing left queued
+        assert seen == [1]
+
+    def test_gate_closes_even_if_inline_subscriber_fails(self):
+        rlp = RLP0(rupture_threshold=0.5)
+
+        def broken(signal):
+            raise RuntimeError("boom")
+
+        rlp.subscribe(broken)
+        with pytest.raises(RuntimeError):
+            rlp.update_state(trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        assert rlp.is_gated
+
+    def test_manager_callbacks_dispatched(self, dispatcher):
+        import threading
+        from rlp_0 import RLP0Manager
+        blocker = threading.Event()
+        seen = []
+
+        def on_rupture(other_id, signal):
+            blocker.wait(5)
+            seen.append(other_id)
+
+        mgr = RLP0Manager(agent_id="agent-a", rupture_threshold=0.5,
+                          on_rupture=on_rupture, dispatcher=dispatcher)
+        mgr.update("agent-b", trust=0.1, intent=0.1, narrative=0.1, commitments=0.1)
+        # update() returned while the callback is still blocked
+        assert mgr.is_gated("agent-b") and seen == []
+        blocker.set()
+        dispatcher.flush()
+        assert seen == ["agent-b"]
@@ -2,7 +2,8 @@
 Tests for RLP-0 storage layer.
 """
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from rlp_0 import RelationalState, RelationalStorage
 
 
@@ -49,6 +50,28 @@ class TestSaveLoad:
         assert store.load("b", "a") is None
 
 
+class TestBulkLoad:
+    def test_load_many_returns_found_pairs(self, store, state):
+        store.save("a", "b", state)
+        store.save("a", "c", state.update(trust=0.3))
+        store.save("x", "b", state)
+        loaded = store.load_many("a", ["b", "c", "missing"])
+        assert sorted(loaded) == ["b", "c"]
+        assert loaded["c"].trust == pytest.approx(0.3)
+
+    def test_load_many_chunks_large_requests(self, store, state):
+        store.save_many(("a", str(i), state, ("update",)) for i in range(1200))
+        loaded = store.load_many("a", [str(i) for i in range(1200)])
+        assert len(loaded) == 1200
+
+    def test_iter_states_scoped_and_streamed(self, store, state):
+        store.save_many(("a", str(i), state, ("update",)) for i in range(25))
+        store.save("x", "y", state)
+        restored = dict(store.iter_states("a", batch=10))
+        assert len(restored) == 25
+        assert restored["7"].trust == pytest.approx(state.trust)
+
+
 class TestHistory:
     def test_history_empty_for_unknown_pair(self, store):
         assert store.history("x", "y") == []
@@ -77,6 +100,197 @@ class TestHistory:
         history = store.history("a", "b")
         assert history[0]["change_type"] == "rupture_detected"
 
+    def test_save_many_one_upsert_per_item(self, store, state):
+        store.save_many([
+            ("a", "b", state, ("rupture_detected", "update")),
+            ("a", "c", state.update(trust=0.2), ("update",)),
+        ])
+        assert store.load("a", "c").trust == pytest.approx(0.2)
+        types = [h["change_type"] for h in store.history("a", "b")]
+        assert sorted(types) == ["rupture_detected", "update"]
+        assert len(store.history("a", "c")) == 1
+
+
+class TestIterHistory:
+    def _fill(self, store, state, n=25):
+        for i in range(n):
+            store.save("a", "b", state.update(trust=i / 100))
+
+    def test_streams_history_newest_first(self, store, state):
+        self._fill(store, state)
+        entries = list(store.iter_history("a", "b", batch=4))
+        assert len(entries) == 25
+        assert [e["trust"] for e in entries] == [e["trust"] for e in store.history("a", "b", limit=25)]
+        assert entries[0]["trust"] == pytest.approx(0.24)
+        assert all(isinstance(e["id"], int) for e in entries)
+
+    def test_before_id_resumes_after_entry(self, store, state):
+        self._fill(store, state)
+        full = [e["id"] for e in store.iter_history("a", "b")]
+        pages, before = [], None
+        while True:
+            page = list(islice(store.iter_history("a", "b", before_id=before), 10))
+            pages.extend(e["id"] for e in page)
+            if len(page) < 10:
+                break
+            before = page[-1]["id"]
+        assert pages == full
+
+    def test_ties_on_recorded_at_ordered_by_id(self, store, state):
+        self._fill(store, state, n=6)
+        store._conn.execute("UPDATE state_history SET recorded_at = 1000")
+        store._conn.commit()
+        first = list(store.iter_history("a", "b"))[:3]
+        rest = list(store.iter_history("a", "b", before_id=first[-1]["id"]))
+        ids = [e["id"] for e in first + rest]
+        assert ids == sorted(ids, reverse=True) and len(ids) == 6
+
+    def test_since_and_until(self, store, state):
+        self._fill(store, state, n=10)
+        entries = list(store.iter_history("a", "b"))
+        cut = datetime.fromisoformat(entries[3]["recorded_at"])
+        store._conn.execute(
+            "UPDATE state_history SET recorded_at = recorded_at - 1000000 WHERE id < ?",
+            (entries[3]["id"],),
+        )
+        store._conn.commit()
+        assert [e["id"] for e in store.iter_history("a", "b", since=cut)] == \
+            [e["id"] for e in entries[:4]]
+        assert [e["id"] for e in store.iter_history("a", "b", until=cut)] == \
+            [e["id"] for e in entries[4:]]
+
+    def test_unknown_pair_and_entry(self, store, state):
+        assert list(store.iter_history("x", "y")) == []
+        store.save("a", "b", state)
+        store.save("a", "c", state)
+        with pytest.raises(ValueError):
+            list(store.iter_history("a", "b", before_id=10_000))
+        other = next(store.iter_history("a", "c"))["id"]
+        with pytest.raises(ValueError):   # an entry of another pair is not a cursor here
+            list(store.iter_history("a", "b", before_id=other))
+
+    def test_keyset_uses_pair_index(self, store):
+        plan = " ".join(
+            r[-1] for r in store._conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id, recorded_at, trust FROM state_history"
+                " WHERE from_id = 1 AND to_id = 2 AND recorded_at >= 0"
+                " AND (recorded_at, id) < (5, 7)"
+                " ORDER BY recorded_at DESC, id DESC"
+            )
+        )
+        assert "idx_history_pair" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+HOUR_US = 3600 * 10**6
+BASE_US = 400_000 * HOUR_US       # an hour boundary in 2015
+
+
+def _backdate(store, start_us, step_us=1):
+    """Re-time every history row: row k (in id order) at start_us + k * step_us."""
+    ids = [r[0] for r in store._conn.execute("SELECT id FROM state_history ORDER BY id")]
+    store._conn.executemany(
+        "UPDATE state_history SET recorded_at = ? WHERE id = ?",
+        [(start_us + k * step_us, i) for k, i in enumerate(ids)],
+    )
+    store._conn.commit()
+
+
+class TestRetention:
+    def test_rolls_old_history_into_buckets(self, store, state):
+        for trust in (0.2, 0.6, 0.4):
+            store.save("a", "b", state.update(trust=trust))
+        _backdate(store, BASE_US)
+        assert store.compact_history(keep=86400, bucket=3600) == 3
+        assert store.history("a", "b") == []
+
+        (bucket,) = store.rollups("a", "b")
+        assert bucket["entries"] == 3
+        assert bucket["trust_min"] == pytest.approx(0.2)
+        assert bucket["trust_max"] == pytest.approx(0.6)
+        assert bucket["trust_mean"] == pytest.approx(0.4)
+        assert bucket["trust_last"] == pytest.approx(0.4)
+        assert bucket["intent_mean"] == pytest.approx(0.7)
+        start = datetime.fromisoformat(bucket["bucket_start"])
+        assert datetime.fromisoformat(bucket["bucket_end"]) - start == timedelta(hours=1)
+        assert start == datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(hours=400_000)
+
+    def test_one_bucket_per_pair_and_interval(self, store, state):
+        for _ in range(4):
+            store.save("a", "b", state)
+        store.save("a", "c", state)
+        _backdate(store, BASE_US, step_us=HOUR_US // 2)   # b, b | b, b | c
+        store.compact_history(keep=0, bucket=3600)
+        assert [b["entries"] for b in store.rollups("a", "b")] == [2, 2]
+        assert [b["entries"] for b in store.rollups("a", "c")] == [1]
+        until = datetime.fromisoformat(store.rollups("a", "b")[1]["bucket_start"])
+        assert len(store.rollups("a", "b", until=until)) == 1
+        assert len(store.rollups("a", "b", since=until)) == 1
+
+    def test_keeps_transitions_and_recent_history(self, store, state):
+        store.save("a", "b", state)
+        store.save("a", "b", state.update(is_gated=True), change_type="rupture_detected")
+        store.save("a", "b", state, change_type="repair_complete")
+        _backdate(store, BASE_US)
+        store.save("a", "b", state.update(trust=0.1))    # inside the window
+
+        assert store.compact_history(keep=3600) == 1
+        assert [h["change_type"] for h in store.history("a", "b")] == [
+            "update", "repair_complete", "rupture_detected",
+        ]
+        (bucket,) = store.rollups("a", "b")
+        assert (bucket["entries"], bucket["ruptures"], bucket["repairs"]) == (3, 1, 1)
+        assert bucket["is_gated_last"] == 0
+        # Already rolled up: a second run does nothing
+        assert store.compact_history(keep=3600) == 0
+        assert store.rollups("a", "b")[0]["entries"] == 3
+
+    def test_incremental_chunks_match_one_pass(self, tmp_path, state):
+        results = []
+        for chunk, max_chunks in ((1000, None), (3, 1)):
+            s = RelationalStorage(str(tmp_path / f"{chunk}.db"))
+            for i in range(10):
+                s.save("a", "b", state.update(trust=i / 10))
+            _backdate(s, BASE_US)
+            deleted = 0
+            while True:
+                removed = s.compact_history(keep=0, chunk=chunk, max_chunks=max_chunks)
+                if not removed:
+                    break
+                deleted += removed
+            assert deleted == 10
+            results.append(s.rollups("a", "b"))
+            s.close()
+        one, many = results
+        assert len(one) == len(many) == 1
+        for column, value in one[0].items():
+            assert many[0][column] == (pytest.approx(value) if isinstance(value, float) else value)
+
+    def test_delete_removes_rollups(self, store, state):
+        store.save("a", "b", state)
+        _backdate(store, BASE_US)
+        store.compact_history(keep=0)
+        assert store.delete("a", "b") is True
+        assert store.rollups("a", "b") == []
+
+    def test_rejects_bad_arguments(self, store):
+        with pytest.raises(ValueError):
+            store.compact_history(keep=-1)
+        with pytest.raises(ValueError):
+            store.compact_history(keep=0, bucket=0)
+
+
+class TestSignalLog:
+    def test_log_signal_round_trips(self, store):
+        from rlp_0 import Signal, RUPTURE_DETECTED
+        signal = Signal(signal_type=RUPTURE_DETECTED, timestamp=datetime.now(timezone.utc),
+                        rupture_risk=0.7, context="test")
+        store.log_signal("a", "b", signal)
+        logged = store.signal_log("a", "b")
+        assert logged[0]["signal_type"] == "rupture_detected"
+        assert logged[0]["rupture_risk"] == pytest.approx(0.7)
+        assert store.signal_log("b", "a") == []
+
 
 class TestFleetQueries:
     def test_all_pairs_empty(self, store):
@@ -101,6 +315,51 @@ class TestFleetQueries:
         assert ("a", "c") in at_risk
         assert ("a", "b") not in at_risk
 
+    def test_fleet_queries_scoped_to_from_id(self, store):
+        store.save("a", "b", RelationalState(is_gated=True, rupture_risk=0.9))
+        store.save("x", "y", RelationalState(is_gated=True, rupture_risk=0.9))
+        store.save("a", "c", RelationalState(rupture_risk=0.1))
+        assert store.all_pairs(from_id="a") == [("a", "b"), ("a", "c")]
+        assert store.gated_pairs(from_id="a") == [("a", "b")]
+        assert store.at_risk_pairs(0.5, from_id="x") == [("x", "y")]
+        assert store.healthy_pairs(0.5, from_id="a") == [("a", "c")]
+
+    def test_at_risk_pairs_by_gate_state(self, store):
+        store.save("a", "b", RelationalState(rupture_risk=0.8, is_gated=True))
+        store.save("a", "c", RelationalState(rupture_risk=0.8))
+        assert store.at_risk_pairs(0.5, from_id="a", gated=False) == [("a", "c")]
+        assert store.at_risk_pairs(0.5, gated=True) == [("a", "b")]
+
+    def test_riskiest(self, store):
+        for to_id, risk in [("b", 0.2), ("c", 0.9), ("d", 0.5)]:
+            store.save("a", to_id, RelationalState(rupture_risk=risk))
+        store.save("x", "y", RelationalState(rupture_risk=0.95))
+        assert store.riskiest(2, from_id="a") == [("a", "c", 0.9), ("a", "d", 0.5)]
+        assert store.riskiest(1) == [("x", "y", 0.95)]
+
+    def test_riskiest_uses_index_not_sort(self, store, state):
+        store.save("a", "b", state)
+        for from_key in (store._key("a"), None):
+            where = f" WHERE r.from_id = {from_key}" if from_key else ""
+            plan = " ".join(
+                r[-1] for r in store._conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT f.name, t.name, r.rupture_risk"
+                    " FROM relationships r JOIN agents f ON f.id = r.from_id"
+                    f" JOIN agents t ON t.id = r.to_id{where}"
+                    " ORDER BY r.rupture_risk DESC LIMIT 5"
+                )
+            )
+            assert "TEMP B-TREE" not in plan
+
+    def test_fleet_counts(self, store):
+        store.save("a", "b", RelationalState(is_gated=True, rupture_risk=0.9))
+        store.save("a", "c", RelationalState(rupture_risk=0.1))
+        store.save("x", "y", RelationalState(rupture_risk=0.7))
+        assert store.fleet_counts(0.5, from_id="a") == {
+            "relationships": 2, "gated": 1, "at_risk": 1, "healthy": 1,
+        }
+        assert store.fleet_counts(0.5)["at_risk"] == 2
+
     def test_delete_removes_pair_and_history(self, store, state):
         store.save("a", "b", state)
         assert store.delete("a", "b") is True
@@ -117,3 +376,329 @@ class TestInMemory:
         state = RelationalState(trust=0.7)
         s.save("a", "b", state)
         assert s.load("a", "b").trust == pytest.approx(0.7)
+
+
+class TestGroupCommit:
+    @pytest.fixture
+    def gstore(self, tmp_path):
+        s = RelationalStorage(str(tmp_path / "group.db"), group_commit=True, max_delay=0.05)
+        yield s
+        s.close()
+
+    def test_save_returns_future_that_resolves(self, gstore, state):
+        fut = gstore.save("a", "b", state)
+        assert fut is not None
+        fut.result(timeout=5)
+        assert gstore.load("a", "b").trust == pytest.approx(0.8)
+
+    def test_per_call_mode_returns_none(self, store, state):
+        assert store.save("a", "b", state) is None
+
+    def test_reads_see_queued_saves(self, gstore, state):
+        for i in range(5):
+            gstore.save("a", "b", state.update(trust=i / 10))
+        assert gstore.load("a", "b").trust == pytest.approx(0.4)
+        assert len(gstore.history("a", "b")) == 5
+
+    def test_batch_commits_in_order(self, gstore, state):
+        futures = [gstore.save("a", "b", state.update(trust=i / 100)) for i in range(50)]
+        gstore.flush()
+        assert all(f.done() for f in futures)
+        assert gstore.history("a", "b", limit=1)[0]["trust"] == pytest.approx(0.49)
+
+    def test_max_batch_triggers_flush(self, tmp_path, state):
+        s = RelationalStorage(str(tmp_path / "b.db"), group_commit=True,
+                              max_batch=4, max_delay=60)
+        futures = [s.save("a", str(i), state) for i in range(4)]
+        futures[-1].result(timeout=5)
+        s.close()
+
+    def test_close_flushes_pending(self, tmp_path, state):
+        db = str(tmp_path / "close.db")
+        s = RelationalStorage(db, group_commit=True, max_delay=60)
+        s.save("a", "b", state)
+        s.close()
+        reopened = RelationalStorage(db)
+        assert reopened.load("a", "b") is not None
+        reopened.close()
+
+    def test_cancelled_future_does_not_stop_writer(self, tmp_path, state):
+        s = RelationalStorage(str(tmp_path / "cancel.db"), group_commit=True, max_delay=0.2)
+        first = s.save("a", "b", state)
+        second = s.save("a", "c", state)
+        assert first.cancel()
+        second.result(timeout=5)
+        s.save("a", "d", state).result(timeout=5)
+        assert [to for _, to in s.all_pairs("a")] == ["b", "c", "d"]
+        s.close()
+
+    def test_save_after_close_raises(self, tmp_path, state):
+        s = RelationalStorage(str(tmp_path / "c.db"), group_commit=True)
+        s.close()
+        with pytest.raises(RuntimeError):
+            s.save("a", "b", state)
+
+
+class TestPerformanceProfile:
+    @pytest.fixture
+    def tuned(self, tmp_path):
+        from rlp_0 import PERFORMANCE_PROFILE
+        s = RelationalStorage(str(tmp_path / "tuned.db"), **PERFORMANCE_PROFILE)
+        yield s
+        s.close()
+
+    def test_pragmas_applied(self, tuned):
+        assert tuned.journal_mode == "wal"
+        assert tuned._conn.execute("PRAGMA synchronous").fetchone()[0] == 1   # NORMAL
+        assert len(tuned._reader_conns) == 4
+
+    def test_reads_see_committed_writes(self, tuned, state):
+        tuned.save("a", "b", state)
+        assert tuned.load("a", "b") is not None
+        assert tuned.all_pairs() == [("a", "b")]
+        assert [to for to, _ in tuned.iter_states("a")] == ["b"]
+
+    def test_reader_connections_are_read_only(self, tuned):
+        import sqlite3
+        with pytest.raises(sqlite3.OperationalError):
+            tuned._reader_conns[0].execute("DELETE FROM relationships")
+
+    def test_nested_read_while_iterating(self, tmp_path, state):
+        s = RelationalStorage(str(tmp_path / "one.db"), readers=1)
+        for to in ("b", "c"):
+            s.save("a", to, state)
+        seen = [(to, s.load("a", to) is not None) for to, _ in s.iter_states("a")]
+        assert seen == [("b", True), ("c", True)]
+        s.close()
+
+    def test_group_commit_reads_after_flush(self, tmp_path, state):
+        s = RelationalStorage(str(tmp_path / "gc.db"), group_commit=True,
+                              max_delay=60, wal=True, readers=2)
+        s.save("a", "b", state)
+        assert s.load("a", "b") is not None
+        s.close()
+
+    def test_memory_database_reads_on_writer(self, state):
+        s = RelationalStorage(":memory:", wal=True, readers=4)
+        assert s._readers is None
+        s.save("a", "b", state)
+        assert s.load("a", "b") is not None
+        s.close()
+
+    def test_concurrent_readers_during_writes(self, tuned, state):
+        import threading
+        errors = []
+
+        def reader():
+            try:
+                for _ in range(200):
+                    tuned.gated_pairs("a")
+                    tuned.history("a", "b", limit=5)
+            except Exception as exc:   # pragma: no cover - surfaced below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for _ in range(200):
+            tuned.save("a", "b", state)
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert len(tuned.history("a", "b", limit=1000)) == 200
+
+    def test_invalid_synchronous(self, tmp_path):
+        with pytest.raises(ValueError):
+            RelationalStorage(str(tmp_path / "x.db"), synchronous="sometimes")
+
+
+# Schema written by the original release: no agents table, no signal_log
+_LEGACY_SCHEMA = """
+CREATE TABLE relationships (
+    from_id TEXT NOT NULL, to_id TEXT NOT NULL,
+    trust REAL NOT NULL DEFAULT 1.0, intent REAL NOT NULL DEFAULT 1.0,
+    narrative REAL NOT NULL DEFAULT 1.0, commitments REAL NOT NULL DEFAULT 1.0,
+    rupture_risk REAL NOT NULL DEFAULT 0.0, is_gated INTEGER NOT NULL DEFAULT 0,
+    last_updated TEXT NOT NULL,
+    PRIMARY KEY (from_id, to_id)
+);
+CREATE TABLE state_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, from_id TEXT NOT NULL, to_id TEXT NOT NULL,
+    recorded_at TEXT NOT NULL, trust REAL NOT NULL, intent REAL NOT NULL,
+    narrative REAL NOT NULL, commitments REAL NOT NULL, rupture_risk REAL NOT NULL,
+    is_gated INTEGER NOT NULL, change_type TEXT NOT NULL DEFAULT 'update', notes TEXT
+);
+CREATE INDEX idx_history_pair ON state_history (from_id, to_id, recorded_at);
+"""
+
+# Added by later version 0 releases, before agent ids were interned
+_LEGACY_SIGNAL_LOG = """
+CREATE TABLE signal_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, from_id TEXT NOT NULL, to_id TEXT NOT NULL,
+    signal_type TEXT NOT NULL, emitted_at TEXT NOT NULL, rupture_risk REAL NOT NULL,
+    context TEXT
+);
+CREATE INDEX idx_signal_log_pair ON signal_log (from_id, to_id, emitted_at);
+CREATE INDEX idx_relationships_risk ON relationships (from_id, rupture_risk DESC);
+"""
+
+
+def _legacy_db(tmp_path, when="2025-01-01T00:00:00+00:00", signals=False) -> str:
+    """
+    A version 0 database (TEXT ids, ISO timestamps) holding pair a -> b;
+    with ``signals``, also a signal_log holding one signal for it.
+    """
+    import sqlite3
+    db = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db)
+    conn.executescript(_LEGACY_SCHEMA)
+    conn.execute("INSERT INTO relationships VALUES ('a', 'b', 0.5, 0.5, 0.5, 0.5, 0.5, 1, ?)", (when,))
+    conn.executemany(
+        "INSERT INTO state_history (from_id, to_id, recorded_at, trust, intent, narrative,"
+        " commitments, rupture_risk, is_gated, change_type) VALUES ('a', 'b', ?, 1, 1, 1, 1, 0, 0, ?)",
+        [(when, "created"), (when, "update")],
+    )
+    if signals:
+        conn.executescript(_LEGACY_SIGNAL_LOG)
+        conn.execute("INSERT INTO signal_log (from_id, to_id, signal_type, emitted_at, rupture_risk)"
+                     " VALUES ('a', 'b', 'rupture_detected', ?, 0.5)", (when,))
+    conn.commit()
+    conn.close()
+    return db
+
+
+class TestAgentInterning:
+    def test_ids_stored_once(self, store, state):
+        for _ in range(3):
+            store.save("agent-a", "agent-b", state)
+        store.save("agent-a", "agent-c", state)
+        conn = store._conn
+        assert conn.execute("SELECT COUNT(*) FROM agents").fetchone()[0] == 3
+        assert conn.execute("SELECT typeof(from_id) FROM state_history").fetchone()[0] == "integer"
+        assert store.all_pairs() == [("agent-a", "agent-b"), ("agent-a", "agent-c")]
+
+    def test_reopen_resolves_names(self, tmp_path, state):
+        db = str(tmp_path / "intern.db")
+        s = RelationalStorage(db)
+        s.save("agent-a", "agent-b", state)
+        s.close()
+        reopened = RelationalStorage(db)
+        assert reopened._agent_keys == {}
+        assert [to for to, _ in reopened.iter_states("agent-a")] == ["agent-b"]
+        assert reopened.load("agent-a", "agent-b") == reopened.load_many("agent-a", ["agent-b"])["agent-b"]
+        reopened.close()
+
+    def test_unknown_agent_reads_nothing(self, store):
+        assert store.load("nobody", "ghost") is None
+        assert store.load_many("nobody", ["ghost"]) == {}
+        assert store.history("nobody", "ghost") == []
+        assert store.gated_pairs("nobody") == []
+        assert store.fleet_counts(0.5, from_id="nobody")["relationships"] == 0
+
+    def test_failed_write_forgets_interned_keys(self, store, state):
+        store._conn.execute("CREATE TRIGGER fail BEFORE INSERT ON state_history "
+                            "BEGIN SELECT RAISE(ABORT, 'boom'); END")
+        with pytest.raises(Exception):
+            store.save("agent-a", "agent-b", state)
+        assert store._agent_keys == {}
+        store._conn.execute("DROP TRIGGER fail")
+        store.save("agent-a", "agent-b", state)
+        assert store.load("agent-a", "agent-b") is not None
+
+    def test_migrates_text_id_database(self, tmp_path):
+        db = _legacy_db(tmp_path)
+        s = RelationalStorage(db)
+        assert s._conn.execute("PRAGMA user_version").fetchone()[0] == 2
+        state = s.load("a", "b")
+        assert state.is_gated and state.trust == 0.5
+        assert [h["change_type"] for h in s.history("a", "b")] == ["update", "created"]
+        assert s.signal_log("a", "b") == []
+        s.save("a", "c", state)
+        assert s.all_pairs("a") == [("a", "b"), ("a", "c")]
+        tables = {r[0] for r in s._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert not any(name.startswith("_v0_") for name in tables)
+        s.close()
+
+    def test_migrates_signal_log(self, tmp_path):
+        s = RelationalStorage(_legacy_db(tmp_path, signals=True))
+        assert s.schema_version == 2
+        assert s.signal_log("a", "b")[0]["signal_type"] == "rupture_detected"
+        s.close()
+
+    def test_manager_opens_original_database(self, tmp_path):
+        from rlp_0 import RLP0Manager
+        mgr = RLP0Manager("a", db_path=_legacy_db(tmp_path))
+        assert mgr.can_interact("b") is False
+        mgr.close()
+
+    def test_newer_schema_rejected(self, tmp_path):
+        import sqlite3
+        db = str(tmp_path / "future.db")
+        conn = sqlite3.connect(db)
+        conn.execute("PRAGMA user_version = 99")
+        conn.close()
+        with pytest.raises(RuntimeError):
+            RelationalStorage(db)
+
+
+class TestIntegerTimestamps:
+    def test_new_database_stores_microseconds(self, store, state):
+        store.save("a", "b", state)
+        conn = store._conn
+        assert store.schema_version == 3
+        assert conn.execute("SELECT typeof(last_updated) FROM relationships").fetchone()[0] == "integer"
+        assert conn.execute("SELECT typeof(recorded_at) FROM state_history").fetchone()[0] == "integer"
+        loaded = store.load("a", "b")
+        assert loaded.updated_ns % 1000 == 0
+        assert loaded.last_updated.tzinfo is not None
+        assert datetime.fromisoformat(store.history("a", "b")[0]["recorded_at"]) == loaded.last_updated
+
+    def test_signal_timestamp_round_trips(self, store):
+        from rlp_0 import Signal, RUPTURE_DETECTED
+        signal = Signal.now(RUPTURE_DETECTED, 0.7)
+        store.log_signal("a", "b", signal)
+        assert store.signal_log("a", "b")[0]["emitted_at"] == signal.timestamp.isoformat()
+
+    def test_stored_times_follow_the_system_clock(self, store, monkeypatch):
+        import time
+        from rlp_0 import clock
+        # The monotonic clock has drifted an hour behind wall time
+        monkeypatch.setattr(clock, "_OFFSET_NS", clock._OFFSET_NS - 3600 * 10**9)
+        before = time.time_ns() // 1000 * 1000
+        store.save("a", "b", RelationalState(trust=0.8))
+        assert store.load("a", "b").updated_ns >= before
+        assert datetime.fromisoformat(store.history("a", "b")[0]["recorded_at"]) >= clock.to_datetime(before)
+        assert store.compact_history(keep=60) == 0     # a fresh row is not an hour old
+
+    def test_iso_database_stays_readable(self, tmp_path, state):
+        s = RelationalStorage(_legacy_db(tmp_path))
+        assert s.schema_version == 2
+        old = s.load("a", "b")
+        assert old.last_updated == datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        s.save("a", "b", state)      # written as ISO text, like the rows around it
+        conn = s._conn
+        assert {r[0] for r in conn.execute("SELECT typeof(recorded_at) FROM state_history")} == {"text"}
+        assert s.history("a", "b")[0]["change_type"] == "update"
+        assert s.load("a", "b").last_updated > old.last_updated
+        s.close()
+
+    def test_upgrade_timestamps(self, tmp_path, state):
+        db = _legacy_db(tmp_path, when="2025-01-01T00:00:00.123456+00:00")
+        s = RelationalStorage(db)
+        s.save("a", "c", state)
+        before = {to: st.updated_ns for to, st in s.iter_states("a")}
+        history = s.history("a", "b")
+
+        s.upgrade_timestamps()
+        assert s.schema_version == 3
+        assert {to: st.updated_ns for to, st in s.iter_states("a")} == before
+        assert s.history("a", "b") == history
+        assert s._conn.execute("SELECT typeof(recorded_at) FROM state_history").fetchone()[0] == "integer"
+        s.save("a", "b", state)
+        assert s.history("a", "b")[0]["recorded_at"] > history[0]["recorded_at"]
+        s.close()
+
+        reopened = RelationalStorage(db)
+        assert reopened.schema_version == 3
+        reopened.close()